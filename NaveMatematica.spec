@@ -1,5 +1,12 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
+# Sonidos sintetizados pre-generados (python -m systems.sound_manager).
+# Se generan en cada build (build.sh / build.bat) y no se versionan
+sound_cache = [('cache_sonidos', 'cache_sonidos')] if os.path.isdir('cache_sonidos') else []
+# Tabla precompilada del modelo de tiempo (python -m systems.tabla_tiempo).
+# Se genera en cada build (build.sh / build.bat) y no se versiona
+tabla_tiempo = [('tabla_tiempo.npz', '.')] if os.path.isfile('tabla_tiempo.npz') else []
 
 a = Analysis(
     ['main.py'],
@@ -15,8 +22,9 @@ a = Analysis(
         ('menu_right.png', '.'),
         ('mejor_modelo_tiempo.pkl', '.'),
         ('1000registros.json', '.'),
-    ],
-    hiddenimports=['numpy', 'scipy', 'scipy.io.wavfile', 'scipy.signal'],
+    ] + sound_cache + tabla_tiempo,
+    # Importaciones diferidas (utils/lazy_import.py): PyInstaller no las detecta
+    hiddenimports=['numpy', 'scipy', 'scipy.io.wavfile', 'scipy.signal', 'joblib', 'websockets'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
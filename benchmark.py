@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark headless de Operación Relámpago
+
+Construye un `Game` con los drivers "dummy" de SDL (sin ventana ni audio) y
+recorre cada estado del juego durante N frames con semilla fija y entrada
+simulada, midiendo por separado `handle_input`, `update` y `draw`.
+Imprime (o guarda) un JSON con p50/p95/p99 del tiempo de frame por estado;
+"present" es la parte de `draw` que presenta el frame (flip o dirty rects).
+
+Uso:
+    python benchmark.py                          # todos los estados, 300 frames
+    python benchmark.py --frames 600 --states menu,playing
+    python benchmark.py --out base.json          # guardar como referencia
+    python benchmark.py --compare base.json      # falla si el p95 empeora >20%
+    python benchmark.py --dirty-rects --compare base.json   # dirty rects vs flip()
+
+Las respuestas simuladas se registran en un directorio temporal
+(NAVE_DATA_DIR), nunca en el resultados.json de los jugadores.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Los drivers deben fijarse antes de importar pygame
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+if script_dir not in sys.path:
+    sys.path.insert(0, script_dir)
+
+import pygame
+
+from config import KEY_TO_OPERATION
+from systems.profiler import percentile
+from systems.sound_manager import SYNTH_PRIORITY
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+STATES = ["menu", "level_intro", "playing", "paused", "pre_victory", "victory", "lose"]
+PHASES = ["handle_input", "update", "draw", "present", "frame"]
+# Espera máxima (s) a la síntesis de sonidos pendiente antes de limpiar
+SYNTH_WAIT_TIMEOUT = 60.0
+
+# Operación -> tecla (inverso de KEY_TO_OPERATION)
+OPERATION_KEYS = {operation: key for key, operation in KEY_TO_OPERATION.items()}
+
+
+# ============================================================================
+# PREPARACIÓN DE CADA ESTADO
+# ============================================================================
+
+def _start_level(game):
+    """Nivel 1 en modo normal, ya en juego"""
+    game._activate_menu_button(0)
+    game.game_state = "playing"
+
+
+def setup_menu(game):
+    game.game_state = "menu"
+
+
+def setup_level_intro(game):
+    game._activate_menu_button(0)
+
+
+def setup_playing(game):
+    _start_level(game)
+
+
+def setup_paused(game):
+    _start_level(game)
+    game.game_state = "paused"
+    game.paused = True
+
+
+def setup_pre_victory(game):
+    import game as game_module
+    _start_level(game)
+    game.game_state = "pre_victory"
+    game.victory_celebration = game_module.VictoryCelebration()
+
+
+def setup_victory(game):
+    import game as game_module
+    _start_level(game)
+    game.victory_celebration = game_module.VictoryCelebration()
+    game.game_state = "victory"
+
+
+def setup_lose(game):
+    _start_level(game)
+    game.game_state = "lose"
+
+
+SETUPS = {
+    "menu": setup_menu,
+    "level_intro": setup_level_intro,
+    "playing": setup_playing,
+    "paused": setup_paused,
+    "pre_victory": setup_pre_victory,
+    "victory": setup_victory,
+    "lose": setup_lose,
+}
+
+
+# ============================================================================
+# ENTRADA SIMULADA
+# ============================================================================
+
+def scripted_events(game, state, frame, rng):
+    """
+    Eventos del frame: en juego se responde cada ~40 frames (85% aciertos),
+    lo que dispara disparos, explosiones y combos como una partida real.
+    """
+    if state != "playing" or game.answer_cooldown > 0 or frame % 40 != 0:
+        return []
+    operation = game.math_problem.operation
+    if rng.random() > 0.85:
+        operation = rng.choice([op for op in OPERATION_KEYS if op != operation])
+    key = OPERATION_KEYS[operation]
+    return [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)]
+
+
+# ============================================================================
+# MEDICIÓN
+# ============================================================================
+
+def summarize(samples):
+    """Resumen en milisegundos de una lista de tiempos en segundos"""
+    values = sorted(s * 1000.0 for s in samples)
+    return {
+        "p50": round(percentile(values, 50), 3),
+        "p95": round(percentile(values, 95), 3),
+        "p99": round(percentile(values, 99), 3),
+        "mean": round(sum(values) / len(values), 3) if values else 0.0,
+        "max": round(values[-1], 3) if values else 0.0,
+    }
+
+
+def seed_all(seed):
+    random.seed(seed)
+    if HAS_NUMPY:
+        np.random.seed(seed)
+
+
+def run_state(game, state, frames, warmup, seed):
+    """Ejecuta un estado y devuelve sus estadísticas"""
+    seed_all(seed)
+    rng = random.Random(seed)
+    setup = SETUPS[state]
+    setup(game)
+
+    timings = {phase: [] for phase in PHASES}
+    reentries = 0
+    clock = time.perf_counter
+
+    # Medir la presentación dentro de draw() (flip completo o dirty rects)
+    renderer = game.renderer
+    present = renderer.present
+    presented = []
+
+    def timed_present(screen):
+        start = clock()
+        present(screen)
+        presented.append(clock() - start)
+
+    renderer.present = timed_present
+
+    for frame in range(warmup + frames):
+        # Si el estado terminó por sí solo (victoria, derrota...), volver a él
+        if game.game_state != state:
+            setup(game)
+            reentries += 1
+
+        events = scripted_events(game, state, frame, rng)
+        keys = pygame.key.get_pressed()
+        pygame.event.pump()
+
+        t0 = clock()
+        game.handle_input(keys, events)
+        t1 = clock()
+        game.update()
+        t2 = clock()
+        game.draw()
+        t3 = clock()
+
+        if frame >= warmup:
+            timings["handle_input"].append(t1 - t0)
+            timings["update"].append(t2 - t1)
+            timings["draw"].append(t3 - t2)
+            timings["present"].append(sum(presented))
+            timings["frame"].append(t3 - t0)
+        presented.clear()
+
+    del renderer.present
+    result = {phase: summarize(timings[phase]) for phase in PHASES}
+    result["frames"] = frames
+    result["reentries"] = reentries
+    return result
+
+
+def compare(report, baseline_path, threshold):
+    """Compara el p95 de frame con una ejecución anterior; devuelve regresiones"""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for state, stats in report["states"].items():
+        base = baseline.get("states", {}).get(state)
+        if not base:
+            continue
+        before = base["frame"]["p95"]
+        after = stats["frame"]["p95"]
+        if before > 0 and after > before * threshold:
+            regressions.append((state, before, after))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless de tiempos de frame")
+    parser.add_argument("--frames", type=int, default=300, help="frames medidos por estado")
+    parser.add_argument("--warmup", type=int, default=30, help="frames descartados al inicio")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--states", default=",".join(STATES),
+                        help="estados separados por comas (%s)" % ",".join(STATES))
+    parser.add_argument("--out", help="guardar el JSON en este archivo")
+    parser.add_argument("--compare", help="JSON de referencia para detectar regresiones")
+    parser.add_argument("--threshold", type=float, default=1.2,
+                        help="factor de p95 a partir del cual hay regresión (1.2 = +20%%)")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="presentar con DirtyRectRenderer en lugar de flip()")
+    args = parser.parse_args(argv)
+
+    states = [s.strip() for s in args.states.split(",") if s.strip()]
+    unknown = [s for s in states if s not in SETUPS]
+    if unknown:
+        parser.error("estados desconocidos: %s" % ", ".join(unknown))
+
+    # Respuestas simuladas fuera del resultados.json real
+    data_dir = tempfile.mkdtemp(prefix="nave_bench_")
+    os.environ["NAVE_DATA_DIR"] = data_dir
+
+    pygame.init()
+    pygame.mixer.init()
+    from game import Game
+
+    seed_all(args.seed)
+    game = Game()
+    if args.dirty_rects:
+        from systems import DirtyRectRenderer
+        game.renderer = DirtyRectRenderer(enabled=True)
+
+    report = {
+        "meta": {
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": HAS_NUMPY,
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            "dirty_rects": game.renderer.enabled,
+        },
+        "states": {},
+    }
+
+    for state in states:
+        stats = run_state(game, state, args.frames, args.warmup, args.seed)
+        report["states"][state] = stats
+        print("✓ %-12s p50 %7.2f ms  p95 %7.2f ms  p99 %7.2f ms  (present p50 %.2f ms)"
+              % (state, stats["frame"]["p50"], stats["frame"]["p95"], stats["frame"]["p99"],
+                 stats["present"]["p50"]),
+              file=sys.stderr)
+
+    game.running = False
+    # Esperar a los hilos que escriben en data_dir (registro de respuestas y
+    # caché de sonidos sintetizados) antes de borrarlo
+    game.answer_log.close()
+    game.sound_manager.wait_for_sounds(SYNTH_PRIORITY, timeout=SYNTH_WAIT_TIMEOUT)
+    pygame.quit()
+    shutil.rmtree(data_dir, ignore_errors=True)
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        regressions = compare(report, args.compare, args.threshold)
+        for state, before, after in regressions:
+            print("[!] Regresión en %s: p95 %.2f ms -> %.2f ms" % (state, before, after),
+                  file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,12 @@ pip install -r requirements.txt
 echo === Instalando Pygbag ===
 pip install pygbag
 
+echo === Compilando tabla del modelo de tiempo ===
+python -m systems.tabla_tiempo
+
+echo === Generando cache de sonidos sintetizados ===
+python -m systems.sound_manager
+
 echo === Creando directorio de build ===
 if not exist "build\web" mkdir build\web
 
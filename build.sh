@@ -10,6 +10,14 @@ pip install -r requirements.txt
 echo "=== Instalando Pygbag ==="
 pip install pygbag
 
+echo "=== Compilando tabla del modelo de tiempo ==="
+# Evalúa mejor_modelo_tiempo.pkl sobre todas sus entradas (tabla_tiempo.npz)
+python -m systems.tabla_tiempo || echo "⚠ No se pudo compilar la tabla; se generará al cargar el modelo"
+
+echo "=== Generando caché de sonidos sintetizados ==="
+# WAV pre-generados (cache_sonidos/): el navegador no necesita descargar scipy
+python -m systems.sound_manager || echo "⚠ No se pudo generar la caché; los sonidos se sintetizarán al arrancar"
+
 echo "=== Creando directorio de build ==="
 mkdir -p build/web
 
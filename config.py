@@ -23,6 +23,32 @@ IS_WEB = (
 # Balance: 25 FPS es aceptable y mejora significativamente el rendimiento
 WEB_FPS = 25 if IS_WEB else 60
 
+# === OPTIMIZACIÓN: PASO FIJO DE SIMULACIÓN ===
+# Toda la lógica cuenta en frames de 60 FPS (temporizadores, cooldowns, tiempos
+# de respuesta). La simulación avanza siempre a FPS pasos por segundo y el
+# dibujado va a RENDER_FPS (WEB_FPS por defecto, NAVE_RENDER_FPS para forzarlo).
+RENDER_FPS = int(os.environ.get('NAVE_RENDER_FPS', '0') or 0) or WEB_FPS
+# Máximo de pasos de simulación por frame dibujado: tras un bloqueo largo
+# (carga, ventana arrastrada) se descarta el atraso en vez de acelerar el juego
+MAX_SIM_STEPS = 6
+
+# Presentación por rectángulos sucios (opcional): solo se envían al display
+# las zonas de pantalla que cambiaron. Activar con NAVE_DIRTY_RECTS=1 solo si
+# `python benchmark.py --dirty-rects` muestra una ganancia (comparar cuesta ~1 ms)
+DIRTY_RECTS = os.environ.get('NAVE_DIRTY_RECTS', '') == '1'
+
+# Identificador del jugador para su perfil de tiempo de respuesta (modo infinito).
+# En un equipo compartido del aula, NAVE_JUGADOR=<nombre> separa los perfiles
+JUGADOR_ID = os.environ.get('NAVE_JUGADOR', '') or 'local'
+
+# Profiler de frames con overlay (también se alterna con F3 durante el juego).
+# Activar desde el inicio con NAVE_PROFILER=1
+PROFILER = os.environ.get('NAVE_PROFILER', '') == '1'
+
+# Mezcla aditiva (BLEND_RGB_ADD) para glows y partículas del atlas de brillos.
+# Activar con NAVE_GLOW_ADDITIVE=1
+GLOW_ADDITIVE = os.environ.get('NAVE_GLOW_ADDITIVE', '') == '1'
+
 # Colores mejorados
 BLACK = (0, 0, 0)
 WHITE = (255, 255, 255)
@@ -1,4 +1,6 @@
 # effects package
+from effects.glow_atlas import GlowAtlas
+from effects.particle_system import EmitterConfig, ParticleEmitter
 from effects.explosion import Explosion
 from effects.particles import MenuParticle, FloatingMathSymbol
 from effects.combo_effects import (
@@ -8,6 +8,10 @@ import random
 import math
 
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, CYAN, YELLOW, GOLD, PURPLE
+from utils.text_cache import render_text
+from utils.fonts import get_font
+from effects.particle_system import EmitterConfig, ParticleEmitter, SHAPE_GLOW
+from utils.pool import ObjectPool
 
 
 class ComboIndicator:
@@ -54,7 +58,7 @@ class ComboIndicator:
         screen.blit(panel, (self.x, self.y))
         
         # Texto "COMBO" a la izquierda
-        combo_text = font.render("COMBO", True, WHITE)
+        combo_text = render_text(font, "COMBO", True, WHITE)
         screen.blit(combo_text, (self.x + 8, self.y + 12))
         
         # Indicadores de progreso (5 círculos grandes) - tamaño similar a los corazones
@@ -79,6 +83,10 @@ class ComboShockwave:
     """Onda expansiva circular para el combo attack"""
     
     def __init__(self, x, y):
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Reinicia la onda (pool)"""
         self.x = x
         self.y = y
         self.radius = 20
@@ -130,6 +138,10 @@ class LightningBolt:
     """Rayo de energía brillante desde el jugador a un enemigo - efecto más visible y duradero"""
     
     def __init__(self, start_x, start_y, end_x, end_y):
+        self.reset(start_x, start_y, end_x, end_y)
+    
+    def reset(self, start_x, start_y, end_x, end_y):
+        """Reinicia el rayo (pool)"""
         self.start_x = start_x
         self.start_y = start_y
         self.end_x = end_x
@@ -214,6 +226,10 @@ class ComboTextPopup:
     """Texto animado 'COMBO!' que aparece al activar el combo"""
     
     def __init__(self, x, y):
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Reinicia el texto (pool)"""
         self.x = x
         self.y = y
         self.life = 90  # 1.5 segundos
@@ -271,7 +287,7 @@ class ComboTextPopup:
         try:
             # Crear fuente escalada
             font_size = int(48 * self.scale)
-            combo_font = pygame.font.Font(None, font_size)
+            combo_font = get_font(None, font_size)
             
             # Texto con sombra
             text = "⚡ COMBO x5! ⚡"
@@ -308,8 +324,16 @@ class ComboTextPopup:
 class ComboParticleBurst:
     """Explosión de partículas al activar el combo"""
     
+    # Partículas con glow, fricción y gravedad suave
+    PARTICLES = EmitterConfig(capacity=40, friction=0.95, gravity=0.2, shape=SHAPE_GLOW)
+    
     def __init__(self, x, y):
-        self.particles = []
+        self.particles = ParticleEmitter(self.PARTICLES)
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Reinicia la explosión de partículas reutilizando su emisor (pool)"""
+        self.particles.clear()
         self.x = x
         self.y = y
         
@@ -321,42 +345,23 @@ class ComboParticleBurst:
             color = random.choice([GOLD, YELLOW, CYAN, WHITE, (255, 200, 100)])
             life = random.randint(30, 60)
             
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': size,
-                'color': color,
-                'life': life,
-                'max_life': life
-            })
+            self.particles.emit(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                                life, size, color)
             
     def update(self):
         """Actualiza las partículas"""
-        for p in self.particles:
-            p['x'] += p['vx']
-            p['y'] += p['vy']
-            p['vx'] *= 0.95  # Fricción
-            p['vy'] *= 0.95
-            p['vy'] += 0.2   # Gravedad suave
-            p['life'] -= 1
+        self.particles.update()
             
     def draw(self, screen):
         """Dibuja las partículas con glow"""
-        for p in self.particles:
-            if p['life'] > 0:
-                alpha = int(255 * (p['life'] / p['max_life']))
-                size = int(p['size'] * (p['life'] / p['max_life']))
-                
-                if size > 0:
-                    # Glow
-                    glow_surface = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surface, (*p['color'][:3], alpha // 3), 
-                                     (size * 2, size * 2), size * 2)
-                    pygame.draw.circle(glow_surface, (*p['color'][:3], alpha), 
-                                     (size * 2, size * 2), size)
-                    screen.blit(glow_surface, (p['x'] - size * 2, p['y'] - size * 2))
+        self.particles.draw(screen)
                     
     def is_dead(self):
-        return all(p['life'] <= 0 for p in self.particles)
+        return self.particles.is_empty()
+
+
+# Pools de efectos de combo (uno por tipo)
+ComboShockwave.pool = ObjectPool(ComboShockwave)
+LightningBolt.pool = ObjectPool(LightningBolt)
+ComboTextPopup.pool = ObjectPool(ComboTextPopup)
+ComboParticleBurst.pool = ObjectPool(ComboParticleBurst)
@@ -7,14 +7,26 @@ import pygame
 import random
 import math
 
+from effects.glow_atlas import GlowAtlas
+from effects.particle_system import EmitterConfig, ParticleEmitter
+from utils.pool import ObjectPool
+
 
 class Explosion:
     """Clase para efectos de explosión cuando se destruyen naves"""
     
+    # Partículas: se frenan con fricción y se encogen/desvanecen con la vida
+    PARTICLES = EmitterConfig(capacity=20, friction=0.95)
+    
     def __init__(self, x, y):
+        self.particles = ParticleEmitter(self.PARTICLES)
+        self.reset(x, y)
+    
+    def reset(self, x, y):
+        """Reinicia la explosión en (x, y) reutilizando su emisor (pool)"""
         self.x = x
         self.y = y
-        self.particles = []
+        self.particles.clear()
         self.life = 30  # Duración de la explosión en frames
         self.max_life = 30
         
@@ -29,26 +41,13 @@ class Explosion:
                 (255, 50, 0),   # Rojo
                 (255, 255, 200) # Blanco amarillento
             ])
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': size,
-                'color': color_choice,
-                'life': self.max_life
-            })
+            self.particles.emit(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                                self.max_life, size, color_choice)
     
     def update(self):
         """Actualiza las partículas de la explosión"""
         self.life -= 1
-        
-        for particle in self.particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vx'] *= 0.95  # Fricción
-            particle['vy'] *= 0.95
-            particle['life'] -= 1
+        self.particles.update()
     
     def draw(self, screen):
         """Dibuja la explosión"""
@@ -56,26 +55,20 @@ class Explosion:
             return
         
         # Dibujar partículas
-        for particle in self.particles:
-            if particle['life'] > 0:
-                alpha = int(255 * (particle['life'] / self.max_life))
-                size = int(particle['size'] * (particle['life'] / self.max_life))
-                if size > 0:
-                    color = particle['color']
-                    # Crear superficie con alpha
-                    particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(particle_surface, (*color, alpha), (size, size), size)
-                    screen.blit(particle_surface, (particle['x'] - size, particle['y'] - size))
+        self.particles.draw(screen)
         
         # Efecto de onda expansiva
         if self.life > 15:
             wave_radius = (self.max_life - self.life) * 3
             wave_alpha = int(100 * (self.life / self.max_life))
-            wave_surface = pygame.Surface((wave_radius * 2, wave_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(wave_surface, (255, 200, 0, wave_alpha), 
-                             (wave_radius, wave_radius), wave_radius, 2)
-            screen.blit(wave_surface, (self.x - wave_radius, self.y - wave_radius))
+            if wave_radius > 0:
+                GlowAtlas.draw_ring(screen, self.x, self.y, wave_radius,
+                                    (255, 200, 0), wave_alpha, 2)
     
     def is_dead(self):
         """Verifica si la explosión terminó"""
         return self.life <= 0
+
+
+# Pool compartido de explosiones (juego y simulación del menú)
+Explosion.pool = ObjectPool(Explosion)
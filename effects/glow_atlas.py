@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Atlas compartido de brillos y puntos suaves prerenderizados
+
+Proyectiles, explosiones y partículas creaban una superficie SRCALPHA nueva
+por elemento y por frame solo para dibujar un círculo con transparencia.
+Aquí se renderiza cada combinación (radio, color, alpha) una sola vez y todos
+los efectos blitean desde la misma caché.
+"""
+
+import pygame
+
+from config import GLOW_ADDITIVE
+
+
+class GlowAtlas:
+    """Caché de glows radiales, puntos y anillos con alpha"""
+
+    # El alpha se cuantiza para acotar el número de entradas (imperceptible)
+    ALPHA_STEP = 8
+    MAX_ENTRIES = 2048
+    # Mezcla aditiva por defecto para los draw_* (NAVE_GLOW_ADDITIVE=1)
+    additive = GLOW_ADDITIVE
+
+    _surfaces = {}
+
+    @classmethod
+    def _quantize_alpha(cls, alpha):
+        """Redondea el alpha al paso del atlas dentro de [0, 255]"""
+        alpha = max(0, min(255, int(alpha)))
+        return min(255, int(round(alpha / cls.ALPHA_STEP)) * cls.ALPHA_STEP)
+
+    @classmethod
+    def _store(cls, key, surface, additive):
+        """Guarda la superficie (convertida al formato del display si existe)"""
+        if additive:
+            surface = cls._to_additive(surface)
+        elif pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        if len(cls._surfaces) >= cls.MAX_ENTRIES:
+            cls._surfaces.clear()
+        cls._surfaces[key] = surface
+        return surface
+
+    @staticmethod
+    def _to_additive(surface):
+        """
+        Versión premultiplicada sobre negro para mezclar con BLEND_RGB_ADD:
+        el negro no suma nada y el color queda escalado por su alpha.
+        """
+        premultiplied = pygame.Surface(surface.get_size())
+        premultiplied.fill((0, 0, 0))
+        premultiplied.blit(surface, (0, 0))
+        if pygame.display.get_surface() is not None:
+            premultiplied = premultiplied.convert()
+        return premultiplied
+
+    @classmethod
+    def get_glow(cls, color, layers, additive=False):
+        """
+        Glow radial por capas: `layers` es una secuencia de (radio, alpha)
+        dibujadas en orden sobre la misma superficie (cada capa reemplaza los
+        píxeles de la anterior, como pygame.draw.circle sobre SRCALPHA).
+        El tamaño de la superficie es el doble del radio mayor.
+        """
+        color = tuple(color[:3])
+        layers = tuple((int(radius), cls._quantize_alpha(alpha)) for radius, alpha in layers)
+        key = ('glow', color, layers, additive)
+        surface = cls._surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        outer = max(1, max(radius for radius, _ in layers))
+        surface = pygame.Surface((outer * 2, outer * 2), pygame.SRCALPHA)
+        for radius, alpha in layers:
+            if radius > 0:
+                pygame.draw.circle(surface, (*color, alpha), (outer, outer), radius)
+        return cls._store(key, surface, additive)
+
+    @classmethod
+    def get_dot(cls, radius, color, alpha, additive=False):
+        """Punto suave: círculo relleno de `radius` con alpha uniforme"""
+        return cls.get_glow(color, ((radius, alpha),), additive)
+
+    @classmethod
+    def get_ring(cls, radius, color, alpha, width=2, additive=False):
+        """Anillo (onda expansiva) de `radius` y grosor `width`"""
+        color = tuple(color[:3])
+        radius = max(1, int(radius))
+        alpha = cls._quantize_alpha(alpha)
+        key = ('ring', color, radius, alpha, width, additive)
+        surface = cls._surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius, width)
+        return cls._store(key, surface, additive)
+
+    @staticmethod
+    def blit_centered(screen, surface, x, y, additive=False):
+        """Blitea `surface` centrada en (x, y), opcionalmente en modo aditivo"""
+        half_w = surface.get_width() // 2
+        half_h = surface.get_height() // 2
+        if additive:
+            screen.blit(surface, (x - half_w, y - half_h), special_flags=pygame.BLEND_RGB_ADD)
+        else:
+            screen.blit(surface, (x - half_w, y - half_h))
+
+    @classmethod
+    def draw_glow(cls, screen, x, y, color, layers, additive=None):
+        """Dibuja un glow por capas centrado en (x, y)"""
+        additive = cls.additive if additive is None else additive
+        cls.blit_centered(screen, cls.get_glow(color, layers, additive), x, y, additive)
+
+    @classmethod
+    def draw_dot(cls, screen, x, y, radius, color, alpha, additive=None):
+        """Dibuja un punto suave centrado en (x, y)"""
+        additive = cls.additive if additive is None else additive
+        cls.blit_centered(screen, cls.get_dot(radius, color, alpha, additive), x, y, additive)
+
+    @classmethod
+    def draw_ring(cls, screen, x, y, radius, color, alpha, width=2, additive=None):
+        """Dibuja un anillo centrado en (x, y)"""
+        additive = cls.additive if additive is None else additive
+        cls.blit_centered(screen, cls.get_ring(radius, color, alpha, width, additive), x, y, additive)
+
+    @classmethod
+    def clear(cls):
+        """Vacía el atlas (ej. tras cambiar el modo de video)"""
+        cls._surfaces.clear()
+
+    @classmethod
+    def size(cls):
+        """Número de superficies en el atlas"""
+        return len(cls._surfaces)
@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+Sistema de partículas con estructura de arrays (NumPy)
+
+Las partículas de explosiones, daño, combos y celebraciones eran dicts u
+objetos actualizados uno a uno en Python y eliminados con `list.remove`.
+Aquí cada emisor guarda posición, velocidad, vida, tamaño, color y rotación
+en arrays contiguos: el movimiento, la fricción, la gravedad y la expiración
+se calculan en bloque, y solo el blit final recorre las partículas vivas.
+
+Cada efecto se describe con un `EmitterConfig` (capacidad, física, forma y
+cómo se desvanece). Sin NumPy se usa un respaldo equivalente con listas.
+"""
+
+import math
+
+import pygame
+import pygame.gfxdraw
+
+from effects.glow_atlas import GlowAtlas
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+# Formas de partícula
+SHAPE_DOT = 0             # Círculo con alpha (atlas)
+SHAPE_GLOW = 1            # Círculo con halo del doble de radio (atlas)
+SHAPE_CIRCLE = 2          # Círculo opaco
+SHAPE_SQUARE = 3          # Cuadrado rotado con alpha
+SHAPE_STAR = 4            # Estrella de 5 puntas opaca
+SHAPE_DIAMOND = 5         # Rombo opaco
+SHAPE_CONFETTI_RECT = 6   # Tira rectangular rotada con alpha (size x size/2)
+SHAPE_CONFETTI_DOT = 7    # Círculo con alpha de radio size/2
+SHAPE_CONFETTI_STAR = 8   # Estrella con alpha de radio size/2
+
+
+class EmitterConfig:
+    """Parámetros de un tipo de partícula"""
+
+    def __init__(self, capacity=256, friction=1.0, gravity=0.0, shape=SHAPE_DOT,
+                 fade_frames=None, alpha_scale=255, size_floor=0.0, min_size=1,
+                 clamp_size=0, kill_below=None):
+        self.capacity = capacity        # Máximo de partículas vivas del emisor
+        self.friction = friction        # Multiplicador de velocidad por frame
+        self.gravity = gravity          # Aceleración vertical por frame
+        self.shape = shape              # Forma por defecto al emitir
+        # Alpha = alpha_scale * min(1, vida / fade_frames); None usa la vida máxima
+        self.fade_frames = fade_frames
+        self.alpha_scale = alpha_scale
+        # Tamaño = size * (size_floor + (1 - size_floor) * vida / vida_max)
+        self.size_floor = size_floor
+        self.min_size = min_size        # No se dibujan partículas más pequeñas
+        self.clamp_size = clamp_size    # Tamaño mínimo forzado (0 = sin forzar)
+        self.kill_below = kill_below    # Expira al pasar esta Y (None = nunca)
+
+
+class ParticleEmitter:
+    """Emisor de partículas con capacidad acotada y actualización vectorizada"""
+
+    def __init__(self, config):
+        self.config = config
+        self.count = 0
+        capacity = config.capacity
+        if HAS_NUMPY:
+            self.x = np.zeros(capacity)
+            self.y = np.zeros(capacity)
+            self.vx = np.zeros(capacity)
+            self.vy = np.zeros(capacity)
+            self.life = np.zeros(capacity)
+            self.max_life = np.ones(capacity)
+            self.size = np.zeros(capacity)
+            self.rotation = np.zeros(capacity)
+            self.rot_speed = np.zeros(capacity)
+            self.color = np.zeros((capacity, 3), dtype=np.int32)
+            self.shape = np.zeros(capacity, dtype=np.int8)
+            self._arrays = (self.x, self.y, self.vx, self.vy, self.life, self.max_life,
+                            self.size, self.rotation, self.rot_speed, self.color, self.shape)
+        else:
+            # Respaldo sin NumPy: una lista por partícula
+            self._particles = []
+
+    def __len__(self):
+        return self.count
+
+    def is_empty(self):
+        """True si no quedan partículas vivas"""
+        return self.count == 0
+
+    def clear(self):
+        """Elimina todas las partículas"""
+        self.count = 0
+        if not HAS_NUMPY:
+            self._particles.clear()
+
+    def emit(self, x, y, vx, vy, life, size, color, rotation=0.0, rot_speed=0.0,
+             shape=None, max_life=None):
+        """Añade una partícula; devuelve False si el emisor está lleno"""
+        if self.count >= self.config.capacity:
+            return False
+        if shape is None:
+            shape = self.config.shape
+        if max_life is None:
+            max_life = life
+
+        if HAS_NUMPY:
+            i = self.count
+            self.x[i] = x
+            self.y[i] = y
+            self.vx[i] = vx
+            self.vy[i] = vy
+            self.life[i] = life
+            self.max_life[i] = max_life
+            self.size[i] = size
+            self.rotation[i] = rotation
+            self.rot_speed[i] = rot_speed
+            self.color[i] = color[:3]
+            self.shape[i] = shape
+        else:
+            self._particles.append([x, y, vx, vy, life, max_life, size,
+                                    rotation, rot_speed, tuple(color[:3]), shape])
+        self.count += 1
+        return True
+
+    def update(self):
+        """Avanza un frame: movimiento, fricción, gravedad, rotación y expiración"""
+        if self.count == 0:
+            return
+        if HAS_NUMPY:
+            self._update_arrays()
+        else:
+            self._update_lists()
+
+    def _update_arrays(self):
+        config = self.config
+        n = self.count
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        self.x[:n] += vx
+        self.y[:n] += vy
+        if config.friction != 1.0:
+            vx *= config.friction
+            vy *= config.friction
+        if config.gravity:
+            vy += config.gravity
+        self.rotation[:n] += self.rot_speed[:n]
+        self.life[:n] -= 1
+
+        alive = self.life[:n] > 0
+        if config.kill_below is not None:
+            alive &= self.y[:n] <= config.kill_below
+        if alive.all():
+            return
+
+        # Compactar las vivas al inicio (mantiene el orden de dibujado)
+        k = int(alive.sum())
+        for array in self._arrays:
+            array[:k] = array[:n][alive]
+        self.count = k
+
+    def _update_lists(self):
+        config = self.config
+        survivors = []
+        for p in self._particles:
+            p[0] += p[2]
+            p[1] += p[3]
+            p[2] *= config.friction
+            p[3] *= config.friction
+            p[3] += config.gravity
+            p[7] += p[8]
+            p[4] -= 1
+            if p[4] > 0 and (config.kill_below is None or p[1] <= config.kill_below):
+                survivors.append(p)
+        self._particles = survivors
+        self.count = len(survivors)
+
+    def draw(self, screen):
+        """Dibuja las partículas vivas en orden de emisión"""
+        if self.count == 0:
+            return
+        if HAS_NUMPY:
+            rows = self._draw_params_arrays()
+        else:
+            rows = self._draw_params_lists()
+
+        min_size = self.config.min_size
+        for x, y, size, alpha, color, rotation, shape in rows:
+            if size >= min_size:
+                _draw_particle(screen, shape, x, y, size, tuple(color), alpha, rotation)
+
+    def _draw_params_arrays(self):
+        """Calcula alpha y tamaño de todas las partículas en bloque"""
+        config = self.config
+        n = self.count
+        life = self.life[:n]
+        ratio = life / self.max_life[:n]
+        fade = ratio if config.fade_frames is None else life / config.fade_frames
+        alpha = (config.alpha_scale * np.clip(fade, 0.0, 1.0)).astype(np.int32)
+        size = (self.size[:n] * (config.size_floor + (1.0 - config.size_floor) * ratio)).astype(np.int32)
+        if config.clamp_size:
+            np.maximum(size, config.clamp_size, out=size)
+        return zip(self.x[:n].tolist(), self.y[:n].tolist(), size.tolist(), alpha.tolist(),
+                   self.color[:n].tolist(), self.rotation[:n].tolist(), self.shape[:n].tolist())
+
+    def _draw_params_lists(self):
+        config = self.config
+        for x, y, _, _, life, max_life, size, rotation, _, color, shape in self._particles:
+            ratio = life / max_life
+            fade = ratio if config.fade_frames is None else life / config.fade_frames
+            alpha = int(config.alpha_scale * min(1.0, max(0.0, fade)))
+            size = int(size * (config.size_floor + (1.0 - config.size_floor) * ratio))
+            if config.clamp_size:
+                size = max(size, config.clamp_size)
+            yield x, y, size, alpha, color, rotation, shape
+
+
+def _star_points(x, y, radius, rotation):
+    """Vértices de una estrella de 5 puntas (radio interior = radio / 2)"""
+    points = []
+    for i in range(10):
+        angle = math.radians(rotation + i * 36)
+        r = radius if i % 2 == 0 else radius // 2
+        points.append((x + math.cos(angle) * r, y + math.sin(angle) * r))
+    return points
+
+
+def _rotated_rect_points(x, y, width, height, rotation):
+    """Esquinas de un rect centrado en (x, y) rotado como pygame.transform.rotate"""
+    rad = math.radians(rotation)
+    cos_r = math.cos(rad)
+    sin_r = math.sin(rad)
+    half_w = width / 2
+    half_h = height / 2
+    points = []
+    for dx, dy in ((-half_w, -half_h), (half_w, -half_h), (half_w, half_h), (-half_w, half_h)):
+        # transform.rotate gira en sentido antihorario en pantalla (Y hacia abajo)
+        points.append((int(x + dx * cos_r + dy * sin_r), int(y - dx * sin_r + dy * cos_r)))
+    return points
+
+
+def _draw_particle(screen, shape, x, y, size, color, alpha, rotation):
+    """Dibuja una partícula según su forma"""
+    if shape == SHAPE_DOT:
+        GlowAtlas.draw_dot(screen, x, y, size, color, alpha)
+    elif shape == SHAPE_GLOW:
+        GlowAtlas.draw_glow(screen, x, y, color, ((size * 2, alpha // 3), (size, alpha)))
+    elif shape == SHAPE_CIRCLE:
+        pygame.draw.circle(screen, color, (int(x), int(y)), size)
+    elif shape == SHAPE_SQUARE:
+        # gfxdraw mezcla el alpha directamente sobre la pantalla (sin superficie temporal)
+        pygame.gfxdraw.filled_polygon(screen, _rotated_rect_points(x, y, size, size, rotation),
+                                      (*color, alpha))
+    elif shape == SHAPE_STAR:
+        pygame.draw.polygon(screen, color, _star_points(x, y, size, rotation))
+    elif shape == SHAPE_DIAMOND:
+        pygame.draw.polygon(screen, color, [(x, y - size), (x + size, y),
+                                            (x, y + size), (x - size, y)])
+    elif shape == SHAPE_CONFETTI_RECT:
+        pygame.gfxdraw.filled_polygon(screen, _rotated_rect_points(x, y, size, size // 2, rotation),
+                                      (*color, alpha))
+    elif shape == SHAPE_CONFETTI_DOT:
+        GlowAtlas.draw_dot(screen, int(x), int(y), size // 2, color, alpha)
+    elif shape == SHAPE_CONFETTI_STAR:
+        points = [(int(px), int(py)) for px, py in _star_points(int(x), int(y), size // 2, rotation)]
+        pygame.gfxdraw.filled_polygon(screen, points, (*color, alpha))
@@ -11,6 +11,9 @@ from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, CYAN, YELLOW, GOLD, 
     ORANGE, GREEN, PURPLE, PINK
 )
+from utils.text_cache import render_text
+from utils.fonts import get_font
+from effects.glow_atlas import GlowAtlas
 
 
 class MenuParticle:
@@ -81,33 +84,23 @@ class MenuParticle:
             for i, (tx, ty) in enumerate(self.trail):
                 trail_alpha = int(150 * (i / len(self.trail)) * alpha_factor)
                 trail_size = max(1, int(self.size * (i / len(self.trail))))
-                trail_surface = pygame.Surface((trail_size * 2, trail_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(trail_surface, (*self.color[:3], trail_alpha), 
-                                 (trail_size, trail_size), trail_size)
-                screen.blit(trail_surface, (int(tx) - trail_size, int(ty) - trail_size))
+                GlowAtlas.draw_dot(screen, int(tx), int(ty), trail_size, self.color, trail_alpha)
             
             # Dibujar estrella principal con brillo
             glow_size = self.size + 3
-            glow_surface = pygame.Surface((glow_size * 4, glow_size * 4), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*self.color[:3], int(80 * alpha_factor)), 
-                             (glow_size * 2, glow_size * 2), glow_size * 2)
-            pygame.draw.circle(glow_surface, (*self.color[:3], int(200 * alpha_factor)), 
-                             (glow_size * 2, glow_size * 2), self.size)
-            screen.blit(glow_surface, (int(self.x) - glow_size * 2, int(self.y) - glow_size * 2))
+            GlowAtlas.draw_glow(screen, int(self.x), int(self.y), self.color,
+                                ((glow_size * 2, 80 * alpha_factor),
+                                 (self.size, 200 * alpha_factor)))
             
         elif self.type == 'dust':
-            # Polvo con transparencia
-            dust_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(dust_surface, (*self.color[:3], int(self.alpha * alpha_factor)), 
-                             (self.size, self.size), self.size)
-            screen.blit(dust_surface, (int(self.x), int(self.y)))
+            # Polvo con transparencia (el original se blitea por la esquina)
+            GlowAtlas.draw_dot(screen, int(self.x) + self.size, int(self.y) + self.size,
+                               self.size, self.color, self.alpha * alpha_factor)
             
         elif self.type == 'spark':
             # Chispa brillante
-            spark_surface = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
-            pygame.draw.circle(spark_surface, (*self.color[:3], int(200 * alpha_factor)), 
-                             (self.size * 2, self.size * 2), self.size)
-            screen.blit(spark_surface, (int(self.x) - self.size * 2, int(self.y) - self.size * 2))
+            GlowAtlas.draw_dot(screen, int(self.x), int(self.y), self.size,
+                               self.color, 200 * alpha_factor)
 
 
 class FloatingMathSymbol:
@@ -156,8 +149,8 @@ class FloatingMathSymbol:
         
         # Crear superficie con rotación
         try:
-            symbol_font = pygame.font.Font(None, self.size)
-            text_surface = symbol_font.render(self.symbol, True, self.color)
+            symbol_font = get_font(None, self.size)
+            text_surface = render_text(symbol_font, self.symbol, True, self.color)
             
             # Rotar el símbolo
             rotated = pygame.transform.rotate(text_surface, self.rotation)
@@ -2,3 +2,4 @@
 from entities.player import Player
 from entities.enemy import Enemy
 from entities.projectile import Projectile
+from entities.entity_store import EntityView
@@ -9,22 +9,107 @@ from config import (
     BLACK, WHITE, RED, DARK_RED, GREEN, YELLOW, BLUE, DARK_BLUE,
     CYAN, PURPLE, DARK_PURPLE, PINK, ORANGE, SILVER, SCREEN_WIDTH
 )
+from utils.text_cache import render_text
+from utils.fonts import get_font
+from entities.entity_store import Column, EntityStore, EntityView, HAS_NUMPY
 
+if HAS_NUMPY:
+    import numpy as np
 
-class Enemy:
+
+class EnemyStore(EntityStore):
+    """Estado simulado de todos los enemigos (una fila por enemigo)"""
+
+    COLUMNS = {
+        "x": ("float64", ()),
+        "y": ("float64", ()),
+        "width": ("int64", ()),
+        "height": ("int64", ()),
+        "hp": ("int64", ()),
+        "speed": ("float64", ()),
+        "direction": ("int64", ()),
+        "move_counter": ("int64", ()),
+        "shoot_cooldown": ("int64", ()),
+    }
+
+    def step(self, slots):
+        """Movimiento de vaivén y cooldown de disparo de los huecos `slots`"""
+        if len(slots) == 0:
+            return
+        if not HAS_NUMPY:
+            for slot in slots:
+                self._step_one(slot)
+            return
+
+        counter = self.move_counter[slots] + 1
+        flip = counter >= 30
+        direction = self.direction[slots]
+        direction[flip] *= -1
+        counter[flip] = 0
+
+        x = self.x[slots] + self.speed[slots] * direction
+        # Limitar movimiento dentro de la pantalla
+        limit = SCREEN_WIDTH - self.width[slots]
+        direction = np.where(x <= 0, 1, np.where(x >= limit, -1, direction))
+        self.x[slots] = np.where(x <= 0, 0, np.minimum(x, limit))
+        self.direction[slots] = direction
+        self.move_counter[slots] = counter
+        cooldown = self.shoot_cooldown[slots]
+        self.shoot_cooldown[slots] = cooldown - (cooldown > 0)
+
+    def _step_one(self, slot):
+        """Respaldo sin NumPy: mismo paso para un solo hueco"""
+        self.move_counter[slot] += 1
+        if self.move_counter[slot] >= 30:
+            self.direction[slot] *= -1
+            self.move_counter[slot] = 0
+        self.x[slot] += self.speed[slot] * self.direction[slot]
+        if self.x[slot] <= 0:
+            self.x[slot] = 0
+            self.direction[slot] = 1
+        elif self.x[slot] + self.width[slot] >= SCREEN_WIDTH:
+            self.x[slot] = SCREEN_WIDTH - self.width[slot]
+            self.direction[slot] = -1
+        if self.shoot_cooldown[slot] > 0:
+            self.shoot_cooldown[slot] -= 1
+
+
+class Enemy(EntityView):
     """Clase para el enemigo con diferentes diseños según el nivel"""
     
     # === OPTIMIZACIÓN: Cache de fuente a nivel de clase ===
     _hp_font = None
     
+    # === OPTIMIZACIÓN: Sprites prerenderizados ===
+    # El diseño de la nave solo depende del nivel, así que se dibuja una vez
+    # por nivel; la barra de vida se cachea por (hp, max_hp, nivel)
+    SPRITE_MARGIN = 30  # Margen para alas y cañones fuera del rect de colisión
+    HP_OVERLAY_OFFSET = (-6, -36)  # Posición de la barra de vida relativa a (x, y)
+    MAX_HP_OVERLAYS = 256
+    _sprite_cache = {}
+    _hp_overlay_cache = {}
+    
+    # === OPTIMIZACIÓN: Estado en columnas (entities/entity_store.py) ===
+    store = EnemyStore()
+    x = Column("x")
+    y = Column("y")
+    width = Column("width")
+    height = Column("height")
+    hp = Column("hp")
+    speed = Column("speed")
+    direction = Column("direction")
+    move_counter = Column("move_counter")
+    shoot_cooldown = Column("shoot_cooldown")
+    
     @classmethod
     def _get_hp_font(cls):
         """Obtiene la fuente cacheada para HP (crea solo una vez)"""
         if cls._hp_font is None:
-            cls._hp_font = pygame.font.Font(None, 16)
+            cls._hp_font = get_font(None, 16)
         return cls._hp_font
     
     def __init__(self, x, y, hp, speed, level=1):
+        self.attach()
         self.x = x
         self.y = y
         self.width = 60
@@ -36,30 +121,63 @@ class Enemy:
         self.direction = 1  # 1 derecha, -1 izquierda
         self.move_counter = 0
         self.level = level
+        self.rect = pygame.Rect(x, y, self.width, self.height)  # Rect de colisión
     
     def draw(self, screen):
-        """Dibuja el enemigo con diseño diferente según el nivel"""
-        if self.level == 1:
-            self._draw_level1(screen)
-        elif self.level == 2:
-            self._draw_level2(screen)
-        else:  # Nivel 3
-            self._draw_level3(screen)
+        """Dibuja el enemigo usando los sprites cacheados (barra de vida + nave)"""
+        overlay_dx, overlay_dy = self.HP_OVERLAY_OFFSET
+        screen.blit(self._get_hp_overlay(), (self.x + overlay_dx, self.y + overlay_dy))
+        screen.blit(self._get_sprite(), (self.x - self.SPRITE_MARGIN, self.y - self.SPRITE_MARGIN))
     
-    def _draw_level1(self, screen):
-        """Dibuja enemigo del nivel 1 - Diseño básico azul/cyan"""
-        center_x = self.x + self.width // 2
-        
-        # Barra de vida (común para todos los niveles)
+    def _get_sprite(self):
+        """Obtiene el sprite de la nave para el nivel actual (se dibuja solo una vez)"""
+        sprite = Enemy._sprite_cache.get(self.level)
+        if sprite is None:
+            margin = self.SPRITE_MARGIN
+            surface = pygame.Surface((self.width + margin * 2, self.height + margin * 2), pygame.SRCALPHA)
+            if self.level == 1:
+                self._draw_level1(surface, margin, margin)
+            elif self.level == 2:
+                self._draw_level2(surface, margin, margin)
+            else:  # Nivel 3
+                self._draw_level3(surface, margin, margin)
+            sprite = surface.convert_alpha()
+            Enemy._sprite_cache[self.level] = sprite
+        return sprite
+    
+    def _get_hp_overlay(self):
+        """Obtiene la barra de vida + texto HP cacheada por (hp, max_hp, nivel)"""
+        key = (self.hp, self.max_hp, self.level)
+        overlay = Enemy._hp_overlay_cache.get(key)
+        if overlay is None:
+            if len(Enemy._hp_overlay_cache) >= self.MAX_HP_OVERLAYS:
+                Enemy._hp_overlay_cache.clear()
+            overlay_dx, overlay_dy = self.HP_OVERLAY_OFFSET
+            surface = pygame.Surface((self.width - overlay_dx * 2, 28), pygame.SRCALPHA)
+            self._draw_hp_bar(surface, -overlay_dx, -overlay_dy)
+            overlay = surface.convert_alpha()
+            Enemy._hp_overlay_cache[key] = overlay
+        return overlay
+    
+    def _draw_hp_bar(self, surface, x, y):
+        """Dibuja la barra de vida (común para todos los niveles)"""
+        center_x = x + self.width // 2
         bar_width = self.width + 10
         bar_height = 8
-        bar_x = self.x - 5
-        bar_y = self.y - 18
+        bar_x = x - 5
+        bar_y = y - 18
         hp_percentage = self.hp / self.max_hp
         hp_width = int(bar_width * hp_percentage)
         
-        pygame.draw.rect(screen, BLACK, (bar_x - 1, bar_y - 1, bar_width + 2, bar_height + 2))
-        pygame.draw.rect(screen, DARK_BLUE, (bar_x, bar_y, bar_width, bar_height))
+        if self.level == 1:
+            bar_bg = DARK_BLUE
+        elif self.level == 2:
+            bar_bg = DARK_PURPLE
+        else:
+            bar_bg = DARK_RED
+        
+        pygame.draw.rect(surface, BLACK, (bar_x - 1, bar_y - 1, bar_width + 2, bar_height + 2))
+        pygame.draw.rect(surface, bar_bg, (bar_x, bar_y, bar_width, bar_height))
         
         if hp_width > 0:
             if hp_percentage > 0.6:
@@ -68,289 +186,221 @@ class Enemy:
                 hp_color = YELLOW
             else:
                 hp_color = RED
-            pygame.draw.rect(screen, hp_color, (bar_x, bar_y, hp_width, bar_height))
+            pygame.draw.rect(surface, hp_color, (bar_x, bar_y, hp_width, bar_height))
             if hp_width > 2:
-                pygame.draw.rect(screen, WHITE, (bar_x, bar_y, hp_width, 3))
+                pygame.draw.rect(surface, WHITE, (bar_x, bar_y, hp_width, 3))
         
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
         
-        hp_text = self._get_hp_font().render(f"{self.hp}/{self.max_hp}", True, WHITE)
-        hp_text_rect = hp_text.get_rect(center=(center_x, self.y - 28))
-        screen.blit(hp_text, hp_text_rect)
+        hp_text = render_text(self._get_hp_font(), f"{self.hp}/{self.max_hp}", True, WHITE)
+        hp_text_rect = hp_text.get_rect(center=(center_x, y - 28))
+        surface.blit(hp_text, hp_text_rect)
+    
+    def _draw_level1(self, surface, x, y):
+        """Dibuja enemigo del nivel 1 - Diseño básico azul/cyan"""
+        center_x = x + self.width // 2
         
         # Diseño Nivel 1: Nave básica azul/cyan
         # Alas redondeadas
-        pygame.draw.ellipse(screen, DARK_BLUE, (self.x - 8, self.y - 5, 20, 30))
-        pygame.draw.ellipse(screen, DARK_BLUE, (self.x + self.width - 12, self.y - 5, 20, 30))
+        pygame.draw.ellipse(surface, DARK_BLUE, (x - 8, y - 5, 20, 30))
+        pygame.draw.ellipse(surface, DARK_BLUE, (x + self.width - 12, y - 5, 20, 30))
         
         # Cuerpo principal redondeado
-        pygame.draw.ellipse(screen, BLUE, (self.x, self.y, self.width, self.height))
-        pygame.draw.ellipse(screen, CYAN, (self.x + 5, self.y + 5, self.width - 10, self.height - 10))
-        pygame.draw.ellipse(screen, BLUE, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.ellipse(surface, BLUE, (x, y, self.width, self.height))
+        pygame.draw.ellipse(surface, CYAN, (x + 5, y + 5, self.width - 10, self.height - 10))
+        pygame.draw.ellipse(surface, BLUE, (x, y, self.width, self.height), 2)
         
         # Ventana central azul brillante
-        window_center = (center_x, self.y + self.height // 2)
-        pygame.draw.circle(screen, DARK_BLUE, window_center, 10)
-        pygame.draw.circle(screen, CYAN, window_center, 9)
-        pygame.draw.circle(screen, WHITE, (center_x - 2, self.y + self.height // 2 - 2), 4)
-        pygame.draw.circle(screen, BLUE, window_center, 9, 2)
+        window_center = (center_x, y + self.height // 2)
+        pygame.draw.circle(surface, DARK_BLUE, window_center, 10)
+        pygame.draw.circle(surface, CYAN, window_center, 9)
+        pygame.draw.circle(surface, WHITE, (center_x - 2, y + self.height // 2 - 2), 4)
+        pygame.draw.circle(surface, BLUE, window_center, 9, 2)
         
         # Cañones simples
-        pygame.draw.rect(screen, SILVER, (self.x + 10, self.y + self.height, 4, 6))
-        pygame.draw.rect(screen, SILVER, (self.x + self.width - 14, self.y + self.height, 4, 6))
+        pygame.draw.rect(surface, SILVER, (x + 10, y + self.height, 4, 6))
+        pygame.draw.rect(surface, SILVER, (x + self.width - 14, y + self.height, 4, 6))
     
-    def _draw_level2(self, screen):
+    def _draw_level2(self, surface, x, y):
         """Dibuja enemigo del nivel 2 - Diseño intermedio púrpura/rosa"""
-        center_x = self.x + self.width // 2
-        
-        # Barra de vida
-        bar_width = self.width + 10
-        bar_height = 8
-        bar_x = self.x - 5
-        bar_y = self.y - 18
-        hp_percentage = self.hp / self.max_hp
-        hp_width = int(bar_width * hp_percentage)
-        
-        pygame.draw.rect(screen, BLACK, (bar_x - 1, bar_y - 1, bar_width + 2, bar_height + 2))
-        pygame.draw.rect(screen, DARK_PURPLE, (bar_x, bar_y, bar_width, bar_height))
-        
-        if hp_width > 0:
-            if hp_percentage > 0.6:
-                hp_color = GREEN
-            elif hp_percentage > 0.3:
-                hp_color = YELLOW
-            else:
-                hp_color = RED
-            pygame.draw.rect(screen, hp_color, (bar_x, bar_y, hp_width, bar_height))
-            if hp_width > 2:
-                pygame.draw.rect(screen, WHITE, (bar_x, bar_y, hp_width, 3))
-        
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-        
-        hp_text = self._get_hp_font().render(f"{self.hp}/{self.max_hp}", True, WHITE)
-        hp_text_rect = hp_text.get_rect(center=(center_x, self.y - 28))
-        screen.blit(hp_text, hp_text_rect)
+        center_x = x + self.width // 2
         
         # Diseño Nivel 2: Nave angular púrpura
         # Alas superiores puntiagudas
         top_wing_left = [
-            (self.x - 5, self.y + 8),
-            (self.x - 20, self.y - 18),
-            (self.x + 8, self.y)
+            (x - 5, y + 8),
+            (x - 20, y - 18),
+            (x + 8, y)
         ]
         top_wing_right = [
-            (self.x + self.width + 5, self.y + 8),
-            (self.x + self.width + 20, self.y - 18),
-            (self.x + self.width - 8, self.y)
+            (x + self.width + 5, y + 8),
+            (x + self.width + 20, y - 18),
+            (x + self.width - 8, y)
         ]
-        pygame.draw.polygon(screen, DARK_PURPLE, top_wing_left)
-        pygame.draw.polygon(screen, DARK_PURPLE, top_wing_right)
-        pygame.draw.polygon(screen, PURPLE, top_wing_left, 2)
-        pygame.draw.polygon(screen, PURPLE, top_wing_right, 2)
+        pygame.draw.polygon(surface, DARK_PURPLE, top_wing_left)
+        pygame.draw.polygon(surface, DARK_PURPLE, top_wing_right)
+        pygame.draw.polygon(surface, PURPLE, top_wing_left, 2)
+        pygame.draw.polygon(surface, PURPLE, top_wing_right, 2)
         
         # Cuerpo hexagonal
-        pygame.draw.polygon(screen, DARK_PURPLE, [
-            (center_x, self.y),
-            (self.x, self.y + self.height // 3),
-            (self.x, self.y + 2 * self.height // 3),
-            (center_x, self.y + self.height),
-            (self.x + self.width, self.y + 2 * self.height // 3),
-            (self.x + self.width, self.y + self.height // 3)
+        pygame.draw.polygon(surface, DARK_PURPLE, [
+            (center_x, y),
+            (x, y + self.height // 3),
+            (x, y + 2 * self.height // 3),
+            (center_x, y + self.height),
+            (x + self.width, y + 2 * self.height // 3),
+            (x + self.width, y + self.height // 3)
         ])
-        pygame.draw.polygon(screen, PURPLE, [
-            (center_x, self.y + 5),
-            (self.x + 8, self.y + self.height // 3 + 5),
-            (self.x + 8, self.y + 2 * self.height // 3 - 5),
-            (center_x, self.y + self.height - 5),
-            (self.x + self.width - 8, self.y + 2 * self.height // 3 - 5),
-            (self.x + self.width - 8, self.y + self.height // 3 + 5)
+        pygame.draw.polygon(surface, PURPLE, [
+            (center_x, y + 5),
+            (x + 8, y + self.height // 3 + 5),
+            (x + 8, y + 2 * self.height // 3 - 5),
+            (center_x, y + self.height - 5),
+            (x + self.width - 8, y + 2 * self.height // 3 - 5),
+            (x + self.width - 8, y + self.height // 3 + 5)
         ])
-        pygame.draw.polygon(screen, PINK, [
-            (center_x, self.y),
-            (self.x, self.y + self.height // 3),
-            (self.x, self.y + 2 * self.height // 3),
-            (center_x, self.y + self.height),
-            (self.x + self.width, self.y + 2 * self.height // 3),
-            (self.x + self.width, self.y + self.height // 3)
+        pygame.draw.polygon(surface, PINK, [
+            (center_x, y),
+            (x, y + self.height // 3),
+            (x, y + 2 * self.height // 3),
+            (center_x, y + self.height),
+            (x + self.width, y + 2 * self.height // 3),
+            (x + self.width, y + self.height // 3)
         ], 3)
         
         # Ventana central con cristal púrpura
-        window_center = (center_x, self.y + self.height // 2)
-        pygame.draw.circle(screen, DARK_PURPLE, window_center, 12)
-        pygame.draw.circle(screen, PURPLE, window_center, 11)
-        pygame.draw.circle(screen, PINK, (center_x + 2, self.y + self.height // 2 - 2), 5)
-        pygame.draw.circle(screen, WHITE, window_center, 11, 2)
+        window_center = (center_x, y + self.height // 2)
+        pygame.draw.circle(surface, DARK_PURPLE, window_center, 12)
+        pygame.draw.circle(surface, PURPLE, window_center, 11)
+        pygame.draw.circle(surface, PINK, (center_x + 2, y + self.height // 2 - 2), 5)
+        pygame.draw.circle(surface, WHITE, window_center, 11, 2)
         
         # Detalles decorativos - cristales
-        pygame.draw.polygon(screen, PINK, [
-            (self.x + 12, self.y + 12), (self.x + 18, self.y + 12),
-            (self.x + 15, self.y + 18)
+        pygame.draw.polygon(surface, PINK, [
+            (x + 12, y + 12), (x + 18, y + 12),
+            (x + 15, y + 18)
         ])
-        pygame.draw.polygon(screen, PINK, [
-            (self.x + self.width - 12, self.y + 12), (self.x + self.width - 18, self.y + 12),
-            (self.x + self.width - 15, self.y + 18)
+        pygame.draw.polygon(surface, PINK, [
+            (x + self.width - 12, y + 12), (x + self.width - 18, y + 12),
+            (x + self.width - 15, y + 18)
         ])
         
         # Cañones dobles
-        pygame.draw.rect(screen, SILVER, (self.x + 6, self.y + self.height, 5, 10))
-        pygame.draw.rect(screen, SILVER, (self.x + 11, self.y + self.height, 5, 10))
-        pygame.draw.rect(screen, SILVER, (self.x + self.width - 16, self.y + self.height, 5, 10))
-        pygame.draw.rect(screen, SILVER, (self.x + self.width - 11, self.y + self.height, 5, 10))
+        pygame.draw.rect(surface, SILVER, (x + 6, y + self.height, 5, 10))
+        pygame.draw.rect(surface, SILVER, (x + 11, y + self.height, 5, 10))
+        pygame.draw.rect(surface, SILVER, (x + self.width - 16, y + self.height, 5, 10))
+        pygame.draw.rect(surface, SILVER, (x + self.width - 11, y + self.height, 5, 10))
     
-    def _draw_level3(self, screen):
+    def _draw_level3(self, surface, x, y):
         """Dibuja enemigo del nivel 3 - Diseño avanzado rojo/naranja amenazante"""
-        center_x = self.x + self.width // 2
-        
-        # Barra de vida
-        bar_width = self.width + 10
-        bar_height = 8
-        bar_x = self.x - 5
-        bar_y = self.y - 18
-        hp_percentage = self.hp / self.max_hp
-        hp_width = int(bar_width * hp_percentage)
-        
-        pygame.draw.rect(screen, BLACK, (bar_x - 1, bar_y - 1, bar_width + 2, bar_height + 2))
-        pygame.draw.rect(screen, DARK_RED, (bar_x, bar_y, bar_width, bar_height))
-        
-        if hp_width > 0:
-            if hp_percentage > 0.6:
-                hp_color = GREEN
-            elif hp_percentage > 0.3:
-                hp_color = YELLOW
-            else:
-                hp_color = RED
-            pygame.draw.rect(screen, hp_color, (bar_x, bar_y, hp_width, bar_height))
-            if hp_width > 2:
-                pygame.draw.rect(screen, WHITE, (bar_x, bar_y, hp_width, 3))
-        
-        pygame.draw.rect(screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
-        
-        hp_text = self._get_hp_font().render(f"{self.hp}/{self.max_hp}", True, WHITE)
-        hp_text_rect = hp_text.get_rect(center=(center_x, self.y - 28))
-        screen.blit(hp_text, hp_text_rect)
+        center_x = x + self.width // 2
         
         # Diseño Nivel 3: Nave avanzada roja agresiva
         # Alas grandes y amenazantes
         top_wing_left = [
-            (self.x - 8, self.y + 5),
-            (self.x - 25, self.y - 25),
-            (self.x + 10, self.y - 5)
+            (x - 8, y + 5),
+            (x - 25, y - 25),
+            (x + 10, y - 5)
         ]
         top_wing_right = [
-            (self.x + self.width + 8, self.y + 5),
-            (self.x + self.width + 25, self.y - 25),
-            (self.x + self.width - 10, self.y - 5)
+            (x + self.width + 8, y + 5),
+            (x + self.width + 25, y - 25),
+            (x + self.width - 10, y - 5)
         ]
-        pygame.draw.polygon(screen, DARK_RED, top_wing_left)
-        pygame.draw.polygon(screen, DARK_RED, top_wing_right)
-        pygame.draw.polygon(screen, RED, top_wing_left, 3)
-        pygame.draw.polygon(screen, RED, top_wing_right, 3)
+        pygame.draw.polygon(surface, DARK_RED, top_wing_left)
+        pygame.draw.polygon(surface, DARK_RED, top_wing_right)
+        pygame.draw.polygon(surface, RED, top_wing_left, 3)
+        pygame.draw.polygon(surface, RED, top_wing_right, 3)
         
         # Alas inferiores
         bottom_wing_left = [
-            (self.x - 5, self.y + self.height - 5),
-            (self.x - 15, self.y + self.height + 10),
-            (self.x + 8, self.y + self.height)
+            (x - 5, y + self.height - 5),
+            (x - 15, y + self.height + 10),
+            (x + 8, y + self.height)
         ]
         bottom_wing_right = [
-            (self.x + self.width + 5, self.y + self.height - 5),
-            (self.x + self.width + 15, self.y + self.height + 10),
-            (self.x + self.width - 8, self.y + self.height)
+            (x + self.width + 5, y + self.height - 5),
+            (x + self.width + 15, y + self.height + 10),
+            (x + self.width - 8, y + self.height)
         ]
-        pygame.draw.polygon(screen, DARK_RED, bottom_wing_left)
-        pygame.draw.polygon(screen, DARK_RED, bottom_wing_right)
-        pygame.draw.polygon(screen, ORANGE, bottom_wing_left, 2)
-        pygame.draw.polygon(screen, ORANGE, bottom_wing_right, 2)
+        pygame.draw.polygon(surface, DARK_RED, bottom_wing_left)
+        pygame.draw.polygon(surface, DARK_RED, bottom_wing_right)
+        pygame.draw.polygon(surface, ORANGE, bottom_wing_left, 2)
+        pygame.draw.polygon(surface, ORANGE, bottom_wing_right, 2)
         
         # Cuerpo principal angular y agresivo
-        pygame.draw.polygon(screen, DARK_RED, [
-            (center_x, self.y),
-            (self.x - 3, self.y + self.height // 4),
-            (self.x, self.y + self.height // 2),
-            (self.x - 3, self.y + 3 * self.height // 4),
-            (center_x, self.y + self.height),
-            (self.x + self.width + 3, self.y + 3 * self.height // 4),
-            (self.x + self.width, self.y + self.height // 2),
-            (self.x + self.width + 3, self.y + self.height // 4)
+        pygame.draw.polygon(surface, DARK_RED, [
+            (center_x, y),
+            (x - 3, y + self.height // 4),
+            (x, y + self.height // 2),
+            (x - 3, y + 3 * self.height // 4),
+            (center_x, y + self.height),
+            (x + self.width + 3, y + 3 * self.height // 4),
+            (x + self.width, y + self.height // 2),
+            (x + self.width + 3, y + self.height // 4)
         ])
-        pygame.draw.polygon(screen, RED, [
-            (center_x, self.y + 3),
-            (self.x + 2, self.y + self.height // 4 + 3),
-            (self.x + 5, self.y + self.height // 2),
-            (self.x + 2, self.y + 3 * self.height // 4 - 3),
-            (center_x, self.y + self.height - 3),
-            (self.x + self.width - 2, self.y + 3 * self.height // 4 - 3),
-            (self.x + self.width - 5, self.y + self.height // 2),
-            (self.x + self.width - 2, self.y + self.height // 4 + 3)
+        pygame.draw.polygon(surface, RED, [
+            (center_x, y + 3),
+            (x + 2, y + self.height // 4 + 3),
+            (x + 5, y + self.height // 2),
+            (x + 2, y + 3 * self.height // 4 - 3),
+            (center_x, y + self.height - 3),
+            (x + self.width - 2, y + 3 * self.height // 4 - 3),
+            (x + self.width - 5, y + self.height // 2),
+            (x + self.width - 2, y + self.height // 4 + 3)
         ])
-        pygame.draw.polygon(screen, ORANGE, [
-            (center_x, self.y),
-            (self.x - 3, self.y + self.height // 4),
-            (self.x, self.y + self.height // 2),
-            (self.x - 3, self.y + 3 * self.height // 4),
-            (center_x, self.y + self.height),
-            (self.x + self.width + 3, self.y + 3 * self.height // 4),
-            (self.x + self.width, self.y + self.height // 2),
-            (self.x + self.width + 3, self.y + self.height // 4)
+        pygame.draw.polygon(surface, ORANGE, [
+            (center_x, y),
+            (x - 3, y + self.height // 4),
+            (x, y + self.height // 2),
+            (x - 3, y + 3 * self.height // 4),
+            (center_x, y + self.height),
+            (x + self.width + 3, y + 3 * self.height // 4),
+            (x + self.width, y + self.height // 2),
+            (x + self.width + 3, y + self.height // 4)
         ], 3)
         
         # Ventana central amenazante roja
-        window_center = (center_x, self.y + self.height // 2)
-        pygame.draw.circle(screen, DARK_RED, window_center, 13)
-        pygame.draw.circle(screen, RED, window_center, 12)
-        pygame.draw.circle(screen, ORANGE, window_center, 10)
-        pygame.draw.circle(screen, YELLOW, (center_x - 1, self.y + self.height // 2 - 1), 5)
-        pygame.draw.circle(screen, RED, window_center, 12, 3)
+        window_center = (center_x, y + self.height // 2)
+        pygame.draw.circle(surface, DARK_RED, window_center, 13)
+        pygame.draw.circle(surface, RED, window_center, 12)
+        pygame.draw.circle(surface, ORANGE, window_center, 10)
+        pygame.draw.circle(surface, YELLOW, (center_x - 1, y + self.height // 2 - 1), 5)
+        pygame.draw.circle(surface, RED, window_center, 12, 3)
         
         # Detalles agresivos - púas
-        pygame.draw.polygon(screen, ORANGE, [
-            (self.x + 8, self.y + 10), (self.x + 14, self.y + 10),
-            (self.x + 11, self.y + 16)
+        pygame.draw.polygon(surface, ORANGE, [
+            (x + 8, y + 10), (x + 14, y + 10),
+            (x + 11, y + 16)
         ])
-        pygame.draw.polygon(screen, ORANGE, [
-            (self.x + self.width - 8, self.y + 10), (self.x + self.width - 14, self.y + 10),
-            (self.x + self.width - 11, self.y + 16)
+        pygame.draw.polygon(surface, ORANGE, [
+            (x + self.width - 8, y + 10), (x + self.width - 14, y + 10),
+            (x + self.width - 11, y + 16)
         ])
-        pygame.draw.polygon(screen, ORANGE, [
-            (self.x + 8, self.y + self.height - 10), (self.x + 14, self.y + self.height - 10),
-            (self.x + 11, self.y + self.height - 16)
+        pygame.draw.polygon(surface, ORANGE, [
+            (x + 8, y + self.height - 10), (x + 14, y + self.height - 10),
+            (x + 11, y + self.height - 16)
         ])
-        pygame.draw.polygon(screen, ORANGE, [
-            (self.x + self.width - 8, self.y + self.height - 10),
-            (self.x + self.width - 14, self.y + self.height - 10),
-            (self.x + self.width - 11, self.y + self.height - 16)
+        pygame.draw.polygon(surface, ORANGE, [
+            (x + self.width - 8, y + self.height - 10),
+            (x + self.width - 14, y + self.height - 10),
+            (x + self.width - 11, y + self.height - 16)
         ])
         
         # Cañones triples grandes
-        pygame.draw.rect(screen, SILVER, (self.x + 4, self.y + self.height, 4, 12))
-        pygame.draw.rect(screen, SILVER, (self.x + 9, self.y + self.height, 4, 12))
-        pygame.draw.rect(screen, SILVER, (self.x + 14, self.y + self.height, 4, 12))
-        pygame.draw.rect(screen, SILVER, (self.x + self.width - 18, self.y + self.height, 4, 12))
-        pygame.draw.rect(screen, SILVER, (self.x + self.width - 13, self.y + self.height, 4, 12))
-        pygame.draw.rect(screen, SILVER, (self.x + self.width - 8, self.y + self.height, 4, 12))
-    
-    def move(self):
-        """Mueve el enemigo de lado a lado"""
-        self.move_counter += 1
-        if self.move_counter >= 30:
-            self.direction *= -1
-            self.move_counter = 0
-        self.x += self.speed * self.direction
-        
-        # Limitar movimiento dentro de la pantalla
-        if self.x <= 0:
-            self.x = 0
-            self.direction = 1
-        elif self.x + self.width >= SCREEN_WIDTH:
-            self.x = SCREEN_WIDTH - self.width
-            self.direction = -1
+        pygame.draw.rect(surface, SILVER, (x + 4, y + self.height, 4, 12))
+        pygame.draw.rect(surface, SILVER, (x + 9, y + self.height, 4, 12))
+        pygame.draw.rect(surface, SILVER, (x + 14, y + self.height, 4, 12))
+        pygame.draw.rect(surface, SILVER, (x + self.width - 18, y + self.height, 4, 12))
+        pygame.draw.rect(surface, SILVER, (x + self.width - 13, y + self.height, 4, 12))
+        pygame.draw.rect(surface, SILVER, (x + self.width - 8, y + self.height, 4, 12))
     
     def shoot(self):
         """Crea un disparo del enemigo"""
         from entities.projectile import Projectile
         if self.shoot_cooldown <= 0:
             self.shoot_cooldown = 60
-            return Projectile(self.x + self.width // 2, self.y + self.height, 8, RED, False)
+            return Projectile.pool.acquire(self.x + self.width // 2, self.y + self.height, 8, RED, False)
         return None
     
     def take_damage(self, amount=1):
@@ -359,9 +409,17 @@ class Enemy:
     
     def update(self):
         """Actualiza el estado del enemigo"""
-        self.move()
-        if self.shoot_cooldown > 0:
-            self.shoot_cooldown -= 1
+        self.store.step([self._slot])
+    
+    @classmethod
+    def update_all(cls, enemies):
+        """Actualiza una lista de enemigos en bloque (un solo paso vectorizado)"""
+        cls.store.step(cls.store.slots(enemies))
+    
+    def get_rect(self):
+        """Rectángulo de colisión (el mismo Rect, actualizado en sitio)"""
+        self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
     
     def is_dead(self):
         """Verifica si el enemigo está muerto"""
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Almacén de entidades en columnas (estructura de arrays)
+
+`Enemy` y `Projectile` eran objetos con atributos en un dict y su `update()`
+hacía la física escalar una entidad a la vez (el guiado de cada proyectil con
+`math.sqrt`, cada frame). Aquí el estado que se simula (posición, velocidad,
+vida, cooldowns, índice del objetivo, estela) vive en arrays NumPy, uno por
+campo, y el movimiento, el guiado, los cooldowns y el descarte fuera de
+pantalla se calculan en bloque sobre los huecos de una lista de entidades.
+
+Cada entidad conserva su clase como vista fina (`EntityView`): reserva un
+hueco (slot) al crearse, y sus atributos (`enemy.x`, `enemy.hp`...) leen y
+escriben su fila mediante `Column`, así el código de dibujado y de
+colisiones sigue igual. Quien la saca del juego llama a `detach()`, que
+copia la fila a la instancia y devuelve el hueco al store en ese momento
+(sin esperar al recolector); `attach()` reserva uno nuevo, con la fila a
+cero. Sin NumPy las columnas son listas y los pasos en bloque recorren los
+huecos uno a uno.
+"""
+
+import weakref
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def _zeros(shape):
+    """Fila de ceros (listas anidadas) para el respaldo sin NumPy"""
+    if not shape:
+        return 0
+    return [_zeros(shape[1:]) for _ in range(shape[0])]
+
+
+class Column:
+    """Atributo de una vista guardado en la columna `name` del store de su clase
+
+    Con `index` el atributo es un componente de una columna vectorial (ej.
+    `x` e `y` de una columna de posiciones con forma (capacidad, 2)).
+
+    Si la vista no tiene hueco (tras `detach()`) el valor vive en la propia
+    instancia.
+    """
+
+    def __init__(self, name, index=None):
+        self.name = name
+        self.index = index
+
+    def __set_name__(self, owner, attr):
+        self.attr = attr
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        slot = obj._slot
+        if slot is None:
+            return obj.__dict__[self.attr]
+        column = obj.store.__dict__[self.name]
+        if self.index is None:
+            if HAS_NUMPY:
+                return column.item(slot)
+            return column[slot]
+        if HAS_NUMPY:
+            return column.item(slot, self.index)
+        return column[slot][self.index]
+
+    def __set__(self, obj, value):
+        slot = obj._slot
+        if slot is None:
+            obj.__dict__[self.attr] = value
+        elif self.index is None:
+            obj.store.__dict__[self.name][slot] = value
+        else:
+            obj.store.__dict__[self.name][slot][self.index] = value
+
+
+class EntityView:
+    """Base de las entidades guardadas en un store: `_slot` es su fila en
+    `store` (None si no tiene)"""
+
+    store = None
+    _slot = None
+
+    @classmethod
+    def _column_attrs(cls):
+        """Nombres de los atributos `Column` de la clase (cacheados)"""
+        attrs = cls.__dict__.get("_column_attr_cache")
+        if attrs is None:
+            attrs = [attr for attr in dir(cls) if isinstance(getattr(cls, attr), Column)]
+            cls._column_attr_cache = attrs
+        return attrs
+
+    def attach(self):
+        """Reserva una fila (a cero) si la entidad no tiene una"""
+        if self._slot is None:
+            self._slot = self.store.allocate(self)
+            for attr in self._column_attrs():
+                self.__dict__.pop(attr, None)
+
+    def detach(self):
+        """Copia la fila a la instancia y devuelve el hueco al store
+
+        Se llama al sacar la entidad del juego; la instancia sigue siendo
+        legible (ej. un proyectil que aún apunta a un enemigo muerto).
+        """
+        slot = self._slot
+        if slot is None:
+            return
+        for attr in self._column_attrs():
+            self.__dict__[attr] = getattr(self, attr)
+        self._slot = None
+        self.store.release(slot)
+
+
+class EntityStore:
+    """Columnas de un tipo de entidad; cada entidad ocupa un hueco estable"""
+
+    # nombre -> (dtype, forma adicional por fila)
+    COLUMNS = {}
+    # Columnas comunes a todos los stores
+    BASE_COLUMNS = {
+        # Cambia cada vez que se libera el hueco: distingue al ocupante
+        # actual de uno anterior (ej. el objetivo de un proyectil)
+        "generation": ("int64", ()),
+    }
+
+    def __init__(self, capacity=64):
+        self.capacity = 0
+        self._free = []
+        # hueco -> finalizador de respaldo de su dueño
+        self._finalizers = {}
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        """Amplía todas las columnas conservando las filas existentes"""
+        columns = dict(self.BASE_COLUMNS, **self.COLUMNS)
+        for name, (dtype, shape) in columns.items():
+            if HAS_NUMPY:
+                column = np.zeros((capacity,) + shape, dtype=dtype)
+                if self.capacity:
+                    column[:self.capacity] = getattr(self, name)
+            else:
+                column = getattr(self, name, [])
+                for _ in range(capacity - self.capacity):
+                    column.append(_zeros(shape))
+            setattr(self, name, column)
+        # Los huecos libres se entregan de menor a mayor
+        self._free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self._free.sort(reverse=True)
+        self.capacity = capacity
+
+    def allocate(self, owner):
+        """Reserva un hueco para `owner` con la fila a cero"""
+        if not self._free:
+            self._grow(self.capacity * 2)
+        slot = self._free.pop()
+        for name, (dtype, shape) in self.COLUMNS.items():
+            column = getattr(self, name)
+            column[slot] = 0 if HAS_NUMPY else _zeros(shape)
+        # Respaldo: si el dueño se destruye sin release(), el hueco vuelve
+        # a quedar libre al recolectarlo
+        self._finalizers[slot] = weakref.finalize(owner, self._reclaim, slot)
+        return slot
+
+    def release(self, slot):
+        """Devuelve `slot` a los huecos libres (ignora huecos ya libres)"""
+        finalizer = self._finalizers.pop(slot, None)
+        if finalizer is not None:
+            finalizer.detach()
+            self._reclaim(slot)
+
+    def _reclaim(self, slot):
+        self._finalizers.pop(slot, None)
+        self.generation[slot] += 1
+        self._free.append(slot)
+
+    def __len__(self):
+        return self.capacity - len(self._free)
+
+    @staticmethod
+    def slots(entities):
+        """Índices de los huecos de una lista de entidades (para los pasos en bloque)"""
+        if HAS_NUMPY:
+            return np.fromiter((entity._slot for entity in entities), dtype=np.intp,
+                               count=len(entities))
+        return [entity._slot for entity in entities]
@@ -11,16 +11,27 @@ from config import (
     CYAN, BLUE, DARK_BLUE, YELLOW, WHITE, GOLD, SILVER,
     GREEN, RED, ORANGE, SCREEN_WIDTH, SCREEN_HEIGHT
 )
+from effects.particle_system import EmitterConfig, ParticleEmitter
 
 
 class Player:
     """Clase para el jugador"""
     
+    # === OPTIMIZACIÓN: Sprite sheet y overlays prerenderizados (compartidos) ===
+    SPRITE_MARGIN = 24  # Margen para alas y motores fuera del rect de colisión
+    ENGINE_GLOW_PHASES = 20  # Ciclo de engine_glow (0-19)
+    ENGINE_GLOW_STEP = 2  # Avance por frame: solo se alcanzan las fases pares
+    _sprite_sheet = None
+    _damage_overlays = {}
+    # Partículas de daño: tamaño 4 que se encoge hasta un mínimo de 2
+    DAMAGE_PARTICLES = EmitterConfig(capacity=40, friction=0.95, clamp_size=2)
+    
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.width = 60
         self.height = 40
+        self.rect = pygame.Rect(x, y, self.width, self.height)  # Rect de colisión
         self.lives = 5
         self.score = 0
         self.correct_answers = 0
@@ -28,7 +39,7 @@ class Player:
         self.shoot_cooldown = 0
         self.engine_glow = 0  # Para animación de motores
         self.damage_flash = 0  # Contador para efecto de daño visual
-        self.damage_particles = []  # Partículas de daño
+        self.damage_particles = ParticleEmitter(self.DAMAGE_PARTICLES)  # Partículas de daño
         
         # Sistema de movimiento
         self.vx = 0  # Velocidad horizontal
@@ -37,85 +48,111 @@ class Player:
         self.friction = 0.9  # Fricción para desaceleración suave
     
     def draw(self, screen):
-        """Dibuja la nave del jugador con gráficos mejorados"""
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
-        
+        """Dibuja la nave del jugador usando el sprite sheet prerenderizado"""
         # Efecto visual de daño (parpadeo rojo)
-        damage_alpha = 0
         if self.damage_flash > 0:
+            overlay = self._get_damage_overlay(self.damage_flash, self.width + 10, self.height + 10)
+            screen.blit(overlay, (self.x - 5, self.y - 5))
+        
+        # Dibujar partículas de daño (desde el atlas de brillos compartido)
+        self.damage_particles.draw(screen)
+        
+        # Efecto de motores (glow animado): cada fase es un frame del sprite sheet
+        self.engine_glow = (self.engine_glow + self.ENGINE_GLOW_STEP) % self.ENGINE_GLOW_PHASES
+        
+        sheet = self._get_sprite_sheet(self.width, self.height)
+        frame_w = self.width + self.SPRITE_MARGIN * 2
+        frame_h = self.height + self.SPRITE_MARGIN * 2
+        frame = self.engine_glow // self.ENGINE_GLOW_STEP
+        screen.blit(sheet, (self.x - self.SPRITE_MARGIN, self.y - self.SPRITE_MARGIN),
+                    (frame * frame_w, 0, frame_w, frame_h))
+    
+    @classmethod
+    def _get_sprite_sheet(cls, width, height):
+        """Obtiene el sprite sheet de la nave (un frame por fase alcanzable del glow de motores)"""
+        if cls._sprite_sheet is None:
+            margin = cls.SPRITE_MARGIN
+            frame_w = width + margin * 2
+            frame_h = height + margin * 2
+            phases = range(0, cls.ENGINE_GLOW_PHASES, cls.ENGINE_GLOW_STEP)
+            sheet = pygame.Surface((frame_w * len(phases), frame_h), pygame.SRCALPHA)
+            for frame, phase in enumerate(phases):
+                cls._draw_ship(sheet, frame * frame_w + margin, margin, width, height, phase)
+            cls._sprite_sheet = sheet.convert_alpha()
+        return cls._sprite_sheet
+    
+    @classmethod
+    def _get_damage_overlay(cls, damage_flash, width, height):
+        """Obtiene el overlay rojo de daño pretintado para cada valor de damage_flash"""
+        overlay = cls._damage_overlays.get(damage_flash)
+        if overlay is None:
             # Parpadeo más intenso al inicio
-            damage_alpha = int(180 * (self.damage_flash / 30))
-            damage_overlay = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
-            damage_overlay.fill((255, 0, 0, damage_alpha))
-            screen.blit(damage_overlay, (self.x - 5, self.y - 5))
-        
-        # Dibujar partículas de daño
-        for particle in self.damage_particles:
-            alpha = int(255 * (particle['life'] / 20))
-            size = max(2, int(4 * (particle['life'] / 20)))
-            particle_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (*particle['color'], alpha), (size, size), size)
-            screen.blit(particle_surface, (particle['x'] - size, particle['y'] - size))
-        
-        # Efecto de motores (glow animado)
-        self.engine_glow = (self.engine_glow + 2) % 20
-        glow_intensity = abs(10 - self.engine_glow) / 10
+            damage_alpha = int(180 * (damage_flash / 30))
+            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+            overlay.fill((255, 0, 0, damage_alpha))
+            cls._damage_overlays[damage_flash] = overlay
+        return overlay
+    
+    @staticmethod
+    def _draw_ship(surface, x, y, width, height, engine_glow):
+        """Dibuja la nave completa con gráficos mejorados en (x, y)"""
+        center_x = x + width // 2
+        glow_intensity = abs(10 - engine_glow) / 10
         
         # Motores traseros con efecto glow
         engine_color = (int(100 * glow_intensity), int(200 * glow_intensity), int(255 * glow_intensity))
-        pygame.draw.circle(screen, engine_color, (center_x - 15, self.y + self.height + 5), 5)
-        pygame.draw.circle(screen, engine_color, (center_x + 15, self.y + self.height + 5), 5)
+        pygame.draw.circle(surface, engine_color, (center_x - 15, y + height + 5), 5)
+        pygame.draw.circle(surface, engine_color, (center_x + 15, y + height + 5), 5)
         
         # Alas inferiores (mejoradas)
         left_wing = [
-            (self.x - 5, self.y + self.height - 10),
-            (self.x - 20, self.y + self.height + 20),
-            (self.x + 5, self.y + self.height + 5)
+            (x - 5, y + height - 10),
+            (x - 20, y + height + 20),
+            (x + 5, y + height + 5)
         ]
         right_wing = [
-            (self.x + self.width + 5, self.y + self.height - 10),
-            (self.x + self.width + 20, self.y + self.height + 20),
-            (self.x + self.width - 5, self.y + self.height + 5)
+            (x + width + 5, y + height - 10),
+            (x + width + 20, y + height + 20),
+            (x + width - 5, y + height + 5)
         ]
-        pygame.draw.polygon(screen, CYAN, left_wing)
-        pygame.draw.polygon(screen, CYAN, right_wing)
-        pygame.draw.polygon(screen, BLUE, left_wing, 2)
-        pygame.draw.polygon(screen, BLUE, right_wing, 2)
+        pygame.draw.polygon(surface, CYAN, left_wing)
+        pygame.draw.polygon(surface, CYAN, right_wing)
+        pygame.draw.polygon(surface, BLUE, left_wing, 2)
+        pygame.draw.polygon(surface, BLUE, right_wing, 2)
         
         # Cuerpo principal con gradiente simulado
         # Capa base
-        pygame.draw.ellipse(screen, DARK_BLUE, (self.x, self.y, self.width, self.height))
+        pygame.draw.ellipse(surface, DARK_BLUE, (x, y, width, height))
         # Capa superior (brillo)
-        pygame.draw.ellipse(screen, BLUE, (self.x + 5, self.y + 5, self.width - 10, self.height - 10))
+        pygame.draw.ellipse(surface, BLUE, (x + 5, y + 5, width - 10, height - 10))
         # Borde
-        pygame.draw.ellipse(screen, CYAN, (self.x, self.y, self.width, self.height), 2)
+        pygame.draw.ellipse(surface, CYAN, (x, y, width, height), 2)
         
         # Detalles del cuerpo (líneas de diseño)
-        pygame.draw.line(screen, DARK_BLUE, (self.x + 10, self.y + 15), (self.x + self.width - 10, self.y + 15), 2)
-        pygame.draw.line(screen, DARK_BLUE, (self.x + 10, self.y + 25), (self.x + self.width - 10, self.y + 25), 2)
+        pygame.draw.line(surface, DARK_BLUE, (x + 10, y + 15), (x + width - 10, y + 15), 2)
+        pygame.draw.line(surface, DARK_BLUE, (x + 10, y + 25), (x + width - 10, y + 25), 2)
         
         # Cabina con efecto de vidrio
-        cabin_center = (center_x, self.y + 12)
+        cabin_center = (center_x, y + 12)
         # Sombra de la cabina
-        pygame.draw.circle(screen, DARK_BLUE, cabin_center, 12)
+        pygame.draw.circle(surface, DARK_BLUE, cabin_center, 12)
         # Cabina principal
-        pygame.draw.circle(screen, YELLOW, cabin_center, 11)
+        pygame.draw.circle(surface, YELLOW, cabin_center, 11)
         # Brillo de la cabina
-        pygame.draw.circle(screen, WHITE, (center_x - 3, self.y + 9), 4)
+        pygame.draw.circle(surface, WHITE, (center_x - 3, y + 9), 4)
         # Borde de la cabina
-        pygame.draw.circle(screen, GOLD, cabin_center, 11, 2)
+        pygame.draw.circle(surface, GOLD, cabin_center, 11, 2)
         
         # Cañones laterales
-        pygame.draw.rect(screen, SILVER, (self.x - 3, self.y + 18, 6, 8))
-        pygame.draw.rect(screen, SILVER, (self.x + self.width - 3, self.y + 18, 6, 8))
+        pygame.draw.rect(surface, SILVER, (x - 3, y + 18, 6, 8))
+        pygame.draw.rect(surface, SILVER, (x + width - 3, y + 18, 6, 8))
     
     def shoot(self):
         """Crea un disparo del jugador"""
         from entities.projectile import Projectile
         if self.shoot_cooldown <= 0:
             self.shoot_cooldown = 10
-            return Projectile(self.x + self.width // 2, self.y, -8, GREEN, True)
+            return Projectile.pool.acquire(self.x + self.width // 2, self.y, -8, GREEN, True)
         return None
     
     def take_damage(self):
@@ -129,14 +166,9 @@ class Player:
         for _ in range(10):
             angle = random.uniform(0, 2 * math.pi)
             speed = random.uniform(2, 6)
-            self.damage_particles.append({
-                'x': center_x,
-                'y': center_y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'life': 20,
-                'color': random.choice([RED, ORANGE, YELLOW])
-            })
+            self.damage_particles.emit(center_x, center_y,
+                                       math.cos(angle) * speed, math.sin(angle) * speed,
+                                       20, 4, random.choice([RED, ORANGE, YELLOW]))
     
     def update(self):
         """Actualiza el estado del jugador"""
@@ -148,17 +180,15 @@ class Player:
             self.damage_flash -= 1
         
         # Actualizar partículas de daño
-        for particle in self.damage_particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vx'] *= 0.95
-            particle['vy'] *= 0.95
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.damage_particles.remove(particle)
+        self.damage_particles.update()
         
         # La animación del motor se actualiza en draw()
     
+    def get_rect(self):
+        """Rectángulo de colisión (el mismo Rect, actualizado en sitio)"""
+        self.rect.update(self.x, self.y, self.width, self.height)
+        return self.rect
+    
     def move_left(self):
         """Acelera hacia la izquierda"""
         self.vx -= self.acceleration
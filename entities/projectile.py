@@ -9,19 +9,175 @@ import math
 from config import (
     CYAN, WHITE, DARK_RED, ORANGE, YELLOW, SCREEN_HEIGHT
 )
+from effects.glow_atlas import GlowAtlas
+from entities.enemy import Enemy
+from entities.entity_store import Column, EntityStore, EntityView, HAS_NUMPY
+from utils.pool import ObjectPool
 
+if HAS_NUMPY:
+    import numpy as np
 
-class Projectile:
+
+# Puntos máximos de estela por proyectil (8 jugador, 5 enemigo)
+MAX_TRAIL = 8
+
+
+class ProjectileStore(EntityStore):
+    """Estado simulado de todos los proyectiles, incluida la estela"""
+
+    COLUMNS = {
+        "pos": ("float64", (2,)),
+        "vel": ("float64", (2,)),
+        "speed": ("float64", ()),
+        "is_player_shot": ("bool", ()),
+        # Hueco del enemigo objetivo en Enemy.store (-1 = sin objetivo) y su
+        # generación (si no coincide, el enemigo ya salió del juego)
+        "target": ("intp", ()),
+        "target_generation": ("int64", ()),
+        "trail_length": ("int64", ()),
+        # Estela: posición y vida de cada punto (vida -1 = hueco libre)
+        "trail_pos": ("float64", (MAX_TRAIL, 2)),
+        "trail_life": ("int64", (MAX_TRAIL,)),
+    }
+
+    def step(self, slots, enemies):
+        """Guiado, movimiento y estela de los huecos `slots`; devuelve la
+        máscara de los que quedaron fuera de pantalla"""
+        if not HAS_NUMPY:
+            return [self._step_one(slot, enemies) for slot in slots]
+        slots = np.asarray(slots, dtype=np.intp)
+        if len(slots) == 0:
+            return np.zeros(0, dtype=bool)
+
+        pos, vel = self.pos[slots], self.vel[slots]
+        target = self.target[slots]
+        guided = self.is_player_shot[slots] & (target >= 0)
+
+        # Guiado hacia el enemigo objetivo si sigue vivo (misma fórmula que
+        # el cálculo escalar, así las trayectorias no cambian)
+        homing = np.nonzero(guided)[0]
+        if len(homing):
+            t = target[homing]
+            homing = homing[(enemies.generation[t] == self.target_generation[slots[homing]])
+                            & (enemies.hp[t] > 0)]
+        if len(homing):
+            t = target[homing]
+            dx = enemies.x[t] + enemies.width[t] // 2 - pos[homing, 0]
+            dy = enemies.y[t] + enemies.height[t] // 2 - pos[homing, 1]
+            distance = np.sqrt(dx * dx + dy * dy)
+            speed = np.abs(self.speed[slots[homing]])
+            far = distance > 0
+            if far.all():
+                vel[homing, 0] = (dx / distance) * speed
+                vel[homing, 1] = (dy / distance) * speed
+            else:
+                for i, row in enumerate(homing):
+                    if far[i]:
+                        vel[row] = ((dx[i] / distance[i]) * speed[i],
+                                    (dy[i] / distance[i]) * speed[i])
+                    elif not vel[row].any():
+                        # Si está muy cerca, mantener dirección actual
+                        vel[row, 1] = -speed[i]
+
+        pos += vel
+        # Los disparos guiados avanzan dos veces por frame (su velocidad en
+        # juego depende de ello)
+        pos += np.where(guided[:, None], vel, 0.0)
+        self.pos[slots] = pos
+        self.vel[slots] = vel
+
+        self._step_trails(slots, pos)
+        y = pos[:, 1]
+        return (y < -10) | (y > SCREEN_HEIGHT + 10)
+
+    def _step_trails(self, slots, pos):
+        """Añade un punto donde haya sitio y envejece la estela (los puntos
+        con vida 0 pasan a libres)"""
+        life = self.trail_life[slots]
+        length = self.trail_length[slots]
+        free = life < 0
+        rows = np.nonzero(MAX_TRAIL - free.sum(axis=1) < length)[0]
+        if len(rows):
+            column = np.argmax(free[rows], axis=1)
+            self.trail_pos[slots[rows], column] = pos[rows]
+            life[rows, column] = length[rows]
+        life -= 1
+        np.maximum(life, -1, out=life)
+        self.trail_life[slots] = life
+
+    def _step_one(self, slot, enemies):
+        """Respaldo sin NumPy: mismo paso para un solo hueco"""
+        pos, vel = self.pos[slot], self.vel[slot]
+        target = self.target[slot]
+        guided = self.is_player_shot[slot] and target >= 0
+        if (guided and enemies.generation[target] == self.target_generation[slot]
+                and enemies.hp[target] > 0):
+            dx = enemies.x[target] + enemies.width[target] // 2 - pos[0]
+            dy = enemies.y[target] + enemies.height[target] // 2 - pos[1]
+            distance = math.sqrt(dx * dx + dy * dy)
+            speed = abs(self.speed[slot])
+            if distance > 0:
+                vel[0] = (dx / distance) * speed
+                vel[1] = (dy / distance) * speed
+            elif vel[0] == 0 and vel[1] == 0:
+                vel[1] = -speed
+        for _ in range(2 if guided else 1):
+            pos[0] += vel[0]
+            pos[1] += vel[1]
+
+        life = self.trail_life[slot]
+        if sum(1 for value in life if value >= 0) < self.trail_length[slot]:
+            free = next(i for i, value in enumerate(life) if value < 0)
+            self.trail_pos[slot][free] = list(pos)
+            life[free] = self.trail_length[slot]
+        for i in range(MAX_TRAIL):
+            life[i] = max(-1, life[i] - 1)
+        return pos[1] < -10 or pos[1] > SCREEN_HEIGHT + 10
+
+
+class Projectile(EntityView):
     """Clase para los proyectiles"""
     
+    # === OPTIMIZACIÓN: Estado en columnas (entities/entity_store.py) ===
+    store = ProjectileStore()
+    x = Column("pos", 0)
+    y = Column("pos", 1)
+    vx = Column("vel", 0)
+    vy = Column("vel", 1)
+    speed = Column("speed")
+    is_player_shot = Column("is_player_shot")
+    trail_length = Column("trail_length")
+    
     def __init__(self, x, y, speed, color, is_player_shot, target_enemy=None, target_player=None):
+        self.rect = pygame.Rect(0, 0, 0, 0)  # Rect de colisión (se actualiza en sitio)
+        self.reset(x, y, speed, color, is_player_shot, target_enemy, target_player)
+    
+    @property
+    def target_enemy(self):
+        """Enemigo objetivo (para proyectiles del jugador)"""
+        return self._target_enemy
+    
+    @target_enemy.setter
+    def target_enemy(self, enemy):
+        self._target_enemy = enemy
+        if enemy is not None and enemy._slot is not None:
+            self.store.target[self._slot] = enemy._slot
+            self.store.target_generation[self._slot] = Enemy.store.generation[enemy._slot]
+        else:
+            self.store.target[self._slot] = -1
+    
+    def reset(self, x, y, speed, color, is_player_shot, target_enemy=None, target_player=None):
+        """Reinicia el proyectil (usado por el pool para reutilizar instancias)"""
+        # Al volver al pool soltó su fila (Game._remove_pooled)
+        self.attach()
         self.x = x
         self.y = y
         self.speed = speed
         self.color = color
         self.is_player_shot = is_player_shot
         self.radius = 6
-        self.particles = []
+        # La estela se vacía en sitio
+        self.store.trail_life[self._slot] = [-1] * MAX_TRAIL
         self.trail_length = 8 if is_player_shot else 5
         self.glow_intensity = 15
         self.target_enemy = target_enemy  # Enemigo objetivo (para proyectiles del jugador)
@@ -48,13 +204,18 @@ class Projectile:
     
     def draw(self, screen):
         """Dibuja el proyectil con efectos visuales mejorados"""
+        # Estado leído una vez de las columnas del store
+        x, y = self.x, self.y
+        is_player_shot = self.is_player_shot
+        trail_length = self.trail_length
+        
         # Estela de partículas mejorada
-        for i, (px, py, life) in enumerate(self.particles):
-            alpha_ratio = life / self.trail_length
+        for px, py, life in self.trail_points():
+            alpha_ratio = life / trail_length
             size = max(2, int(self.radius * alpha_ratio * 0.8))
             
             # Color más brillante para la estela
-            if self.is_player_shot:
+            if is_player_shot:
                 trail_color = (
                     min(255, self.color[0] + int(100 * alpha_ratio)),
                     min(255, self.color[1] + int(50 * alpha_ratio)),
@@ -69,94 +230,67 @@ class Projectile:
             
             pygame.draw.circle(screen, trail_color, (int(px), int(py)), size)
         
-        # Glow exterior del proyectil
+        # Glow exterior del proyectil (3 capas, desde el atlas compartido)
         glow_radius = self.radius + 3
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        for i in range(3):
-            alpha = 50 - i * 15
-            pygame.draw.circle(
-                glow_surface, 
-                (*self.color, alpha), 
-                (glow_radius, glow_radius), 
-                glow_radius - i
-            )
-        screen.blit(glow_surface, (self.x - glow_radius, self.y - glow_radius))
+        GlowAtlas.draw_glow(screen, x, y, self.color,
+                            tuple((glow_radius - i, 50 - i * 15) for i in range(3)))
         
         # Núcleo del proyectil (brillante)
-        if self.is_player_shot:
+        if is_player_shot:
             # Proyectil del jugador - forma de energía
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-            pygame.draw.circle(screen, CYAN, (int(self.x), int(self.y)), self.radius - 2)
-            pygame.draw.circle(screen, WHITE, (int(self.x), int(self.y)), self.radius - 4)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), self.radius)
+            pygame.draw.circle(screen, CYAN, (int(x), int(y)), self.radius - 2)
+            pygame.draw.circle(screen, WHITE, (int(x), int(y)), self.radius - 4)
             # Rayos de energía
             for angle in [0, 90, 180, 270]:
                 rad = math.radians(angle)
-                end_x = self.x + math.cos(rad) * self.radius
-                end_y = self.y + math.sin(rad) * self.radius
-                pygame.draw.line(screen, WHITE, (self.x, self.y), (end_x, end_y), 2)
+                end_x = x + math.cos(rad) * self.radius
+                end_y = y + math.sin(rad) * self.radius
+                pygame.draw.line(screen, WHITE, (x, y), (end_x, end_y), 2)
         else:
             # Proyectil del enemigo - forma de fuego
-            pygame.draw.circle(screen, DARK_RED, (int(self.x), int(self.y)), self.radius)
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius - 1)
-            pygame.draw.circle(screen, ORANGE, (int(self.x), int(self.y)), self.radius - 3)
+            pygame.draw.circle(screen, DARK_RED, (int(x), int(y)), self.radius)
+            pygame.draw.circle(screen, self.color, (int(x), int(y)), self.radius - 1)
+            pygame.draw.circle(screen, ORANGE, (int(x), int(y)), self.radius - 3)
             # Llamas
             for offset in [-2, 0, 2]:
                 flame_points = [
-                    (self.x + offset, self.y - self.radius),
-                    (self.x + offset - 2, self.y - self.radius - 3),
-                    (self.x + offset + 2, self.y - self.radius - 3)
+                    (x + offset, y - self.radius),
+                    (x + offset - 2, y - self.radius - 3),
+                    (x + offset + 2, y - self.radius - 3)
                 ]
                 pygame.draw.polygon(screen, YELLOW, flame_points)
     
+    def trail_points(self):
+        """Puntos vivos de la estela (x, y, vida), del más viejo al más nuevo"""
+        store, slot = self.store, self._slot
+        positions, lives = store.trail_pos[slot], store.trail_life[slot]
+        if HAS_NUMPY:
+            positions, lives = positions.tolist(), lives.tolist()
+        points = [(px, py, life) for (px, py), life in zip(positions, lives) if life >= 0]
+        points.sort(key=lambda point: point[2])
+        return points
+    
     def update(self):
         """Actualiza la posición del proyectil"""
-        # Si es un proyectil del jugador con objetivo, dirigirlo hacia el enemigo
-        if self.is_player_shot and self.target_enemy:
-            # Verificar si el enemigo objetivo sigue vivo
-            if hasattr(self.target_enemy, 'hp') and self.target_enemy.hp > 0:
-                # Calcular dirección hacia el enemigo
-                target_x = self.target_enemy.x + self.target_enemy.width // 2
-                target_y = self.target_enemy.y + self.target_enemy.height // 2
-                
-                dx = target_x - self.x
-                dy = target_y - self.y
-                distance = math.sqrt(dx * dx + dy * dy)
-                
-                if distance > 0:
-                    # Normalizar y aplicar velocidad (velocidad constante)
-                    speed = abs(self.speed)
-                    self.vx = (dx / distance) * speed
-                    self.vy = (dy / distance) * speed
-                else:
-                    # Si está muy cerca, mantener dirección actual
-                    if self.vx == 0 and self.vy == 0:
-                        self.vy = -abs(self.speed)
-            
-            # Actualizar posición
-            self.x += self.vx
-            self.y += self.vy
-            # Actualizar posición
-            self.x += self.vx
-            self.y += self.vy
-        
-        # Lógica de movimiento para proyectiles enemigos (lineal) o sin objetivo
-        else:
-            # Movimiento basado en velocidad constante (calculada al inicio)
-            self.x += self.vx
-            self.y += self.vy
-        
-        # Agregar partículas de estela
-        if len(self.particles) < self.trail_length:
-            self.particles.append((self.x, self.y, self.trail_length))
-        
-        # Actualizar partículas (mantener las últimas N)
-        self.particles = [(px, py, life - 1) for px, py, life in self.particles if life > 0]
+        self.store.step([self._slot], Enemy.store)
+    
+    @classmethod
+    def update_all(cls, projectiles):
+        """Actualiza una lista de proyectiles en bloque; devuelve la máscara
+        (por índice) de los que quedaron fuera de pantalla"""
+        return cls.store.step(cls.store.slots(projectiles), Enemy.store)
     
     def is_off_screen(self):
         """Verifica si el proyectil está fuera de la pantalla"""
         return self.y < -10 or self.y > SCREEN_HEIGHT + 10
     
     def get_rect(self):
-        """Retorna el rectángulo de colisión"""
-        return pygame.Rect(self.x - self.radius, self.y - self.radius, 
-                          self.radius * 2, self.radius * 2)
+        """Retorna el rectángulo de colisión (el mismo Rect, actualizado en sitio)"""
+        self.rect.update(self.x - self.radius, self.y - self.radius,
+                         self.radius * 2, self.radius * 2)
+        return self.rect
+
+
+# Pool compartido de proyectiles (jugador, enemigos y simulación del menú)
+Projectile.pool = ObjectPool(Projectile)
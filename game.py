@@ -7,28 +7,33 @@ import pygame
 import random
 import math
 import os
-import json
 import sys
+import time
 from utils.resource import resource_path, writable_path
+from utils.text_cache import render_text
+from utils.fonts import get_font, preload_fonts
+from utils.pool import release
+from utils.swap_list import OrderedList, SwapList
+from utils.answer_log import AnswerLog, ANSWER_LOG_FILENAME, LEGACY_FILENAME
 
 from config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IS_WEB, WEB_FPS,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IS_WEB, RENDER_FPS, MAX_SIM_STEPS, DIRTY_RECTS, PROFILER,
     BLACK, WHITE, RED, DARK_RED, GREEN, DARK_GREEN,
     BLUE, DARK_BLUE, YELLOW, GOLD, ORANGE, PURPLE, CYAN, PINK, SILVER,
     DARK_PURPLE, STAR_COLOR,
     L1_BG_START, L1_BG_END, L1_STAR,
     L2_BG_START, L2_BG_END, L2_STAR,
     L3_BG_START, L3_BG_END, L3_STAR,
-    LEVEL_CONFIG, KEY_TO_OPERATION, OPERATION_TO_KEY, ENEMIES_PER_LEVEL
+    LEVEL_CONFIG, KEY_TO_OPERATION, OPERATION_TO_KEY, ENEMIES_PER_LEVEL, JUGADOR_ID
 )
-from entities import Player, Enemy, Projectile
+from entities import Player, Enemy, Projectile, EntityView
 from effects import (
     Explosion, MenuParticle, FloatingMathSymbol,
     ComboIndicator, ComboShockwave, LightningBolt, ComboTextPopup, ComboParticleBurst
 )
 from ui import Button, Slider, CircularButton
-from systems import MathProblem, TiempoAdaptativo, SoundManager, MascotaAnimada, InfiniteMode, VictoryCelebration, start_controller, stop_controller
-from visuals import SpaceObject
+from systems import MathProblem, TiempoAdaptativo, SoundManager, MascotaAnimada, InfiniteMode, VictoryCelebration, DirtyRectRenderer, FrameProfiler, SpatialHash, hits_on, start_controller, stop_controller
+from visuals import SpaceObject, BackgroundCache, ParallaxStarfield
 
 
 class Game:
@@ -39,6 +44,14 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Operación Relámpago - Juego Educativo")
         self.clock = pygame.time.Clock()
+        # Presentación del frame (flip completo o solo rects sucios)
+        self.renderer = DirtyRectRenderer(enabled=DIRTY_RECTS)
+        # Profiler de frames (NAVE_PROFILER=1 o F3)
+        self.profiler = FrameProfiler(enabled=PROFILER)
+        # Registro de respuestas append-only (escritura en segundo plano)
+        self.answer_log = AnswerLog(writable_path(ANSWER_LOG_FILENAME),
+                                    legacy_path=writable_path(LEGACY_FILENAME),
+                                    threaded=not IS_WEB)
         
         # === FUENTES PIXEL ART PARA ESTÉTICA RETRO ===
         # Intentar cargar la fuente pixel art PressStart2P
@@ -47,24 +60,33 @@ class Game:
         try:
             if os.path.exists(pixel_font_path):
                 # Fuentes pixel art (tamaños más pequeños porque PressStart2P es grande)
-                self.font_large = pygame.font.Font(pixel_font_path, 28)   # Título
-                self.font_medium = pygame.font.Font(pixel_font_path, 16)  # Subtítulos
-                self.font_small = pygame.font.Font(pixel_font_path, 12)   # Texto normal
-                self.font_tiny = pygame.font.Font(pixel_font_path, 8)     # Texto pequeño
-                self.font_pixel = pygame.font.Font(pixel_font_path, 32)   # Para efectos
-                self.font_button = pygame.font.Font(pixel_font_path, 14)  # Botones
+                self.font_large = get_font(pixel_font_path, 28)   # Título
+                self.font_medium = get_font(pixel_font_path, 16)  # Subtítulos
+                self.font_small = get_font(pixel_font_path, 12)   # Texto normal
+                self.font_tiny = get_font(pixel_font_path, 8)     # Texto pequeño
+                self.font_pixel = get_font(pixel_font_path, 32)   # Para efectos
+                self.font_button = get_font(pixel_font_path, 14)  # Botones
                 print("✓ Fuente pixel art cargada correctamente")
             else:
                 raise FileNotFoundError("Fuente no encontrada")
         except Exception as e:
             print(f"[!] Usando fuentes de respaldo: {e}")
             # Fallback a fuentes del sistema
-            self.font_large = pygame.font.Font(None, 56)
-            self.font_medium = pygame.font.Font(None, 36)
-            self.font_small = pygame.font.Font(None, 24)
-            self.font_tiny = pygame.font.Font(None, 18)
-            self.font_pixel = pygame.font.Font(None, 72)
-            self.font_button = pygame.font.Font(None, 50)
+            self.font_large = get_font(None, 56)
+            self.font_medium = get_font(None, 36)
+            self.font_small = get_font(None, 24)
+            self.font_tiny = get_font(None, 18)
+            self.font_pixel = get_font(None, 72)
+            self.font_button = get_font(None, 50)
+
+        # === OPTIMIZACIÓN: Precargar fuentes por defecto usadas en efectos ===
+        # Símbolos flotantes del menú (24-48), mascota, logros y victoria.
+        # En web no hay hilos: se cargan bajo demanda la primera vez.
+        if not IS_WEB:
+            default_sizes = set(range(24, 49)) | {16, 26, 32, 36, 72}
+            preload_fonts(((None, size) for size in sorted(default_sizes)), background=True)
+            # Modelo del modo infinito (importar scikit-learn tarda más de 1 s)
+            TiempoAdaptativo.precargar()
         self.running = True
         self.game_state = "menu"  # menu, controls, settings, level_intro, playing, paused, pre_victory, victory, lose
         self.sound_manager = SoundManager()
@@ -110,23 +132,40 @@ class Game:
             ))
         
         # === OPTIMIZACIÓN: Cache de fondos prerenderizados ===
-        self.cached_backgrounds = {}
-        self._cache_all_backgrounds()
+        # Cada nivel se construye (vectorizado) la primera vez que se dibuja,
+        # a la resolución actual de la pantalla
+        self.backgrounds = BackgroundCache({
+            1: (L1_BG_START, L1_BG_END, L1_STAR),
+            2: (L2_BG_START, L2_BG_END, L2_STAR),
+            3: (L3_BG_START, L3_BG_END, L3_STAR),
+        }, self.stars)
+        # Capas de estrellas en paralaje sobre el fondo (dos blits por capa)
+        self.starfield = ParallaxStarfield({1: L1_STAR, 2: L2_STAR, 3: L3_STAR})
         
         # Objetos espaciales decorativos
         self.space_objects = []
         
         # Explosiones y efectos visuales
-        self.explosions = []
+        # Los efectos mueren por edad y se dibujan en orden: OrderedList;
+        # los proyectiles mueren en cualquier posición: SwapList (quitar O(1))
+        self.explosions = OrderedList()
+        self.enemies = OrderedList()  # Enemigos (el orden decide el objetivo)
+        self.player_projectiles = SwapList()
+        self.enemy_projectiles = SwapList()
+        # Broadphase de colisiones proyectil-enemigo (se reconstruye cada frame)
+        self.enemy_grid = SpatialHash()
         
         # Sistema de COMBO
         self.combo_streak = 0           # Contador de respuestas correctas consecutivas
         self.combo_threshold = 5        # Umbral para activar combo attack
         self.combo_indicator = ComboIndicator()  # UI del combo
-        self.combo_effects = []         # Lista de efectos visuales activos
+        self.combo_effects = OrderedList()  # Efectos visuales activos
         self.screen_shake = 0           # Duración del screen shake
         self.screen_shake_intensity = 0 # Intensidad del shake
         self.screen_flash = 0           # Duración del flash de pantalla
+        # === OPTIMIZACIÓN: Buffers persistentes (sin allocations por frame) ===
+        self.shake_buffer = None        # Back buffer para el screen shake
+        self.flash_overlay = None       # Overlay del screen flash
         
         # Sistema de feedback visual de borde (correcto/incorrecto)
         self.answer_feedback_timer = 0      # Duración del efecto de borde
@@ -164,8 +203,8 @@ class Game:
         
         # Temporizador para disparos automáticos del menú
         self.menu_shoot_timer = 0
-        self.menu_projectiles = []
-        self.menu_explosions = []
+        self.menu_projectiles = SwapList()
+        self.menu_explosions = OrderedList()
         
         # SCREEN SHAKE para impacto visual
         self.menu_screen_shake = 0
@@ -386,6 +425,8 @@ class Game:
         else:
             # Volver a modo ventana
             self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # La nueva superficie de display no conserva el frame anterior
+        self.renderer.invalidate()
     
     def reset_game(self):
         """Reinicia el juego"""
@@ -394,16 +435,17 @@ class Game:
         
         self.level = 1
         self.player = Player(SCREEN_WIDTH // 2 - 25, SCREEN_HEIGHT - 80)
-        self.enemies = []  # Lista de enemigos (múltiples)
-        self.player_projectiles = []
-        self.enemy_projectiles = []
+        self._clear_enemies()
+        # Devolver al pool los proyectiles y efectos de la partida anterior
+        self._clear_pooled(self.player_projectiles)
+        self._clear_pooled(self.enemy_projectiles)
         self.math_problem = None
         self.feedback_text = ""
         self.feedback_timer = 0
         self.answer_cooldown = 0  # Cooldown entre respuestas (en frames)
         self.question_timer = 600  # Temporizador de 10 segundos (600 frames a 60 FPS)
         self.question_timer_max = 600  # Tiempo máximo en frames
-        self.explosions = []
+        self._clear_pooled(self.explosions)
         
         # Resetear sistema de combo
         self.combo_streak = 0
@@ -411,7 +453,7 @@ class Game:
         # Resetear feedback visual de borde
         self.answer_feedback_timer = 0
         self.answer_feedback_color = None
-        self.combo_effects = []
+        self._clear_pooled(self.combo_effects)
         
         # Mascota animada (robot que da ánimos)
         self.mascota = MascotaAnimada()
@@ -420,11 +462,41 @@ class Game:
         self.generate_problem()
         self.generate_space_objects()
     
+    # === OPTIMIZACIÓN: Pools de proyectiles, explosiones y efectos de combo ===
+    @staticmethod
+    def _retire(obj):
+        """Libera la fila de `obj` en su store (si es una entidad) y lo devuelve a su pool"""
+        if isinstance(obj, EntityView):
+            obj.detach()
+        release(obj)
+    
+    def _remove_pooled(self, items, obj):
+        """Quita `obj` de la colección (si sigue en ella) y lo devuelve a su pool"""
+        if items.discard(obj):
+            self._retire(obj)
+    
+    def _clear_pooled(self, items):
+        """Vacía la lista en sitio devolviendo cada objeto a su pool"""
+        for obj in items:
+            self._retire(obj)
+        items.clear()
+    
+    def _remove_enemy(self, enemy):
+        """Quita `enemy` (si sigue en juego) y libera su fila en Enemy.store"""
+        if self.enemies.discard(enemy):
+            enemy.detach()
+    
+    def _clear_enemies(self):
+        """Libera la fila de cada enemigo y empieza una oleada vacía"""
+        for enemy in self.enemies:
+            enemy.detach()
+        self.enemies = OrderedList()  # Enemigos (el orden decide el objetivo)
+    
     def generate_enemies(self):
         """Genera múltiples enemigos según el nivel actual"""
         config = LEVEL_CONFIG[self.level]
         num_enemies = ENEMIES_PER_LEVEL[self.level]
-        self.enemies = []
+        self._clear_enemies()
         
         # Distribuir enemigos horizontalmente
         spacing = SCREEN_WIDTH // (num_enemies + 1)
@@ -452,7 +524,7 @@ class Game:
         enemy_speed = wave_config["enemy_speed"]
         visual_level = wave_config["visual_level"]
         
-        self.enemies = []
+        self._clear_enemies()
         
         # Distribuir enemigos horizontalmente
         spacing = SCREEN_WIDTH // (num_enemies + 1)
@@ -478,6 +550,7 @@ class Game:
         self.space_objects = []
         
         # Deshabilitar objetos espaciales en web para mejor rendimiento
+        # (el movimiento del fondo lo da el starfield en paralaje)
         if IS_WEB:
             return
         
@@ -525,6 +598,14 @@ class Game:
         """Genera un nuevo problema matemático"""
         config = LEVEL_CONFIG[self.level]
         self.math_problem = MathProblem(config["num_range"])
+        # Contexto de la pregunta al mostrarla (entradas del modelo de tiempo):
+        # al responder, las correctas y las vidas ya habrán cambiado
+        self.question_context = (
+            self.math_problem.operation,
+            self.player.correct_answers,
+            self.player.lives,
+            self.level
+        )
         
         # En modo infinito, usar tiempo fijo de la oleada (calculado una vez por oleada)
         if self.modo_infinito and self.wave_time_max is not None:
@@ -575,6 +656,11 @@ class Game:
                     self.toggle_fullscreen()
                     continue
                 
+                # Tecla F3 para mostrar/ocultar el profiler de frames
+                if event.key == pygame.K_F3:
+                    self.profiler.toggle()
+                    continue
+                
                 # Tecla R para reiniciar el juego EN CUALQUIER MOMENTO
                 if event.key == pygame.K_r:
                     # Detener el sonido final antes de reiniciar
@@ -655,6 +741,7 @@ class Game:
                 if self.game_state == "level_intro":
                     if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
                         self.game_state = "playing"
+                        self.sound_manager.wait_for_sounds()
                         self.paused = False
                         # La música continúa desde el nivel anterior, no se reinicia
                     continue
@@ -848,7 +935,7 @@ class Game:
                     if target_enemy:
                         start_x = self.player.x + self.player.width // 2
                         start_y = self.player.y
-                        projectile = Projectile(
+                        projectile = Projectile.pool.acquire(
                             start_x, 
                             start_y, 
                             -8,
@@ -890,7 +977,7 @@ class Game:
                 enemy = random.choice(self.enemies)
                 start_x = enemy.x + enemy.width // 2
                 start_y = enemy.y + enemy.height
-                projectile = Projectile(
+                projectile = Projectile.pool.acquire(
                     start_x,
                     start_y,
                     8,
@@ -906,9 +993,15 @@ class Game:
         self._log_answer_result(operation, response_time, total_time, key_pressed)
         
         # Registrar respuesta en el sistema de tiempo adaptativo (modo infinito)
+        self._record_adaptive_time(response_time, self.math_problem.check_answer(operation))
+    
+    def _record_adaptive_time(self, response_time, fue_correcta):
+        """Pasa al tiempo adaptativo (modo infinito) el tiempo usado, con el
+        contexto que tenía la pregunta al mostrarse"""
         if self.modo_infinito and self.tiempo_adaptativo:
-            fue_correcta = self.math_problem.check_answer(operation)
-            self.tiempo_adaptativo.registrar_respuesta(response_time, fue_correcta)
+            self.tiempo_adaptativo.registrar_respuesta(
+                response_time, fue_correcta, *self.question_context
+            )
 
     def trigger_combo_attack(self):
         """Activa el ataque de combo masivo que daña a TODOS los enemigos"""
@@ -930,16 +1023,16 @@ class Game:
         
         # Crear efectos visuales
         # 1. Onda expansiva desde el jugador
-        shockwave = ComboShockwave(player_center_x, player_center_y)
+        shockwave = ComboShockwave.pool.acquire(player_center_x, player_center_y)
         self.combo_effects.append(shockwave)
         
         # 2. Explosión de partículas
-        particles = ComboParticleBurst(player_center_x, player_center_y)
+        particles = ComboParticleBurst.pool.acquire(player_center_x, player_center_y)
         self.combo_effects.append(particles)
         
         # 3. Texto de combo (más arriba para no tocar el panel del problema)
         text_y = SCREEN_HEIGHT // 2 - 120  # Subido para evitar la barra negra
-        combo_text = ComboTextPopup(SCREEN_WIDTH // 2, text_y)
+        combo_text = ComboTextPopup.pool.acquire(SCREEN_WIDTH // 2, text_y)
         self.combo_effects.append(combo_text)
         
         # 4. Dañar a TODOS los enemigos y crear rayos hacia cada uno
@@ -948,7 +1041,7 @@ class Game:
                 # Crear rayo hacia el enemigo
                 enemy_center_x = enemy.x + enemy.width // 2
                 enemy_center_y = enemy.y + enemy.height // 2
-                lightning = LightningBolt(
+                lightning = LightningBolt.pool.acquire(
                     player_center_x, player_center_y,
                     enemy_center_x, enemy_center_y
                 )
@@ -959,7 +1052,7 @@ class Game:
                 
                 # Crear explosión en el enemigo
                 from effects import Explosion
-                explosion = Explosion(enemy_center_x, enemy_center_y)
+                explosion = Explosion.pool.acquire(enemy_center_x, enemy_center_y)
                 self.explosions.append(explosion)
         
         # Sonido épico
@@ -976,7 +1069,7 @@ class Game:
 
 
     def _log_answer_result(self, operation, response_time, total_time, key_pressed):
-        """Registra datos de cada respuesta en resultados.json"""
+        """Registra datos de cada respuesta en resultados.jsonl"""
         try:
             # Manejar caso de timeout (operation puede ser None)
             signo_operacional = self.math_problem.operation if operation is not None else "TIMEOUT"
@@ -993,25 +1086,13 @@ class Game:
                 "numero_2": self.math_problem.num2,
                 "signo_operacional": signo_operacional,
                 "resultado_operacional": self.math_problem.answer,
+                "jugador": JUGADOR_ID,
             }
 
-            # Cargar datos existentes si el archivo ya existe
-            resultados = []
-            resultados_path = writable_path("resultados.json")
-            if os.path.exists(resultados_path):
-                with open(resultados_path, "r", encoding="utf-8") as f:
-                    try:
-                        resultados = json.load(f)
-                    except json.JSONDecodeError:
-                        resultados = []
-
-            resultados.append(entry)
-
-            # Guardar lista actualizada
-            with open(resultados_path, "w", encoding="utf-8") as f:
-                json.dump(resultados, f, ensure_ascii=False, indent=2)
+            # Solo se encola: el hilo del registro escribe en resultados.jsonl
+            self.answer_log.append(entry)
         except Exception as e:
-            print(f"Error al guardar resultados en resultados.json: {e}")
+            print(f"Error al registrar la respuesta: {e}")
     
     def handle_timeout(self):
         """Maneja cuando se acaba el tiempo para responder"""
@@ -1048,7 +1129,7 @@ class Game:
             # Crear proyectil dirigido al jugador
             start_x = enemy.x + enemy.width // 2
             start_y = enemy.y + enemy.height
-            projectile = Projectile(
+            projectile = Projectile.pool.acquire(
                 start_x,
                 start_y,
                 8,  # Velocidad
@@ -1063,6 +1144,10 @@ class Game:
         # Registrar resultado en archivo JSON (timeout = sin tecla presionada)
         self._log_answer_result(None, response_time, total_time, "TIMEOUT")
         
+        # El tiempo agotado NO entra en el tiempo adaptativo: es una
+        # observación censurada (el tiempo real sería mayor que el límite) y
+        # como residuo empujaría la corrección hacia arriba en cada fallo
+        
         # NO reducir vida aquí - solo cuando el proyectil golpee al jugador
     
     def update_menu_simulation(self):
@@ -1074,10 +1159,9 @@ class Game:
         # Mantener jugador en pantalla
         self.player.x = max(0, min(SCREEN_WIDTH - self.player.width, self.player.x))
         
-        # Actualizar enemigos (movimiento normal)
+        # Actualizar enemigos (movimiento normal, en bloque)
+        Enemy.update_all(self.enemies)
         for enemy in self.enemies:
-            enemy.update()
-            
             # Si tocan los bordes, cambiar dirección
             if enemy.x <= 0 or enemy.x >= SCREEN_WIDTH - enemy.width:
                 enemy.speed *= -1
@@ -1093,7 +1177,7 @@ class Game:
         # Jugador dispara automáticamente cada 25 frames (MÁS RÁPIDO)
         if self.menu_shoot_timer % 25 == 0 and self.enemies:
             target_enemy = random.choice(self.enemies)
-            projectile = Projectile(
+            projectile = Projectile.pool.acquire(
                 self.player.x + self.player.width // 2,
                 self.player.y,
                 -12,  # Más rápido
@@ -1106,7 +1190,7 @@ class Game:
         # Enemigos disparan aleatoriamente cada 40 frames (MÁS FRECUENTE)
         if self.menu_shoot_timer % 40 == 0 and self.enemies:
             shooter = random.choice(self.enemies)
-            projectile = Projectile(
+            projectile = Projectile.pool.acquire(
                 shooter.x + shooter.width // 2,
                 shooter.y + shooter.height,
                 10,  # Más rápido
@@ -1118,57 +1202,52 @@ class Game:
             self.menu_projectiles.append(projectile)
         
         # Actualizar proyectiles del menú
-        for projectile in self.menu_projectiles[:]:
-            projectile.update()
-            
+        self.enemy_grid.rebuild(self.enemies)
+        player_rect = self.player.get_rect()
+        off_screen = Projectile.update_all(self.menu_projectiles)
+        for projectile, gone in zip(self.menu_projectiles, off_screen):
             # Verificar colisiones con enemigos (proyectiles del jugador)
             if projectile.is_player_shot:
-                for enemy in self.enemies[:]:
-                    if projectile.get_rect().colliderect(
-                        pygame.Rect(enemy.x, enemy.y, enemy.width, enemy.height)
-                    ):
-                        # Crear explosión GRANDE
-                        self.menu_explosions.append(Explosion(
-                            enemy.x + enemy.width // 2,
-                            enemy.y + enemy.height // 2
-                        ))
-                        # SCREEN SHAKE en explosión
-                        self.menu_screen_shake = 15
-                        self.menu_shake_intensity = 8
-                        # Remover proyectil
-                        if projectile in self.menu_projectiles:
-                            self.menu_projectiles.remove(projectile)
-                        # Dañar enemigo
-                        enemy.take_damage()
-                        if enemy.is_dead():
-                            self.enemies.remove(enemy)
-                            # Explosión extra al morir
-                            self.menu_screen_shake = 25
-                            self.menu_shake_intensity = 15
-                        break
+                enemy = self.enemy_grid.first_hit(projectile.get_rect())
+                if enemy is not None:
+                    # Crear explosión GRANDE
+                    self.menu_explosions.append(Explosion.pool.acquire(
+                        enemy.x + enemy.width // 2,
+                        enemy.y + enemy.height // 2
+                    ))
+                    # SCREEN SHAKE en explosión
+                    self.menu_screen_shake = 15
+                    self.menu_shake_intensity = 8
+                    # Remover proyectil
+                    self._remove_pooled(self.menu_projectiles, projectile)
+                    # Dañar enemigo
+                    enemy.take_damage()
+                    if enemy.is_dead():
+                        self._remove_enemy(enemy)
+                        self.enemy_grid.remove(enemy)
+                        # Explosión extra al morir
+                        self.menu_screen_shake = 25
+                        self.menu_shake_intensity = 15
             
             # Verificar colisión con jugador (proyectiles enemigos) - solo visual, sin daño
             elif not projectile.is_player_shot:
-                if projectile.get_rect().colliderect(
-                    pygame.Rect(self.player.x, self.player.y, self.player.width, self.player.height)
-                ):
+                if projectile.get_rect().colliderect(player_rect):
                     # Explosión visual pequeña
-                    self.menu_explosions.append(Explosion(
+                    self.menu_explosions.append(Explosion.pool.acquire(
                         self.player.x + self.player.width // 2,
                         self.player.y + self.player.height // 2
                     ))
-                    if projectile in self.menu_projectiles:
-                        self.menu_projectiles.remove(projectile)
+                    self._remove_pooled(self.menu_projectiles, projectile)
             
             # Eliminar proyectiles fuera de pantalla
-            if projectile.is_off_screen() and projectile in self.menu_projectiles:
-                self.menu_projectiles.remove(projectile)
+            if gone:
+                self._remove_pooled(self.menu_projectiles, projectile)
         
         # Actualizar explosiones del menú
-        for explosion in self.menu_explosions[:]:
+        for explosion in self.menu_explosions:
             explosion.update()
             if explosion.is_dead():
-                self.menu_explosions.remove(explosion)
+                self._remove_pooled(self.menu_explosions, explosion)
         
         # Regenerar enemigos si hay muy pocos (para mantener la acción)
         if len(self.enemies) < 2:
@@ -1193,6 +1272,7 @@ class Game:
             symbol.update()
         
         # Actualizar objetos espaciales (estrellas, planetas)
+        self.starfield.update()
         for obj in self.space_objects:
             obj.update()
             
@@ -1228,24 +1308,28 @@ class Game:
         
         # Actualizar introducción de nivel
         if self.game_state == "level_intro":
+            # Preparar en segundo plano el fondo del siguiente nivel
+            self.backgrounds.prefetch(self.level + 1, self.screen.get_size())
             self.level_intro_timer -= 1
             if self.level_intro_timer <= 0:
                 self.game_state = "playing"
+                # Acierto/error deben sonar desde la primera respuesta
+                self.sound_manager.wait_for_sounds()
                 # La música continúa desde el nivel anterior, no se reinicia
             return
         # Actualizar pre-victoria (animación de celebración)
         if self.game_state == "pre_victory":
             # Actualizar explosiones restantes
-            for explosion in self.explosions[:]:
+            for explosion in self.explosions:
                 explosion.update()
                 if explosion.is_dead():
-                    self.explosions.remove(explosion)
+                    self._remove_pooled(self.explosions, explosion)
             
             # Actualizar efectos de combo
-            for effect in self.combo_effects[:]:
+            for effect in self.combo_effects:
                 effect.update()
                 if effect.is_dead():
-                    self.combo_effects.remove(effect)
+                    self._remove_pooled(self.combo_effects, effect)
             
             # Actualizar celebración de victoria
             if self.victory_celebration:
@@ -1279,23 +1363,23 @@ class Game:
         # Actualizar mascota animada
         self.mascota.update()
         
-        # Actualizar enemigos
-        for enemy in self.enemies[:]:
-            enemy.update()
+        # Actualizar enemigos (movimiento y cooldowns en bloque)
+        Enemy.update_all(self.enemies)
+        for enemy in self.enemies:
             if enemy.is_dead():
                 # Crear explosión final si no se creó antes
-                explosion = Explosion(
+                explosion = Explosion.pool.acquire(
                     enemy.x + enemy.width // 2,
                     enemy.y + enemy.height // 2
                 )
                 self.explosions.append(explosion)
                 
                 # Remover enemigo
-                self.enemies.remove(enemy)
+                self._remove_enemy(enemy)
                 
                 # Verificar si todos murieron
                 if len(self.enemies) == 0:
-                    self.player_projectiles.clear()
+                    self._clear_pooled(self.player_projectiles)
                     
                     if self.modo_infinito and self.infinite_mode:
                         # Regenerar en modo infinito con dificultad escalable
@@ -1334,20 +1418,21 @@ class Game:
                                 self.sound_manager.play_sound('win', 1.0, self.sound_volume)
         
         # Actualizar objetos espaciales
+        self.starfield.update()
         for obj in self.space_objects:
             obj.update()
         
         # Actualizar explosiones
-        for explosion in self.explosions[:]:
+        for explosion in self.explosions:
             explosion.update()
             if explosion.is_dead():
-                self.explosions.remove(explosion)
+                self._remove_pooled(self.explosions, explosion)
         
         # Actualizar efectos de combo
-        for effect in self.combo_effects[:]:
+        for effect in self.combo_effects:
             effect.update()
             if effect.is_dead():
-                self.combo_effects.remove(effect)
+                self._remove_pooled(self.combo_effects, effect)
         
         # Actualizar screen shake
         if self.screen_shake > 0:
@@ -1364,8 +1449,9 @@ class Game:
         # Actualizar indicador de combo
         self.combo_indicator.update(self.combo_streak)
         
-        # Actualizar proyectiles del jugador
-        for projectile in self.player_projectiles[:]:
+        # Actualizar proyectiles del jugador (SwapList: se puede quitar mientras se recorre)
+        self.enemy_grid.rebuild(self.enemies)
+        for projectile in self.player_projectiles:
             # Si el proyectil tenía un objetivo que ya murió, redirigirlo a otro enemigo
             if projectile.is_player_shot and projectile.target_enemy:
                 if projectile.target_enemy.is_dead() or projectile.target_enemy not in self.enemies:
@@ -1374,28 +1460,24 @@ class Game:
                         projectile.target_enemy = random.choice(self.enemies)
                     else:
                         # No hay enemigos, eliminar proyectil
-                        self.player_projectiles.remove(projectile)
-                        continue
-            
-            projectile.update()
-            
-            # Colisión con enemigos
-            hit_enemy = None
-            for enemy in self.enemies:
-                if projectile.get_rect().colliderect(
-                    pygame.Rect(enemy.x, enemy.y, enemy.width, enemy.height)
-                ):
-                    enemy.take_damage()
-                    hit_enemy = enemy
-                    if projectile in self.player_projectiles:
-                        self.player_projectiles.remove(projectile)
-                    self.sound_manager.play_sound('hit', 0.8, self.sound_volume)  # Volumen alto para sonido explosivo
-                    break
+                        self._remove_pooled(self.player_projectiles, projectile)
+        
+        # Guiado y movimiento en bloque; luego colisiones una a una
+        off_screen = Projectile.update_all(self.player_projectiles)
+        for projectile, gone in zip(self.player_projectiles, off_screen):
+            # Colisión con enemigos (la oleada nueva reemplaza la lista: reconstruir)
+            if self.enemy_grid.source is not self.enemies:
+                self.enemy_grid.rebuild(self.enemies)
+            hit_enemy = self.enemy_grid.first_hit(projectile.get_rect())
+            if hit_enemy is not None:
+                hit_enemy.take_damage()
+                self._remove_pooled(self.player_projectiles, projectile)
+                self.sound_manager.play_sound('hit', 0.8, self.sound_volume)  # Volumen alto para sonido explosivo
             
             # Verificar si algún enemigo fue derrotado
             if hit_enemy and hit_enemy.is_dead():
                 # Crear explosión
-                explosion = Explosion(
+                explosion = Explosion.pool.acquire(
                     hit_enemy.x + hit_enemy.width // 2,
                     hit_enemy.y + hit_enemy.height // 2
                 )
@@ -1403,13 +1485,13 @@ class Game:
                 self.sound_manager.play_sound('explosion', 0.4, self.sound_volume)
                 
                 # Remover enemigo
-                if hit_enemy in self.enemies:
-                    self.enemies.remove(hit_enemy)
+                self._remove_enemy(hit_enemy)
+                self.enemy_grid.remove(hit_enemy)
                 
                 # Si todos los enemigos fueron derrotados
                 if len(self.enemies) == 0:
                     # Limpiar proyectiles restantes
-                    self.player_projectiles.clear()
+                    self._clear_pooled(self.player_projectiles)
                     
                     if self.modo_infinito and self.infinite_mode:
                         # Modo infinito: regenerar con dificultad escalable
@@ -1420,7 +1502,7 @@ class Game:
                         self._calculate_wave_time()  # Calcular tiempo ML una vez para toda la oleada
                         # Limpiar combo streak y efectos para evitar que ataquen en vacio
                         self.combo_streak = 0
-                        self.combo_effects = []
+                        self._clear_pooled(self.combo_effects)
                         self.generate_enemies_infinite(wave_config)
                         self.generate_problem()
                         self.generate_space_objects()
@@ -1433,7 +1515,7 @@ class Game:
                             self.level_intro_timer = 180
                             # Limpiar combo streak y efectos para evitar que ataquen en vacio
                             self.combo_streak = 0
-                            self.combo_effects = []
+                            self._clear_pooled(self.combo_effects)
                             self.generate_enemies()
                             self.generate_problem()
                             self.generate_space_objects()
@@ -1463,28 +1545,23 @@ class Game:
             
             # Eliminar proyectiles fuera de pantalla solo si no tienen objetivo válido
             if projectile in self.player_projectiles:
-                if projectile.is_off_screen():
+                if gone:
                     # Si está fuera de pantalla pero tiene objetivo, mantenerlo (puede volver)
                     if not (projectile.is_player_shot and projectile.target_enemy and 
                            projectile.target_enemy in self.enemies):
-                        self.player_projectiles.remove(projectile)
+                        self._remove_pooled(self.player_projectiles, projectile)
         
-        # Actualizar proyectiles del enemigo
-        for projectile in self.enemy_projectiles[:]:
-            # Si el proyectil tiene objetivo (jugador), actualizar dirección
-            if not projectile.is_player_shot and projectile.target_player:
-                # El proyectil ya se actualiza automáticamente hacia el jugador en update()
-                pass
-            
-            projectile.update()
-            
+        # Actualizar proyectiles del enemigo (en bloque; la dirección hacia el
+        # jugador se calculó al dispararlos)
+        off_screen = Projectile.update_all(self.enemy_projectiles)
+        
+        # Colisiones con el jugador en bloque (un solo rect contra todos)
+        hits = set(hits_on(self.player.get_rect(), self.enemy_projectiles))
+        for index, projectile in enumerate(self.enemy_projectiles):
             # Colisión con el jugador
-            if projectile.get_rect().colliderect(
-                pygame.Rect(self.player.x, self.player.y, self.player.width, self.player.height)
-            ):
+            if index in hits:
                 self.player.take_damage()
-                if projectile in self.enemy_projectiles:
-                    self.enemy_projectiles.remove(projectile)
+                self._remove_pooled(self.enemy_projectiles, projectile)
                 self.sound_manager.play_sound('hit', 0.8, self.sound_volume)  # Volumen alto para sonido explosivo
                 # Reproducir sonido de daño cuando recibe impacto
                 self.sound_manager.play_sound('damage', 0.5, self.sound_volume)
@@ -1494,10 +1571,9 @@ class Game:
                     self.sound_manager.stop_background_music()
             
             # Eliminar proyectiles fuera de pantalla solo si no tienen objetivo
-            elif projectile.is_off_screen():
+            elif off_screen[index]:
                 if not (not projectile.is_player_shot and projectile.target_player):
-                    if projectile in self.enemy_projectiles:
-                        self.enemy_projectiles.remove(projectile)
+                    self._remove_pooled(self.enemy_projectiles, projectile)
         
         # Actualizar feedback
         if self.feedback_timer > 0:
@@ -1537,7 +1613,7 @@ class Game:
         self.screen.blit(timer_bg, (timer_bar_x - 5, timer_bar_y - 5))
         
         # Etiqueta "TIEMPO"
-        time_label = self.font_tiny.render("TIEMPO", True, CYAN)
+        time_label = render_text(self.font_tiny, "TIEMPO", True, CYAN)
         self.screen.blit(time_label, (timer_bar_x, timer_bar_y - 3))
         
         # Fondo de la barra de tiempo
@@ -1585,8 +1661,8 @@ class Game:
         
         # Texto del tiempo restante
         if self.answer_cooldown == 0:  # Solo mostrar si no hay cooldown activo
-            time_text = self.font_small.render(f"{time_remaining:.1f}s", True, WHITE)
-            time_text_shadow = self.font_small.render(f"{time_remaining:.1f}s", True, BLACK)
+            time_text = render_text(self.font_small, f"{time_remaining:.1f}s", True, WHITE)
+            time_text_shadow = render_text(self.font_small, f"{time_remaining:.1f}s", True, BLACK)
             time_text_rect = time_text.get_rect(center=(timer_bar_x + timer_bar_width // 2, timer_bar_y + 27))
             self.screen.blit(time_text_shadow, (time_text_rect.x + 1, time_text_rect.y + 1))
             self.screen.blit(time_text, time_text_rect)
@@ -1601,7 +1677,7 @@ class Game:
             self.screen.blit(mode_bg, (timer_bar_x - 5, infinite_y))
             
             # Texto del modo
-            mode_text = self.font_tiny.render("⚡ MODO INFINITO", True, PINK)
+            mode_text = render_text(self.font_tiny, "⚡ MODO INFINITO", True, PINK)
             self.screen.blit(mode_text, (timer_bar_x, infinite_y + 4))
 
         
@@ -1683,8 +1759,8 @@ class Game:
             pre_question = parts[0]
             
             # Renderizar parte antes del "?"
-            pre_text = self.font_large.render(pre_question, True, YELLOW)
-            pre_shadow = self.font_large.render(pre_question, True, BLACK)
+            pre_text = render_text(self.font_large, pre_question, True, YELLOW)
+            pre_shadow = render_text(self.font_large, pre_question, True, BLACK)
             
             # Calcular posición centrada
             total_width = pre_text.get_width()
@@ -1699,8 +1775,8 @@ class Game:
             q_b = int(255)
             question_color = (q_r, q_g, q_b)
             
-            question_text = self.font_large.render("?", True, question_color)
-            question_shadow = self.font_large.render("?", True, (0, 0, 0))
+            question_text = render_text(self.font_large, "?", True, question_color)
+            question_shadow = render_text(self.font_large, "?", True, (0, 0, 0))
             
             # Escalar el "?"
             q_width = int(question_text.get_width() * question_scale)
@@ -1715,8 +1791,8 @@ class Game:
             post_text = None
             if len(parts) > 1:
                 post_question = parts[1]
-                post_text = self.font_large.render(post_question, True, YELLOW)
-                post_shadow = self.font_large.render(post_question, True, BLACK)
+                post_text = render_text(self.font_large, post_question, True, YELLOW)
+                post_shadow = render_text(self.font_large, post_question, True, BLACK)
                 total_width += post_text.get_width()
             
             # Dibujar glow detrás del "?"
@@ -1750,8 +1826,8 @@ class Game:
                 self.screen.blit(post_text, (post_x, y_pos))
         else:
             # Fallback si no hay "?"
-            problem_text = self.font_large.render(problem_str, True, YELLOW)
-            problem_shadow = self.font_large.render(problem_str, True, BLACK)
+            problem_text = render_text(self.font_large, problem_str, True, YELLOW)
+            problem_shadow = render_text(self.font_large, problem_str, True, BLACK)
             problem_rect = problem_text.get_rect(center=(SCREEN_WIDTH // 2, problem_y_offset + 30))
             self.screen.blit(problem_shadow, (problem_rect.x + 2, problem_rect.y + 2))
             self.screen.blit(problem_text, problem_rect)
@@ -1762,7 +1838,7 @@ class Game:
             # Mostrar mensaje de espera cuando hay cooldown
             wait_time = (self.answer_cooldown / FPS)  # Tiempo restante en segundos
             instructions = f"Espera {wait_time:.1f}s para responder..."
-            inst_text = self.font_small.render(instructions, True, ORANGE)
+            inst_text = render_text(self.font_small, instructions, True, ORANGE)
             inst_rect = inst_text.get_rect(center=(SCREEN_WIDTH // 2, problem_y_offset + 65))
             self.screen.blit(inst_text, inst_rect)
         else:
@@ -1802,7 +1878,7 @@ class Game:
                 
                 # Símbolo de operación - Texto Grande
                 text_color = BLACK if color in [YELLOW, GREEN] else WHITE
-                op_surf = self.font_large.render(op, True, text_color)
+                op_surf = render_text(self.font_large, op, True, text_color)
                 op_rect = op_surf.get_rect(center=btn_rect.center)
                 self.screen.blit(op_surf, op_rect)
                 
@@ -1817,7 +1893,7 @@ class Game:
                 pygame.draw.circle(self.screen, WHITE, (marker_x, marker_y), marker_radius, 2)
                 
                 # Letra de la tecla
-                key_surf = self.font_small.render(key, True, WHITE)
+                key_surf = render_text(self.font_small, key, True, WHITE)
                 key_rect = key_surf.get_rect(center=(marker_x, marker_y))
                 self.screen.blit(key_surf, key_rect)
         
@@ -1870,8 +1946,8 @@ class Game:
             ]
         
         for i, (label, value, color) in enumerate(stats):
-            label_text = self.font_tiny.render(f"{label}:", True, WHITE)
-            value_text = self.font_small.render(value, True, color)
+            label_text = render_text(self.font_tiny, f"{label}:", True, WHITE)
+            value_text = render_text(self.font_small, value, True, color)
             self.screen.blit(label_text, (15, stats_y + i * 22))
             self.screen.blit(value_text, (120, stats_y + i * 22))
         
@@ -1888,7 +1964,7 @@ class Game:
         self.screen.blit(lives_panel, (SCREEN_WIDTH - 185, 5))
         
         # Etiqueta "VIDAS" al lado de los corazones
-        lives_label = self.font_tiny.render("VIDAS", True, WHITE)
+        lives_label = render_text(self.font_tiny, "VIDAS", True, WHITE)
         self.screen.blit(lives_label, (SCREEN_WIDTH - 180, 12))
         
         for i in range(5):
@@ -1930,7 +2006,7 @@ class Game:
         #     scale = 1.0 + (abs(15 - self.feedback_timer) / 15.0) * 0.3
         #     
         #     # Sombra del texto
-        #     feedback_shadow = self.font_medium.render(
+        #     feedback_shadow = render_text(self.font_medium, 
         #         self.feedback_text, True, BLACK
         #     )
         #     shadow_rect = feedback_shadow.get_rect(
@@ -1939,7 +2015,7 @@ class Game:
         #     self.screen.blit(feedback_shadow, shadow_rect)
         #     
         #     # Texto principal
-        #     feedback_surface = self.font_medium.render(
+        #     feedback_surface = render_text(self.font_medium, 
         #         self.feedback_text, True, self.feedback_color
         #     )
         #     feedback_rect = feedback_surface.get_rect(
@@ -1979,18 +2055,18 @@ class Game:
         
         if self.game_state == "win":
             # Efecto de victoria
-            text = self.font_large.render("¡GANASTE!", True, GREEN)
-            text_shadow = self.font_large.render("¡GANASTE!", True, BLACK)
-            subtitle = self.font_medium.render("¡Felicitaciones!", True, YELLOW)
-            score_text = self.font_medium.render(
+            text = render_text(self.font_large, "¡GANASTE!", True, GREEN)
+            text_shadow = render_text(self.font_large, "¡GANASTE!", True, BLACK)
+            subtitle = render_text(self.font_medium, "¡Felicitaciones!", True, YELLOW)
+            score_text = render_text(self.font_medium, 
                 f"Puntaje Final: {self.player.score}", True, GOLD
             )
         else:
             # Efecto de derrota
-            text = self.font_large.render("PERDISTE", True, RED)
-            text_shadow = self.font_large.render("PERDISTE", True, BLACK)
-            subtitle = self.font_medium.render("Mejor suerte la próxima", True, ORANGE)
-            score_text = self.font_medium.render(
+            text = render_text(self.font_large, "PERDISTE", True, RED)
+            text_shadow = render_text(self.font_large, "PERDISTE", True, BLACK)
+            subtitle = render_text(self.font_medium, "Mejor suerte la próxima", True, ORANGE)
+            score_text = render_text(self.font_medium, 
                 f"Puntaje Final: {self.player.score}", True, YELLOW
             )
         
@@ -2010,14 +2086,14 @@ class Game:
             f"Respuestas Incorrectas: {self.player.incorrect_answers}"
         ]
         for i, stat in enumerate(stats_final):
-            stat_text = self.font_small.render(stat, True, CYAN)
+            stat_text = render_text(self.font_small, stat, True, CYAN)
             stat_rect = stat_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60 + i * 25))
             self.screen.blit(stat_text, stat_rect)
         
-        restart_text = self.font_medium.render(
+        restart_text = render_text(self.font_medium, 
             "Presiona R para reiniciar", True, WHITE
         )
-        restart_shadow = self.font_medium.render(
+        restart_shadow = render_text(self.font_medium, 
             "Presiona R para reiniciar", True, BLACK
         )
         restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 130))
@@ -2025,10 +2101,10 @@ class Game:
         self.screen.blit(restart_text, restart_rect)
         
         # Opción de volver al menú
-        menu_text = self.font_medium.render(
+        menu_text = render_text(self.font_medium, 
             "Presiona ESC para Menú", True, WHITE
         )
-        menu_shadow = self.font_medium.render(
+        menu_shadow = render_text(self.font_medium, 
             "Presiona ESC para Menú", True, BLACK
         )
         menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 170))
@@ -2044,8 +2120,8 @@ class Game:
         self.screen.blit(overlay, (0, 0))
         
         # Título grande
-        title = self.font_large.render("¡MISIÓN CUMPLIDA!", True, GOLD)
-        title_shadow = self.font_large.render("¡MISIÓN CUMPLIDA!", True, BLACK)
+        title = render_text(self.font_large, "¡MISIÓN CUMPLIDA!", True, GOLD)
+        title_shadow = render_text(self.font_large, "¡MISIÓN CUMPLIDA!", True, BLACK)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120))
         
         # Efecto de pulso en el título
@@ -2054,7 +2130,7 @@ class Game:
         scaled_h = int(title_rect.height * pulse)
         
         # Subtítulo
-        subtitle = self.font_medium.render("¡Has completado todos los niveles!", True, GREEN)
+        subtitle = render_text(self.font_medium, "¡Has completado todos los niveles!", True, GREEN)
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
         
         # Dibujar textos
@@ -2067,8 +2143,8 @@ class Game:
         pygame.draw.rect(score_panel, (0, 0, 0, 100), (0, 0, 400, 100), border_radius=20)
         pygame.draw.rect(score_panel, GOLD, (0, 0, 400, 100), 3, border_radius=20)
         
-        score_text = self.font_large.render(f"{self.player.score}", True, WHITE)
-        score_label = self.font_medium.render("PUNTAJE FINAL", True, YELLOW)
+        score_text = render_text(self.font_large, f"{self.player.score}", True, WHITE)
+        score_label = render_text(self.font_medium, "PUNTAJE FINAL", True, YELLOW)
         
         score_rect = score_text.get_rect(center=(200, 60))
         label_rect = score_label.get_rect(center=(200, 25))
@@ -2079,7 +2155,8 @@ class Game:
         self.screen.blit(score_panel, (SCREEN_WIDTH // 2 - 200, SCREEN_HEIGHT // 2))
         
         # Instrucciones
-        back_text = self.font_medium.render("Presiona R para reiniciar o ENTER/ESC para volver al Menú", True, CYAN)
+        # Copia: la superficie de la caché es compartida y aquí se le cambia el alpha
+        back_text = render_text(self.font_medium, "Presiona R para reiniciar o ENTER/ESC para volver al Menú", True, CYAN).copy()
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 150))
         
         # Parpadeo suave
@@ -2088,40 +2165,38 @@ class Game:
         
         self.screen.blit(back_text, back_rect)
     
-    def _cache_all_backgrounds(self):
-        """Prerenderiza los fondos de todos los niveles para mejor rendimiento"""
-        level_configs = {
-            1: (L1_BG_START, L1_BG_END, L1_STAR),
-            2: (L2_BG_START, L2_BG_END, L2_STAR),
-            3: (L3_BG_START, L3_BG_END, L3_STAR),
-        }
-        
-        for level, (bg_start, bg_end, star_color) in level_configs.items():
-            # Crear surface para este nivel
-            bg_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            
-            # Dibujar gradiente vertical (solo una vez)
-            for y in range(SCREEN_HEIGHT):
-                progress = y / SCREEN_HEIGHT
-                r = int(bg_start[0] + (bg_end[0] - bg_start[0]) * progress)
-                g = int(bg_start[1] + (bg_end[1] - bg_start[1]) * progress)
-                b = int(bg_start[2] + (bg_end[2] - bg_start[2]) * progress)
-                pygame.draw.line(bg_surface, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-            
-            # Dibujar estrellas con colores del nivel
-            for x, y, size, brightness in self.stars:
-                color = (
-                    min(255, int(star_color[0] * brightness / 255)),
-                    min(255, int(star_color[1] * brightness / 255)),
-                    min(255, int(star_color[2] * brightness / 255))
-                )
-                pygame.draw.circle(bg_surface, color, (x, y), size)
-                if size >= 2:
-                    pygame.draw.circle(bg_surface, WHITE, (x, y), 1)
-            
-            self.cached_backgrounds[level] = bg_surface
-        
-        print("✓ Fondos cacheados para optimización de rendimiento")
+    # === OPTIMIZACIÓN: Screen shake sin allocations por frame ===
+    def _get_shake_offset(self, shake_frames, intensity):
+        """Desplazamiento aleatorio de cámara mientras dura el shake"""
+        if shake_frames <= 0:
+            return (0, 0)
+        intensity = int(intensity)
+        return (random.randint(-intensity, intensity), random.randint(-intensity, intensity))
+    
+    def _begin_shake_layer(self, shake_offset):
+        """
+        Devuelve la superficie donde dibujar la capa que tiembla.
+        Sin shake se dibuja directo en pantalla; con shake se copia el fondo
+        actual al back buffer persistente (creado una sola vez).
+        """
+        if shake_offset == (0, 0):
+            return self.screen
+        if self.shake_buffer is None or self.shake_buffer.get_size() != self.screen.get_size():
+            self.shake_buffer = pygame.Surface(self.screen.get_size()).convert()
+        self.shake_buffer.blit(self.screen, (0, 0))
+        return self.shake_buffer
+    
+    def _end_shake_layer(self, layer, shake_offset):
+        """Presenta la capa con el offset de cámara aplicado"""
+        if layer is not self.screen:
+            self.screen.blit(layer, shake_offset)
+    
+    def _get_flash_overlay(self):
+        """Overlay del screen flash (se crea una sola vez, el alpha se ajusta por frame)"""
+        if self.flash_overlay is None or self.flash_overlay.get_size() != self.screen.get_size():
+            self.flash_overlay = pygame.Surface(self.screen.get_size()).convert()
+            self.flash_overlay.fill((255, 255, 200))
+        return self.flash_overlay
     
     def draw_background(self):
         """Dibuja el fondo usando cache prerenderizado (OPTIMIZADO)"""
@@ -2131,8 +2206,10 @@ class Game:
             level_for_bg = 1
         
         # Usar fondo cacheado (mucho más rápido)
-        if level_for_bg in self.cached_backgrounds:
-            self.screen.blit(self.cached_backgrounds[level_for_bg], (0, 0))
+        background = self.backgrounds.get(level_for_bg, self.screen.get_size())
+        if background is not None:
+            self.screen.blit(background, (0, 0))
+        self.starfield.draw(self.screen, level_for_bg)
         
         # Dibujar objetos espaciales (estos sí se mueven)
         for obj in self.space_objects:
@@ -2300,9 +2377,9 @@ class Game:
     
     def draw_menu(self):
         """Dibuja la pantalla de menú principal con diseño moderno y animación dinámica"""
-        # Crear buffer para screen shake
-        menu_buffer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        menu_buffer.blit(self.screen, (0, 0))  # Copiar fondo actual
+        # Screen shake: solo se usa el back buffer mientras hay temblor
+        shake_offset = self._get_shake_offset(self.menu_screen_shake, self.menu_shake_intensity)
+        menu_buffer = self._begin_shake_layer(shake_offset)
         
         # === CAPA 1: POLVO CÓSMICO (más lejano, parallax lento) ===
         for particle in self.menu_particles:
@@ -2336,14 +2413,7 @@ class Game:
                 particle.draw(menu_buffer)
         
         # === APLICAR SCREEN SHAKE ===
-        shake_x = 0
-        shake_y = 0
-        if self.menu_screen_shake > 0:
-            shake_x = random.randint(-int(self.menu_shake_intensity), int(self.menu_shake_intensity))
-            shake_y = random.randint(-int(self.menu_shake_intensity), int(self.menu_shake_intensity))
-        
-        # Blitear el buffer con el shake offset
-        self.screen.blit(menu_buffer, (shake_x, shake_y))
+        self._end_shake_layer(menu_buffer, shake_offset)
         
         # (Panel oscuro eliminado - los botones ya tienen su propio estilo glassmorphism)
         
@@ -2351,12 +2421,12 @@ class Game:
         title_text = "OPERACIÓN RELÁMPAGO"
         
         # Sombra suave del título
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0, 100))
+        title_shadow = render_text(self.font_large, title_text, True, (0, 0, 0, 100))
         title_rect = title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 3, 103))
         self.screen.blit(title_shadow, title_rect)
         
         # Título principal con gradiente (simulado)
-        title_surface = self.font_large.render(title_text, True, YELLOW)
+        title_surface = render_text(self.font_large, title_text, True, YELLOW)
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 100))
         self.screen.blit(title_surface, title_rect)
         
@@ -2369,8 +2439,8 @@ class Game:
         self.screen.blit(glow_surface, (title_rect.x - 10, title_rect.y - 10))
         
         # Subtítulo elegante
-        subtitle = self.font_medium.render("Juego Educativo de Matemáticas", True, CYAN)
-        subtitle_shadow = self.font_medium.render("Juego Educativo de Matemáticas", True, (0, 0, 0, 150))
+        subtitle = render_text(self.font_medium, "Juego Educativo de Matemáticas", True, CYAN)
+        subtitle_shadow = render_text(self.font_medium, "Juego Educativo de Matemáticas", True, (0, 0, 0, 150))
         subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 170))
         self.screen.blit(subtitle_shadow, (subtitle_rect.x + 1, subtitle_rect.y + 1))
         self.screen.blit(subtitle, subtitle_rect)
@@ -2399,7 +2469,7 @@ class Game:
         
         # Decoración elegante
         if self.menu_blink < 30:
-            star_text = self.font_small.render("✦", True, GOLD)
+            star_text = render_text(self.font_small, "✦", True, GOLD)
             for i in range(3):
                 x = SCREEN_WIDTH // 2 - 150 + i * 150
                 y = 250
@@ -2470,8 +2540,8 @@ class Game:
         """Dibuja la pantalla de controles con diseño moderno glassmorphism espacial"""
         # === TÍTULO CON EFECTO NEÓN ===
         title_text = "CONTROLES"
-        title_surface = self.font_large.render(title_text, True, CYAN)
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
+        title_surface = render_text(self.font_large, title_text, True, CYAN)
+        title_shadow = render_text(self.font_large, title_text, True, (0, 0, 0))
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 55))
         
         # Glow del título
@@ -2519,7 +2589,7 @@ class Game:
         
         # Header de sección
         header_text = "⌨ CONTROLES DE JUEGO"
-        header_surface = self.font_medium.render(header_text, True, GOLD)
+        header_surface = render_text(self.font_medium, header_text, True, GOLD)
         header_rect = header_surface.get_rect(center=(SCREEN_WIDTH // 2, section_y))
         self.screen.blit(header_surface, header_rect)
         
@@ -2566,17 +2636,17 @@ class Game:
             self.screen.blit(key_surface, (x, keys_y))
             
             # Letra de la tecla
-            key_text = self.font_medium.render(key, True, WHITE)
+            key_text = render_text(self.font_medium, key, True, WHITE)
             key_text_rect = key_text.get_rect(center=(x + key_size // 2, keys_y + key_size // 2 - 5))
             self.screen.blit(key_text, key_text_rect)
             
             # Símbolo de operación debajo
-            symbol_text = self.font_medium.render(symbol, True, color)
+            symbol_text = render_text(self.font_medium, symbol, True, color)
             symbol_rect = symbol_text.get_rect(center=(x + key_size // 2, keys_y + key_size + 20))
             self.screen.blit(symbol_text, symbol_rect)
             
             # Etiqueta
-            label_text = self.font_tiny.render(label, True, color)
+            label_text = render_text(self.font_tiny, label, True, color)
             label_rect = label_text.get_rect(center=(x + key_size // 2, keys_y + key_size + 42))
             self.screen.blit(label_text, label_rect)
         
@@ -2584,7 +2654,7 @@ class Game:
         nav_y = keys_y + key_size + 70
         
         nav_header = "🎮 NAVEGACIÓN"
-        nav_surface = self.font_medium.render(nav_header, True, GOLD)
+        nav_surface = render_text(self.font_medium, nav_header, True, GOLD)
         nav_rect = nav_surface.get_rect(center=(SCREEN_WIDTH // 2, nav_y))
         self.screen.blit(nav_surface, nav_rect)
         
@@ -2614,12 +2684,12 @@ class Game:
             self.screen.blit(card, (cx - card_width // 2, nav_card_y))
             
             # Tecla
-            key_surf = self.font_small.render(key, True, color)
+            key_surf = render_text(self.font_small, key, True, color)
             key_r = key_surf.get_rect(center=(cx, nav_card_y + 18))
             self.screen.blit(key_surf, key_r)
             
             # Descripción
-            desc_surf = self.font_tiny.render(desc, True, (180, 180, 180))
+            desc_surf = render_text(self.font_tiny, desc, True, (180, 180, 180))
             desc_r = desc_surf.get_rect(center=(cx, nav_card_y + 38))
             self.screen.blit(desc_surf, desc_r)
         
@@ -2627,7 +2697,7 @@ class Game:
         inst_y = nav_card_y + card_height + 35
         
         inst_header = "📋 INSTRUCCIONES"
-        inst_surface = self.font_medium.render(inst_header, True, GOLD)
+        inst_surface = render_text(self.font_medium, inst_header, True, GOLD)
         inst_rect = inst_surface.get_rect(center=(SCREEN_WIDTH // 2, inst_y))
         self.screen.blit(inst_surface, inst_rect)
         
@@ -2643,8 +2713,8 @@ class Game:
         inst_item_y = inst_y + 35
         for icon, text, color in instructions:
             # Renderizar icono y texto
-            icon_surf = self.font_small.render(icon, True, color)
-            text_surf = self.font_small.render(text, True, WHITE)
+            icon_surf = render_text(self.font_small, icon, True, color)
+            text_surf = render_text(self.font_small, text, True, WHITE)
             
             # Calcular ancho total para centrar
             total_width = icon_surf.get_width() + 10 + text_surf.get_width()
@@ -2666,8 +2736,8 @@ class Game:
         """Dibuja la pantalla de configuración de sonido con sliders modernos"""
         # Título elegante
         title_text = "CONFIGURACIÓN DE SONIDO"
-        title_surface = self.font_large.render(title_text, True, PURPLE)
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0, 150))
+        title_surface = render_text(self.font_large, title_text, True, PURPLE)
+        title_shadow = render_text(self.font_large, title_text, True, (0, 0, 0, 150))
         title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 70))
         self.screen.blit(title_shadow, (title_rect.x + 2, title_rect.y + 2))
         self.screen.blit(title_surface, title_rect)
@@ -2696,7 +2766,7 @@ class Game:
         
         # Volumen de música
         music_y = panel_y + 60
-        music_label = self.font_medium.render("VOLUMEN DE MÚSICA", True, CYAN)
+        music_label = render_text(self.font_medium, "VOLUMEN DE MÚSICA", True, CYAN)
         music_label_rect = music_label.get_rect(center=(SCREEN_WIDTH // 2, music_y))
         self.screen.blit(music_label, music_label_rect)
         
@@ -2706,18 +2776,18 @@ class Game:
         self.music_slider.draw(self.screen)
         
         # Texto del volumen de música
-        volume_text = self.font_small.render(f"{int(self.music_volume * 100)}%", True, WHITE)
+        volume_text = render_text(self.font_small, f"{int(self.music_volume * 100)}%", True, WHITE)
         volume_rect = volume_text.get_rect(center=(SCREEN_WIDTH // 2, slider_y + 35))
         self.screen.blit(volume_text, volume_rect)
         
         # Instrucciones para música
-        music_inst = self.font_tiny.render("Arrastra el control deslizante para ajustar", True, (200, 200, 200))
+        music_inst = render_text(self.font_tiny, "Arrastra el control deslizante para ajustar", True, (200, 200, 200))
         inst_rect = music_inst.get_rect(center=(SCREEN_WIDTH // 2, slider_y + 55))
         self.screen.blit(music_inst, inst_rect)
         
         # Volumen de efectos de sonido
         sound_y = music_y + 180
-        sound_label = self.font_medium.render("VOLUMEN DE EFECTOS", True, CYAN)
+        sound_label = render_text(self.font_medium, "VOLUMEN DE EFECTOS", True, CYAN)
         sound_label_rect = sound_label.get_rect(center=(SCREEN_WIDTH // 2, sound_y))
         self.screen.blit(sound_label, sound_label_rect)
         
@@ -2727,12 +2797,12 @@ class Game:
         self.sound_slider.draw(self.screen)
         
         # Texto del volumen de efectos
-        sound_volume_text = self.font_small.render(f"{int(self.sound_volume * 100)}%", True, WHITE)
+        sound_volume_text = render_text(self.font_small, f"{int(self.sound_volume * 100)}%", True, WHITE)
         sound_volume_rect = sound_volume_text.get_rect(center=(SCREEN_WIDTH // 2, sound_slider_y + 35))
         self.screen.blit(sound_volume_text, sound_volume_rect)
         
         # Instrucciones para efectos
-        sound_inst = self.font_tiny.render("Arrastra el control deslizante para ajustar", True, (200, 200, 200))
+        sound_inst = render_text(self.font_tiny, "Arrastra el control deslizante para ajustar", True, (200, 200, 200))
         sound_inst_rect = sound_inst.get_rect(center=(SCREEN_WIDTH // 2, sound_slider_y + 55))
         self.screen.blit(sound_inst, sound_inst_rect)
         
@@ -2764,12 +2834,12 @@ class Game:
                     color = (PURPLE[0], PURPLE[1], PURPLE[2])
                     if i > 0:
                         color = (max(0, color[0] - i*20), max(0, color[1] - i*20), max(0, color[2] - i*20))
-                    title_surface = self.font_pixel.render(main_title, True, color)
+                    title_surface = render_text(self.font_pixel, main_title, True, color)
                     title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 180 + offset))
                     self.screen.blit(title_surface, title_rect)
             
             # Título principal
-            title_surface = self.font_pixel.render(main_title, True, PURPLE)
+            title_surface = render_text(self.font_pixel, main_title, True, PURPLE)
             title_rect = title_surface.get_rect(center=(SCREEN_WIDTH // 2, 180))
             self.screen.blit(title_surface, title_rect)
             
@@ -2781,20 +2851,20 @@ class Game:
                             border_size)
             
             # Mostrar dificultad y estadísticas
-            diff_text = self.font_large.render(difficulty, True, CYAN)
+            diff_text = render_text(self.font_large, difficulty, True, CYAN)
             diff_rect = diff_text.get_rect(center=(SCREEN_WIDTH // 2, 260))
             self.screen.blit(diff_text, diff_rect)
             
             # Info de la oleada
             enemies_info = f"Enemigos: {wave_config['num_enemies']} | HP: {wave_config['enemy_hp']}"
-            info_text = self.font_medium.render(enemies_info, True, PINK)
+            info_text = render_text(self.font_medium, enemies_info, True, PINK)
             info_rect = info_text.get_rect(center=(SCREEN_WIDTH // 2, 320))
             self.screen.blit(info_text, info_rect)
             
             # (Mensaje de tiempo eliminado)
             
             # Instrucción adicional
-            hint_text = self.font_tiny.render("¡Sobrevive el mayor tiempo posible!", True, (180, 180, 180))
+            hint_text = render_text(self.font_tiny, "¡Sobrevive el mayor tiempo posible!", True, (180, 180, 180))
             hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, 400))
             self.screen.blit(hint_text, hint_rect)
         
@@ -2810,12 +2880,12 @@ class Game:
                     color = (YELLOW[0], YELLOW[1], YELLOW[2])
                     if i > 0:
                         color = (color[0] - i*20, color[1] - i*20, color[2] - i*20)
-                    level_surface = self.font_pixel.render(level_text, True, color)
+                    level_surface = render_text(self.font_pixel, level_text, True, color)
                     level_rect = level_surface.get_rect(center=(SCREEN_WIDTH // 2 + offset, 200 + offset))
                     self.screen.blit(level_surface, level_rect)
             
             # Título principal
-            level_surface = self.font_pixel.render(level_text, True, YELLOW)
+            level_surface = render_text(self.font_pixel, level_text, True, YELLOW)
             level_rect = level_surface.get_rect(center=(SCREEN_WIDTH // 2, 200))
             self.screen.blit(level_surface, level_rect)
             
@@ -2833,17 +2903,17 @@ class Game:
                 3: "Espacio Rojo - Naves Avanzadas"
             }
             
-            desc_text = self.font_medium.render(descriptions[self.level], True, CYAN)
+            desc_text = render_text(self.font_medium, descriptions[self.level], True, CYAN)
             desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH // 2, 280))
             self.screen.blit(desc_text, desc_rect)
         
         # Contador o texto de espera
         if self.level_intro_timer > 0:
-            wait_text = self.font_small.render(
+            wait_text = render_text(self.font_small, 
                 f"Preparándose... {self.level_intro_timer // 60 + 1}", True, WHITE
             )
         else:
-            wait_text = self.font_small.render("Presiona ESPACIO para comenzar", True, GREEN)
+            wait_text = render_text(self.font_small, "Presiona ESPACIO para comenzar", True, GREEN)
         wait_rect = wait_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100))
         self.screen.blit(wait_text, wait_rect)
 
@@ -2881,8 +2951,8 @@ class Game:
         self.screen.blit(panel, (panel_x, panel_y))
         
         # Título del menú de pausa
-        pause_title = self.font_large.render("JUEGO PAUSADO", True, YELLOW)
-        pause_shadow = self.font_large.render("JUEGO PAUSADO", True, (0, 0, 0, 150))
+        pause_title = render_text(self.font_large, "JUEGO PAUSADO", True, YELLOW)
+        pause_shadow = render_text(self.font_large, "JUEGO PAUSADO", True, (0, 0, 0, 150))
         pause_rect = pause_title.get_rect(center=(SCREEN_WIDTH // 2, panel_y + 50))
         self.screen.blit(pause_shadow, (pause_rect.x + 2, pause_rect.y + 2))
         self.screen.blit(pause_title, pause_rect)
@@ -2912,7 +2982,7 @@ class Game:
                 ])
         
         # Instrucción
-        hint_text = self.font_tiny.render("Presiona ESC para reanudar", True, (200, 200, 200))
+        hint_text = render_text(self.font_tiny, "Presiona ESC para reanudar", True, (200, 200, 200))
         hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, panel_y + panel_height - 30))
         self.screen.blit(hint_text, hint_rect)
     
@@ -2920,6 +2990,7 @@ class Game:
         """Dibuja todos los elementos del juego"""
         # Dibujar fondo
         self.draw_background()
+        self.profiler.lap("draw_background")
         
         if self.game_state == "menu":
             self.draw_menu()
@@ -2930,60 +3001,58 @@ class Game:
         elif self.game_state == "level_intro":
             self.draw_level_intro()
         elif self.game_state == "playing":
-            # Aplicar screen shake
-            shake_offset_x = 0
-            shake_offset_y = 0
-            if self.screen_shake > 0:
-                shake_offset_x = random.randint(-int(self.screen_shake_intensity), int(self.screen_shake_intensity))
-                shake_offset_y = random.randint(-int(self.screen_shake_intensity), int(self.screen_shake_intensity))
-            
-            # Crear superficie temporal para aplicar shake
-            if shake_offset_x != 0 or shake_offset_y != 0:
-                game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                game_surface.blit(self.screen, (0, 0))
+            # Aplicar screen shake: el mundo se dibuja en el back buffer
+            # persistente y se presenta desplazado (la UI no tiembla)
+            shake_offset = self._get_shake_offset(self.screen_shake, self.screen_shake_intensity)
+            world = self._begin_shake_layer(shake_offset)
             
             # Dibujar elementos del juego
-            self.player.draw(self.screen)
+            self.player.draw(world)
             
             # Dibujar enemigos
             for enemy in self.enemies:
-                enemy.draw(self.screen)
+                enemy.draw(world)
             
             # Dibujar explosiones (limitar a 5 en web para mejor rendimiento)
             max_explosions = 5 if IS_WEB else 999
             for explosion in self.explosions[:max_explosions]:
-                explosion.draw(self.screen)
+                explosion.draw(world)
             
             # Dibujar proyectiles
             for projectile in self.player_projectiles:
-                projectile.draw(self.screen)
+                projectile.draw(world)
             
             for projectile in self.enemy_projectiles:
-                projectile.draw(self.screen)
+                projectile.draw(world)
             
             # Dibujar efectos de combo (encima de todo excepto UI)
             for effect in self.combo_effects:
                 if hasattr(effect, 'draw'):
                     if isinstance(effect, ComboTextPopup):
-                        effect.draw(self.screen, self.font_large)
+                        effect.draw(world, self.font_large)
                     else:
-                        effect.draw(self.screen)
+                        effect.draw(world)
+            
+            self._end_shake_layer(world, shake_offset)
+            self.profiler.lap("draw_entities")
             
             # Screen flash (overlay blanco)
             if self.screen_flash > 0:
                 flash_alpha = int(150 * (self.screen_flash / 15))
-                flash_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-                flash_surface.fill((255, 255, 200, flash_alpha))
-                self.screen.blit(flash_surface, (0, 0))
+                flash_overlay = self._get_flash_overlay()
+                flash_overlay.set_alpha(flash_alpha)
+                self.screen.blit(flash_overlay, (0, 0))
             
             self.draw_ui()
             
             # Dibujar indicador de combo (encima de la UI)
             if self.combo_streak > 0:
                 self.combo_indicator.draw(self.screen, self.font_tiny)
+            self.profiler.lap("draw_ui")
             
             # Dibujar mascota (encima de la UI)
             self.mascota.draw(self.screen)
+            self.profiler.lap("mascota.draw")
         elif self.game_state == "paused":
             # Dibujar elementos del juego (fondo)
             self.player.draw(self.screen)
@@ -3031,29 +3100,71 @@ class Game:
             for explosion in self.explosions:
                 explosion.draw(self.screen)
             self.draw_game_over()
+        self.profiler.lap("draw_" + self.game_state)
         
-        pygame.display.flip()
+        self.profiler.draw_overlay(self.screen)
+        self.renderer.present(self.screen)
+        self.profiler.lap("display.flip")
     
     async def run(self):
         """Bucle principal del juego (asíncrono para Pygbag)"""
         import asyncio
         
+        # === OPTIMIZACIÓN: PASO FIJO DE SIMULACIÓN ===
+        # update() avanza exactamente un frame lógico de 1/FPS s, aunque se
+        # dibuje a RENDER_FPS (25 en web). El acumulador ejecuta los pasos que
+        # correspondan al tiempo real transcurrido, así los temporizadores y
+        # los tiempos de respuesta registrados no dependen del ritmo de dibujo.
+        step_ms = 1000.0 / FPS
+        accumulator = 0.0
+        self.clock.tick()  # Descartar el tiempo de inicialización
+        
         while self.running:
+            self.profiler.begin_frame()
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+            self.profiler.lap("events")
             
+            # La entrada se procesa una vez por frame (eventos discretos)
             keys = pygame.key.get_pressed()
             self.handle_input(keys, events)
-            self.update()
+            self.profiler.lap("handle_input")
+            
+            steps = 0
+            while accumulator >= step_ms and self.running:
+                self.update()
+                accumulator -= step_ms
+                steps += 1
+                if steps >= MAX_SIM_STEPS:
+                    # Demasiado atraso: descartarlo en lugar de encadenar pasos
+                    accumulator = 0.0
+                    break
+            
+            self.profiler.lap("update")
+            
+            # Se dibuja el estado del último paso, sin interpolar (a 25 FPS
+            # el desfase es de menos de un paso de 1/FPS s)
             self.draw()
-            # Usar FPS reducido en web para mejor rendimiento
-            self.clock.tick(WEB_FPS)
+            self.profiler.end_frame()
+            
+            # Limitar el ritmo de dibujo (reducido en web para mejor rendimiento)
+            accumulator += self.clock.tick(RENDER_FPS)
             
             # Yield control al navegador (requerido por Pygbag)
             await asyncio.sleep(0)
         
+        # Guardar la línea de tiempo del profiler (si se usó)
+        if self.profiler.frames:
+            self.profiler.dump(writable_path(time.strftime("perfil_frames_%Y%m%d_%H%M%S.json")))
+        
+        # Escribir las respuestas pendientes
+        self.answer_log.close()
+        
+        # Guardar el perfil de tiempo del jugador (si se jugó el modo infinito)
+        TiempoAdaptativo.perfiles().guardar()
+        
         # Detener controlador WebSocket
         stop_controller()
         pygame.quit()
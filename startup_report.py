@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+"""
+Informe de arranque: qué se importa (y cuánto tarda) antes del primer frame
+
+Lanza un proceso hijo con `python -X importtime` que reproduce el arranque de
+main.py hasta dibujar el primer frame del menú (drivers "dummy" de SDL) y
+agrupa las líneas de importtime por paquete de primer nivel. También separa
+el tiempo de `import game`, la construcción de `Game()` y el primer frame, y
+lista las importaciones diferidas que ocurrieron (utils/lazy_import.py).
+
+Uso:
+    python startup_report.py              # tabla legible
+    python startup_report.py --top 30     # más módulos
+    python startup_report.py --json       # salida JSON
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+
+# Arranque equivalente a main.py, sin entrar en el bucle principal
+PROBE = r"""
+import json, os, sys, time
+t0 = time.perf_counter()
+import pygame
+pygame.init()
+pygame.mixer.init()
+t1 = time.perf_counter()
+from game import Game
+t2 = time.perf_counter()
+game = Game()
+t3 = time.perf_counter()
+game.draw()
+t4 = time.perf_counter()
+from utils.lazy_import import load_times
+print("@@STARTUP@@" + json.dumps({
+    "pygame_init": t1 - t0,
+    "import_game": t2 - t1,
+    "game_init": t3 - t2,
+    "first_frame": t4 - t3,
+    "total": t4 - t0,
+    "lazy_imports": load_times(),
+}))
+game.answer_log.close()
+pygame.quit()
+"""
+
+
+def parse_importtime(stderr):
+    """Lista de (módulo, self_us, cumulative_us, profundidad) de -X importtime"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            # Los hilos en segundo plano (modelo, fuentes) importan a la vez
+            # que el principal y importtime puede dar tiempos propios negativos
+            self_us = max(0, int(self_us))
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            continue
+        # importtime sangra dos espacios por nivel de anidamiento
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), self_us, cumulative_us, depth))
+    return rows
+
+
+def summarize(rows, top):
+    """Tiempo propio por paquete de primer nivel y los módulos más costosos"""
+    packages = {}
+    for name, self_us, _, _ in rows:
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0) + self_us
+    by_package = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    by_module = sorted(rows, key=lambda row: row[2], reverse=True)
+    return {
+        "modules_imported": len(rows),
+        "import_total_ms": round(sum(row[1] for row in rows) / 1000.0, 1),
+        "packages_ms": {name: round(us / 1000.0, 1) for name, us in by_package[:top]},
+        "cumulative_ms": {row[0]: round(row[2] / 1000.0, 1) for row in by_module[:top]},
+    }
+
+
+def run_probe():
+    """Ejecuta el arranque en un proceso hijo y devuelve (tiempos, filas de importtime)"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYTHONPATH"] = root + os.pathsep + env.get("PYTHONPATH", "")
+    # Los archivos que escribe el juego al arrancar van a un directorio temporal
+    data_dir = tempfile.mkdtemp(prefix="nave_startup_")
+    env["NAVE_DATA_DIR"] = data_dir
+
+    try:
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE],
+                                cwd=root, env=env, capture_output=True, text=True)
+    finally:
+        shutil.rmtree(data_dir, ignore_errors=True)
+    timings = None
+    for line in result.stdout.splitlines():
+        if line.startswith("@@STARTUP@@"):
+            timings = json.loads(line[len("@@STARTUP@@"):])
+    if timings is None:
+        sys.stderr.write(result.stderr[-2000:])
+        raise SystemExit("[!] El arranque de prueba falló (código %d)" % result.returncode)
+    return timings, parse_importtime(result.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Informe de importaciones hasta el primer frame")
+    parser.add_argument("--top", type=int, default=15, help="filas por tabla")
+    parser.add_argument("--json", action="store_true", help="salida en JSON")
+    args = parser.parse_args(argv)
+
+    timings, rows = run_probe()
+    report = {"timings_s": {k: round(v, 3) for k, v in timings.items() if k != "lazy_imports"},
+              "lazy_imports_s": {k: round(v, 3) for k, v in timings["lazy_imports"].items()}}
+    report.update(summarize(rows, args.top))
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0
+
+    t = report["timings_s"]
+    print("=== Arranque hasta el primer frame: %.2f s ===" % t["total"])
+    print("  pygame.init + mixer  %7.3f s" % t["pygame_init"])
+    print("  import game          %7.3f s" % t["import_game"])
+    print("  Game()               %7.3f s" % t["game_init"])
+    print("  primer frame         %7.3f s" % t["first_frame"])
+    print("\n=== Importaciones: %d módulos, %.0f ms (tiempo propio, incluye hilos) ==="
+          % (report["modules_imported"], report["import_total_ms"]))
+    print("Por paquete:")
+    for name, ms in report["packages_ms"].items():
+        print("  %-40s %8.1f ms" % (name, ms))
+    print("Módulos más costosos (acumulado):")
+    for name, ms in report["cumulative_ms"].items():
+        print("  %-40s %8.1f ms" % (name, ms))
+    if report["lazy_imports_s"]:
+        print("Importaciones diferidas antes del primer frame:")
+        for name, seconds in report["lazy_imports_s"].items():
+            print("  %-40s %8.1f ms" % (name, seconds * 1000))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,5 +4,8 @@ from systems.adaptive_time import TiempoAdaptativo
 from systems.sound_manager import SoundManager
 from systems.mascota import MascotaAnimada, VictoryCelebration
 from systems.infinite_mode import InfiniteMode
+from systems.dirty_renderer import DirtyRectRenderer
+from systems.profiler import FrameProfiler
+from systems.collision import SpatialHash, hits_on
 from systems.websocket_controller import start_controller, stop_controller, get_controller
 
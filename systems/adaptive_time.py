@@ -3,8 +3,21 @@
 Sistema de tiempo adaptativo usando Machine Learning
 """
 
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+from config import IS_WEB, JUGADOR_ID
+
 # Rutas compatibles con PyInstaller
-from utils.resource import resource_path
+from utils.resource import resource_path, writable_path
+from utils.lazy_import import lazy_import, module_available
+from utils.answer_log import tail_answers, ANSWER_LOG_FILENAME
+from systems.tabla_tiempo import TablaTiempo, TABLA_FILENAME, firma_modelo
+from systems.estimador_jugador import BufferCircular, PerfilesJugador
+
+PERFILES_FILENAME = "perfil_jugador.json"
 
 # Importar librerías opcionales
 try:
@@ -13,11 +26,9 @@ try:
 except ImportError:
     HAS_NUMPY = False
 
-try:
-    import joblib
-    HAS_JOBLIB = True
-except ImportError:
-    HAS_JOBLIB = False
+# joblib (y con él scikit-learn) se importa en el hilo de carga del modelo
+joblib = lazy_import("joblib")
+HAS_JOBLIB = module_available("joblib")
 
 
 class TiempoAdaptativo:
@@ -27,7 +38,13 @@ class TiempoAdaptativo:
     el tiempo disponible para cada pregunta.
     """
     
-    def __init__(self, tiempo_base=10.0, min_tiempo=2.0, max_tiempo=10.0):
+    # === OPTIMIZACIÓN: TABLA PRECOMPILADA ===
+    # Compartida por todas las instancias (se crea una por partida infinita)
+    _tabla_compartida = None
+    # Perfiles de jugador persistidos (compartidos por todas las instancias)
+    _perfiles = None
+    
+    def __init__(self, tiempo_base=10.0, min_tiempo=2.0, max_tiempo=10.0, jugador=None):
         self.tiempo_base = tiempo_base
         self.tiempo_actual = tiempo_base
         self.min_tiempo = min_tiempo
@@ -35,32 +52,134 @@ class TiempoAdaptativo:
         self.factor_ajuste = 0.5
         self.modelo = None
         self.usar_modelo = False
-        self.historial = []
+        # Últimos tiempos de respuesta (buffer circular, inserción O(1))
+        self.historial = BufferCircular(10)
+        # Corrección aprendida en línea para este jugador sobre el modelo global
+        self.jugador = jugador or JUGADOR_ID
+        self._sembrar_historial()
+        self.estimador = self.perfiles().obtener(self.jugador)
         # Mapeo de signos según el entrenamiento del modelo
         self.signo_map = {'*': 0, '+': 1, '-': 2, '/': 3}
         
-        # Intentar cargar el modelo ML
-        if HAS_JOBLIB and HAS_NUMPY:
-            try:
-                self.modelo = joblib.load(resource_path('mejor_modelo_tiempo.pkl'))
-                self.usar_modelo = True
-                print("✅ Modelo ML cargado correctamente para modo infinito")
-            except FileNotFoundError:
-                print("[!] Archivo mejor_modelo_tiempo.pkl no encontrado")
-                self.usar_modelo = False
-            except Exception as e:
-                print(f"[!] Error al cargar el modelo: {e}")
-                self.usar_modelo = False
-        else:
+        self.tabla = None
+        
+        # El modelo se carga en segundo plano (una vez por ejecución); hasta
+        # que esté listo, predecir_tiempo devuelve tiempo_actual
+        self._futuro_modelo = self.precargar(background=not IS_WEB)
+        self._sincronizar_modelo()
+    
+    # === OPTIMIZACIÓN: CARGA DEL MODELO EN SEGUNDO PLANO ===
+    # joblib.load importa scikit-learn (más de 1 s en los portátiles del aula)
+    # y congelaba la transición al modo infinito. Game lo precarga en un hilo
+    # al iniciar; cada instancia consulta el Future compartido.
+    _carga_futura = None
+    _carga_lock = threading.Lock()
+    
+    @classmethod
+    def precargar(cls, background=True):
+        """Inicia la carga del modelo (solo la primera vez) y devuelve su Future"""
+        with cls._carga_lock:
+            if cls._carga_futura is None:
+                futuro = Future()
+                cls._carga_futura = futuro
+                if background:
+                    threading.Thread(target=cls._ejecutar_carga, args=(futuro,),
+                                     name="CargaModeloTiempo", daemon=True).start()
+                else:
+                    cls._ejecutar_carga(futuro)
+            return cls._carga_futura
+    
+    @classmethod
+    def _ejecutar_carga(cls, futuro):
+        """Resuelve el Future con (tabla, modelo); nunca lo deja sin resultado"""
+        try:
+            futuro.set_result(cls._cargar_modelo())
+        except Exception as e:
+            print(f"[!] Error al cargar el modelo: {e}")
+            futuro.set_result((None, None))
+    
+    @classmethod
+    def _cargar_modelo(cls):
+        """Carga la tabla precompilada o, si no hay, el modelo ML (y la compila)"""
+        if not HAS_NUMPY:
+            print("[!] joblib o numpy no disponible, usando tiempo fijo")
+            return None, None
+        
+        inicio = time.perf_counter()
+        # Con la tabla precompilada no hace falta cargar scikit-learn
+        tabla = cls._cargar_tabla()
+        if tabla is not None:
+            print(f"✅ Modelo de tiempo listo en {time.perf_counter() - inicio:.2f} s (tabla precompilada)")
+            return tabla, None
+        
+        if not HAS_JOBLIB:
             print("[!] joblib o numpy no disponible, usando tiempo fijo")
+            return None, None
+        try:
+            modelo = joblib.load(resource_path('mejor_modelo_tiempo.pkl'))
+        except FileNotFoundError:
+            print("[!] Archivo mejor_modelo_tiempo.pkl no encontrado")
+            return None, None
+        print(f"✅ Modelo ML cargado correctamente para modo infinito "
+              f"en {time.perf_counter() - inicio:.2f} s")
+        return cls._compilar_tabla(modelo), modelo
+    
+    def _sincronizar_modelo(self):
+        """True si el modelo está disponible (lo copia a la instancia al terminar)"""
+        if self.usar_modelo:
+            return True
+        if not self._futuro_modelo.done():
+            return False
+        self.tabla, self.modelo = self._futuro_modelo.result()
+        self.usar_modelo = self.tabla is not None or self.modelo is not None
+        return self.usar_modelo
+    
+    @classmethod
+    def _cargar_tabla(cls):
+        """Tabla precompilada vigente (caché de la app o empaquetada), o None"""
+        if cls._tabla_compartida is not None:
+            return cls._tabla_compartida
+        
+        modelo_path = resource_path('mejor_modelo_tiempo.pkl')
+        firma = firma_modelo(modelo_path) if os.path.exists(modelo_path) else None
+        for path in (writable_path(TABLA_FILENAME), resource_path(TABLA_FILENAME)):
+            tabla = TablaTiempo.cargar(path, firma)
+            if tabla is not None:
+                print(f"✅ Tabla de tiempo precompilada cargada ({os.path.basename(path)})")
+                cls._tabla_compartida = tabla
+                return tabla
+        return None
+    
+    @classmethod
+    def _compilar_tabla(cls, modelo):
+        """Evalúa el modelo sobre toda la rejilla de entradas y guarda la tabla"""
+        try:
+            modelo_path = resource_path('mejor_modelo_tiempo.pkl')
+            tabla = TablaTiempo.compilar(modelo, firma_modelo(modelo_path))
+            desviacion = tabla.desviacion_maxima(modelo)
+            print(f"✅ Tabla de tiempo compilada {tabla.tabla.shape} "
+                  f"(desviación máxima con el modelo: {desviacion:.3g} s)")
+        except Exception as e:
+            print(f"[!] No se pudo compilar la tabla de tiempo: {e}")
+            return None
+        
+        try:
+            tabla.guardar(writable_path(TABLA_FILENAME))
+        except OSError as e:
+            print(f"[!] No se pudo guardar la tabla de tiempo: {e}")
+        cls._tabla_compartida = tabla
+        return tabla
     
     def predecir_tiempo(self, signo, respuestas_correctas, vidas, nivel):
         """Predice el tiempo de respuesta usando el modelo ML."""
-        if not self.usar_modelo or not HAS_NUMPY:
+        if not self._sincronizar_modelo() or not HAS_NUMPY:
             return self.tiempo_actual
         
         try:
             signo_encoded = self.signo_map.get(signo, 1)
+            # Consulta O(1) en la tabla precompilada (mismas salidas que predict)
+            if self.tabla is not None:
+                return self.tabla.predecir(signo_encoded, respuestas_correctas, vidas, nivel)
             features = np.array([[signo_encoded, respuestas_correctas, vidas, nivel]])
             tiempo_predicho = self.modelo.predict(features)[0]
             return float(tiempo_predicho)
@@ -68,31 +187,67 @@ class TiempoAdaptativo:
             print(f"Error en predicción: {e}")
             return self.tiempo_actual
     
+    @classmethod
+    def perfiles(cls):
+        """Perfiles de jugador (se leen de disco la primera vez que se usan)"""
+        if cls._perfiles is None:
+            cls._perfiles = PerfilesJugador(writable_path(PERFILES_FILENAME))
+        return cls._perfiles
+    
     def obtener_tiempo(self, signo, respuestas_correctas, vidas, nivel):
         """Obtiene el tiempo asignado para la siguiente pregunta."""
         tiempo_pred = self.predecir_tiempo(signo, respuestas_correctas, vidas, nivel)
         
-        # Sumar 3 segundos extra según solicitud
-        tiempo_pred = tiempo_pred + 3.0
-        
-        # Combinar predicción con historial reciente
-        if len(self.historial) >= 3:
-            promedio_reciente = sum(self.historial[-3:]) / 3
-            tiempo_final = 0.7 * tiempo_pred + 0.3 * promedio_reciente
+        if self._sincronizar_modelo():
+            # Corrección propia del jugador sobre el residuo del modelo global
+            tiempo_pred += self.estimador.correccion()
+            # Sumar 3 segundos extra según solicitud
+            tiempo_final = tiempo_pred + 3.0
         else:
-            tiempo_final = tiempo_pred
+            # Sin modelo: combinar el tiempo base con el historial reciente
+            tiempo_pred = tiempo_pred + 3.0
+            if len(self.historial) >= 3:
+                promedio_reciente = self.historial.media_ultimos(3)
+                tiempo_final = 0.7 * tiempo_pred + 0.3 * promedio_reciente
+            else:
+                tiempo_final = tiempo_pred
         
         # Aplicar límites
         tiempo_final = max(self.min_tiempo, min(self.max_tiempo, tiempo_final))
         return round(tiempo_final, 2)
     
-    def registrar_respuesta(self, tiempo_usado, fue_correcta):
-        """Registra el tiempo de respuesta para ajustar el sistema."""
-        self.historial.append(tiempo_usado)
+    def _es_respuesta_propia(self, entrada):
+        """Respuesta real (no TIMEOUT) de este jugador; las filas sin
+        jugador son anteriores a registrarlo y cuentan como 'local'"""
+        return (entrada.get("tecla_presionada") != "TIMEOUT"
+                and entrada.get("jugador", "local") == self.jugador
+                and isinstance(entrada.get("tiempo_respuesta_pregunta"), (int, float)))
+    
+    def _sembrar_historial(self):
+        """Llena el historial con los últimos tiempos del jugador en
+        resultados.jsonl (solo se lee el final del archivo), así el ajuste
+        sin modelo no empieza de cero en cada partida"""
+        try:
+            entradas = tail_answers(writable_path(ANSWER_LOG_FILENAME),
+                                    self.historial.capacidad, self._es_respuesta_propia)
+        except OSError as e:
+            print(f"[!] No se pudo leer el historial de respuestas: {e}")
+            return
+        for entrada in entradas:
+            self.historial.agregar(float(entrada["tiempo_respuesta_pregunta"]))
+    
+    def registrar_respuesta(self, tiempo_usado, fue_correcta, signo=None,
+                            respuestas_correctas=None, vidas=None, nivel=None):
+        """
+        Registra el tiempo de respuesta para ajustar el sistema.
+        Con el contexto de la pregunta (signo, correctas, vidas, nivel) y el
+        modelo disponible, actualiza también el estimador del jugador.
+        """
+        self.historial.agregar(tiempo_usado)
         
-        # Mantener solo los últimos 10 registros
-        if len(self.historial) > 10:
-            self.historial.pop(0)
+        if signo is not None and self._sincronizar_modelo():
+            prediccion = self.predecir_tiempo(signo, respuestas_correctas, vidas, nivel)
+            self.estimador.actualizar(tiempo_usado - prediccion)
         
         # Ajustar tiempo base según rendimiento (modo difícil para la máquina)
         if fue_correcta:
@@ -100,7 +255,13 @@ class TiempoAdaptativo:
             self.tiempo_actual = max(self.min_tiempo, self.tiempo_actual - 0.3)
         # Si falla, NO aumentar tiempo (sin ayuda al jugador)
     
+    def guardar_perfil(self):
+        """Guarda en disco los perfiles de jugador"""
+        self.perfiles().guardar()
+    
     def reset(self):
-        """Reinicia el sistema adaptativo."""
+        """Reinicia el sistema adaptativo (el perfil del jugador se conserva
+        en memoria; Game.run lo guarda al salir)."""
         self.tiempo_actual = self.tiempo_base
-        self.historial = []
+        self.historial.limpiar()
+        self._sembrar_historial()
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+Colisiones: broadphase por rejilla uniforme (spatial hash)
+
+`Game.update` y la batalla del menú probaban cada proyectil contra cada
+enemigo creando dos `pygame.Rect` nuevos por par (O(P·E) asignaciones por
+frame). Ahora cada entidad mantiene un Rect propio que `get_rect()` actualiza
+en sitio, los enemigos se insertan una vez por frame en una rejilla y cada
+proyectil solo se compara con los que comparten celda.
+
+Las consultas devuelven los candidatos en el orden en que se insertaron, así
+el primer impacto es el mismo que con el recorrido lineal de la lista.
+"""
+
+
+# Tamaño de celda: del orden del enemigo más grande (60x40)
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """Rejilla uniforme de objetos con `get_rect()` (reconstruida cada frame)"""
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}
+        # id(obj) -> (orden de inserción, obj)
+        self._entries = {}
+        self._next_order = 0
+        # Lista de la que se construyó (para detectar que el juego la reemplazó)
+        self.source = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _cell_range(self, rect):
+        size = self.cell_size
+        return (rect.left // size, (rect.right - 1) // size,
+                rect.top // size, (rect.bottom - 1) // size)
+
+    def clear(self):
+        self._cells.clear()
+        self._entries.clear()
+        self._next_order = 0
+
+    def rebuild(self, objects):
+        """Vacía la rejilla e inserta `objects` en orden (una vez por frame)"""
+        self.clear()
+        self.source = objects
+        for obj in objects:
+            self.insert(obj)
+
+    def insert(self, obj):
+        """Añade un objeto en todas las celdas que toca su rect"""
+        key = id(obj)
+        self._entries[key] = (self._next_order, obj)
+        self._next_order += 1
+        x0, x1, y0, y1 = self._cell_range(obj.get_rect())
+        cells = self._cells
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [key]
+                else:
+                    bucket.append(key)
+
+    def remove(self, obj):
+        """Quita un objeto (ej. enemigo destruido a mitad de frame)"""
+        self._entries.pop(id(obj), None)
+
+    def query(self, rect):
+        """Objetos cuyas celdas solapan `rect`, en orden de inserción"""
+        x0, x1, y0, y1 = self._cell_range(rect)
+        cells = self._cells
+        entries = self._entries
+        found = {}
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for key in bucket:
+                        entry = entries.get(key)
+                        if entry is not None:
+                            found[key] = entry
+        if len(found) > 1:
+            return [obj for _, obj in sorted(found.values(), key=lambda entry: entry[0])]
+        return [obj for _, obj in found.values()]
+
+    def first_hit(self, rect):
+        """Primer objeto (en orden de inserción) cuyo rect choca con `rect`"""
+        for obj in self.query(rect):
+            if rect.colliderect(obj.rect):
+                return obj
+        return None
+
+    def find_hits(self, movers):
+        """Pares (mover, objeto) con el primer impacto de cada mover, en bloque"""
+        hits = []
+        for mover in movers:
+            target = self.first_hit(mover.get_rect())
+            if target is not None:
+                hits.append((mover, target))
+        return hits
+
+
+def hits_on(rect, movers):
+    """Índices de `movers` que chocan con `rect` (un solo objetivo, en bloque)"""
+    return rect.collidelistall([mover.get_rect() for mover in movers])
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Presentación por rectángulos sucios (dirty rects)
+
+En lugar de `pygame.display.flip()` (copiar los 1024x600 píxeles cada frame),
+compara el frame recién compuesto con el último presentado por baldosas y
+envía a `pygame.display.update(rects)` solo las zonas que cambiaron.
+En Pygbag la copia completa del canvas domina el tiempo de frame, y la
+mayoría de pantallas (controles, ajustes, pausa, intro) cambian muy poco.
+
+La comparación y la copia del frame cuestan ~1-1.5 ms por frame (1024x600,
+`python benchmark.py --dirty-rects --compare base.json`), frente a ~0.01 ms
+de flip() con el driver dummy. Solo compensa donde flip() es caro, así que
+está desactivado por defecto (NAVE_DIRTY_RECTS=1 lo activa); medir con el
+benchmark en la plataforma destino antes de activarlo.
+"""
+
+import pygame
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+class DirtyRectRenderer:
+    """Presenta solo las baldosas de pantalla que cambiaron desde el último frame"""
+
+    # Tamaño de baldosa: 1024x600 -> rejilla de 16x15
+    TILE_WIDTH = 64
+    TILE_HEIGHT = 40
+    # Si cambia más de esta fracción de la pantalla, flip() sale más barato
+    FULL_UPDATE_RATIO = 0.6
+
+    def __init__(self, enabled=False):
+        # Sin numpy no hay forma barata de comparar frames: flip() normal
+        self.enabled = enabled and HAS_NUMPY
+        self._previous = None
+        self._force_full = True
+        self.last_dirty_ratio = 1.0
+        self.last_rect_count = 0
+
+    def invalidate(self):
+        """Fuerza una presentación completa en el próximo frame (ej. set_mode)"""
+        self._force_full = True
+
+    def present(self, screen):
+        """Presenta el frame compuesto en `screen`"""
+        if not self.enabled:
+            pygame.display.flip()
+            return
+
+        try:
+            rects = self._collect_dirty_rects(screen)
+        except ValueError as e:
+            # pixels2d no soporta superficies de 24 bits
+            print(f"[!] Dirty rects desactivado: {e}")
+            self.enabled = False
+            rects = None
+
+        if rects is None:
+            self.last_dirty_ratio = 1.0
+            self.last_rect_count = 1
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
+
+    def _collect_dirty_rects(self, screen):
+        """
+        Compara con el frame anterior y devuelve la lista de rects sucios,
+        o None si conviene presentar la pantalla completa.
+        """
+        pixels = pygame.surfarray.pixels2d(screen)
+        try:
+            width, height = pixels.shape
+            if self._force_full or self._previous is None or self._previous.shape != pixels.shape:
+                self._previous = np.array(pixels)
+                self._force_full = False
+                return None
+
+            # Reducir la máscara de cambios a una rejilla de baldosas
+            changed = pixels != self._previous
+            xs = np.arange(0, width, self.TILE_WIDTH)
+            ys = np.arange(0, height, self.TILE_HEIGHT)
+            tiles = np.logical_or.reduceat(changed, xs, axis=0)
+            tiles = np.logical_or.reduceat(tiles, ys, axis=1)
+
+            self.last_dirty_ratio = float(tiles.mean())
+            if self.last_dirty_ratio > self.FULL_UPDATE_RATIO:
+                np.copyto(self._previous, pixels)
+                return None
+
+            if self.last_dirty_ratio > 0:
+                np.copyto(self._previous, pixels)
+        finally:
+            # Liberar el bloqueo de la superficie antes de presentar
+            del pixels
+
+        # Unir baldosas contiguas de cada fila en un solo rect
+        rects = []
+        for row in range(tiles.shape[1]):
+            column = tiles[:, row]
+            col = 0
+            while col < len(column):
+                if not column[col]:
+                    col += 1
+                    continue
+                start = col
+                while col < len(column) and column[col]:
+                    col += 1
+                x = start * self.TILE_WIDTH
+                y = row * self.TILE_HEIGHT
+                rects.append(pygame.Rect(x, y,
+                                         min(col * self.TILE_WIDTH, width) - x,
+                                         min(self.TILE_HEIGHT, height - y)))
+
+        self.last_rect_count = len(rects)
+        return rects
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Estimador en línea del tiempo de respuesta de cada jugador
+
+El modelo global (mejor_modelo_tiempo.pkl) está congelado: refrescarlo exigía
+reentrenar en los notebooks con lotes de registros. Aquí se aprende, respuesta
+a respuesta, la corrección propia de cada jugador sobre ese modelo: una media
+exponencial (EWMA) del residuo `tiempo_real - tiempo_predicho`, con su
+varianza, actualizada en O(1) desde `TiempoAdaptativo.registrar_respuesta`.
+
+Los últimos residuos se guardan en un buffer circular de tamaño fijo y el
+estado de cada jugador se conserva entre sesiones en `perfil_jugador.json`.
+"""
+
+import json
+import os
+
+
+class BufferCircular:
+    """Buffer de tamaño fijo con inserción O(1) (sobrescribe lo más antiguo)"""
+
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self._datos = [0.0] * capacidad
+        self._inicio = 0
+        self._tam = 0
+
+    def __len__(self):
+        return self._tam
+
+    def agregar(self, valor):
+        """Añade un valor; si está lleno, reemplaza el más antiguo"""
+        fin = (self._inicio + self._tam) % self.capacidad
+        self._datos[fin] = valor
+        if self._tam < self.capacidad:
+            self._tam += 1
+        else:
+            self._inicio = (self._inicio + 1) % self.capacidad
+
+    def ultimos(self, n):
+        """Los `n` valores más recientes (del más antiguo al más nuevo)"""
+        n = min(n, self._tam)
+        return [self._datos[(self._inicio + self._tam - n + i) % self.capacidad] for i in range(n)]
+
+    def media_ultimos(self, n):
+        """Media de los `n` valores más recientes (0.0 si está vacío)"""
+        valores = self.ultimos(n)
+        return sum(valores) / len(valores) if valores else 0.0
+
+    def limpiar(self):
+        self._inicio = 0
+        self._tam = 0
+
+    def a_lista(self):
+        return self.ultimos(self._tam)
+
+
+class EstimadorResidual:
+    """
+    Corrección por jugador sobre el modelo global (EWMA del residuo).
+
+    Con pocas muestras la corrección se encoge hacia 0 (n / (n + encogimiento))
+    para que una respuesta aislada no mueva el tiempo, y se limita a
+    ±max_correccion segundos.
+    """
+
+    def __init__(self, alpha=0.15, encogimiento=5.0, max_correccion=3.0, capacidad=32):
+        self.alpha = alpha
+        self.encogimiento = encogimiento
+        self.max_correccion = max_correccion
+        self.media = 0.0
+        self.varianza = 0.0
+        self.muestras = 0
+        self.residuos = BufferCircular(capacidad)
+
+    def actualizar(self, residuo):
+        """Incorpora un residuo (segundos reales - segundos predichos) en O(1)"""
+        if self.muestras == 0:
+            self.media = residuo
+            self.varianza = 0.0
+        else:
+            diferencia = residuo - self.media
+            self.media += self.alpha * diferencia
+            self.varianza = (1 - self.alpha) * (self.varianza + self.alpha * diferencia * diferencia)
+        self.muestras += 1
+        self.residuos.agregar(residuo)
+
+    def correccion(self):
+        """Segundos a sumar a la predicción del modelo global"""
+        if self.muestras == 0:
+            return 0.0
+        peso = self.muestras / (self.muestras + self.encogimiento)
+        valor = self.media * peso
+        return max(-self.max_correccion, min(self.max_correccion, valor))
+
+    def a_dict(self):
+        return {
+            "media": self.media,
+            "varianza": self.varianza,
+            "muestras": self.muestras,
+            "residuos": self.residuos.a_lista(),
+        }
+
+    @classmethod
+    def desde_dict(cls, datos):
+        estimador = cls()
+        estimador.media = float(datos.get("media", 0.0))
+        estimador.varianza = float(datos.get("varianza", 0.0))
+        estimador.muestras = int(datos.get("muestras", 0))
+        for residuo in datos.get("residuos", []):
+            estimador.residuos.agregar(float(residuo))
+        return estimador
+
+
+class PerfilesJugador:
+    """Estimadores de cada jugador, persistidos en un JSON pequeño"""
+
+    def __init__(self, path):
+        self.path = path
+        self._estimadores = {}
+        self._cargado = False
+
+    def _cargar(self):
+        self._cargado = True
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                datos = json.load(f)
+            for jugador, estado in datos.items():
+                self._estimadores[jugador] = EstimadorResidual.desde_dict(estado)
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"[!] No se pudo leer el perfil de jugador: {e}")
+
+    def obtener(self, jugador):
+        """Estimador del jugador (se crea vacío si es nuevo)"""
+        if not self._cargado:
+            self._cargar()
+        estimador = self._estimadores.get(jugador)
+        if estimador is None:
+            estimador = self._estimadores[jugador] = EstimadorResidual()
+        return estimador
+
+    def guardar(self):
+        """Escribe todos los perfiles (archivo temporal + reemplazo)"""
+        if not self._cargado:
+            return
+        datos = {jugador: estimador.a_dict() for jugador, estimador in self._estimadores.items()}
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(datos, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[!] No se pudo guardar el perfil de jugador: {e}")
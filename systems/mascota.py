@@ -11,81 +11,44 @@ import math
 from config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, CYAN, GREEN, YELLOW, WHITE, PINK, GOLD, PURPLE
 )
+from utils.text_cache import render_text
+from utils.fonts import get_font
+from utils.swap_list import OrderedList
+from effects.particle_system import (
+    EmitterConfig, ParticleEmitter, SHAPE_CIRCLE, SHAPE_SQUARE, SHAPE_STAR, SHAPE_DIAMOND,
+    SHAPE_CONFETTI_RECT, SHAPE_CONFETTI_DOT, SHAPE_CONFETTI_STAR
+)
 
 
-class CelebrationParticle:
-    """Partícula de celebración (estrella, confeti)"""
-    
-    def __init__(self, x, y, intensity=1.0):
-        self.x = x
-        self.y = y
-        self.vx = random.uniform(-4, 4) * intensity
-        self.vy = random.uniform(-8, -3) * intensity
-        self.gravity = 0.12
-        self.lifetime = random.randint(50, 100)
-        self.max_lifetime = self.lifetime
-        self.size = random.randint(4, 12)
-        self.color = random.choice([
-            CYAN, GREEN, YELLOW, PINK, GOLD, WHITE, PURPLE,
-            (255, 100, 100), (100, 255, 100), (100, 100, 255),
-            (255, 200, 50), (50, 255, 200)
-        ])
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-15, 15)
-        self.type = random.choice(['star', 'circle', 'square', 'diamond'])
-    
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += self.gravity
-        self.lifetime -= 1
-        self.rotation += self.rotation_speed
-    
-    def draw(self, screen):
-        if self.lifetime <= 0:
-            return
-        
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        size = int(self.size * (0.5 + 0.5 * self.lifetime / self.max_lifetime))
-        
-        if size < 1:
-            return
-        
-        if self.type == 'star':
-            self._draw_star(screen, size)
-        elif self.type == 'diamond':
-            self._draw_diamond(screen, size)
-        elif self.type == 'circle':
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
-        else:
-            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.rect(surf, (*self.color, alpha), (size // 2, size // 2, size, size))
-            rotated = pygame.transform.rotate(surf, self.rotation)
-            rect = rotated.get_rect(center=(int(self.x), int(self.y)))
-            screen.blit(rotated, rect)
-    
-    def _draw_star(self, screen, size):
-        points = []
-        for i in range(10):
-            angle = math.radians(self.rotation + i * 36)
-            r = size if i % 2 == 0 else size // 2
-            px = self.x + math.cos(angle) * r
-            py = self.y + math.sin(angle) * r
-            points.append((px, py))
-        if len(points) >= 3:
-            pygame.draw.polygon(screen, self.color, points)
-    
-    def _draw_diamond(self, screen, size):
-        points = [
-            (self.x, self.y - size),
-            (self.x + size, self.y),
-            (self.x, self.y + size),
-            (self.x - size, self.y)
-        ]
-        pygame.draw.polygon(screen, self.color, points)
-    
-    def is_dead(self):
-        return self.lifetime <= 0
+# Partículas de celebración (estrella, confeti): caen con gravedad, giran y se
+# encogen a la mitad mientras se desvanecen. `capacity` es el límite de
+# partículas vivas (evita picos de rendimiento en celebraciones seguidas)
+CELEBRATION_SHAPES = [SHAPE_STAR, SHAPE_CIRCLE, SHAPE_SQUARE, SHAPE_DIAMOND]
+CELEBRATION_PARTICLES = EmitterConfig(capacity=80, gravity=0.12, size_floor=0.5)
+VICTORY_PARTICLES = EmitterConfig(capacity=160, gravity=0.12, size_floor=0.5)
+
+# Confeti de victoria: tamaño constante, alpha = min(255, vida * 2)
+CONFETTI_SHAPES = [SHAPE_CONFETTI_RECT, SHAPE_CONFETTI_DOT, SHAPE_CONFETTI_STAR]
+CONFETTI_PARTICLES = EmitterConfig(capacity=400, fade_frames=127.5, size_floor=1.0,
+                                   kill_below=SCREEN_HEIGHT + 50)
+
+
+def spawn_celebration_particle(emitter, x, y, intensity=1.0):
+    """Emite una partícula de celebración (estrella, círculo, cuadrado o rombo)"""
+    vx = random.uniform(-4, 4) * intensity
+    vy = random.uniform(-8, -3) * intensity
+    lifetime = random.randint(50, 100)
+    size = random.randint(4, 12)
+    color = random.choice([
+        CYAN, GREEN, YELLOW, PINK, GOLD, WHITE, PURPLE,
+        (255, 100, 100), (100, 255, 100), (100, 100, 255),
+        (255, 200, 50), (50, 255, 200)
+    ])
+    rotation = random.uniform(0, 360)
+    rotation_speed = random.uniform(-15, 15)
+    shape = random.choice(CELEBRATION_SHAPES)
+    return emitter.emit(x, y, vx, vy, lifetime, size, color,
+                        rotation=rotation, rot_speed=rotation_speed, shape=shape)
 
 
 class AchievementPopup:
@@ -104,8 +67,8 @@ class AchievementPopup:
         
         # Fuentes
         try:
-            self.font = pygame.font.Font(None, 36)
-            self.font_bonus = pygame.font.Font(None, 28)
+            self.font = get_font(None, 36)
+            self.font_bonus = get_font(None, 28)
         except:
             self.font = pygame.font.SysFont('arial', 28)
             self.font_bonus = pygame.font.SysFont('arial', 22)
@@ -168,13 +131,13 @@ class AchievementPopup:
         pygame.draw.polygon(popup_surface, WHITE, points, 2)
         
         # Texto del logro
-        text_surface = self.font.render(self.text, True, WHITE)
+        text_surface = render_text(self.font, self.text, True, WHITE)
         text_rect = text_surface.get_rect(midleft=(60, height // 2 - 10))
         popup_surface.blit(text_surface, text_rect)
         
         # Bonus de puntos
         bonus_text = f"+{self.bonus_points} PUNTOS"
-        bonus_surface = self.font_bonus.render(bonus_text, True, GOLD)
+        bonus_surface = render_text(self.font_bonus, bonus_text, True, GOLD)
         bonus_rect = bonus_surface.get_rect(midleft=(60, height // 2 + 15))
         popup_surface.blit(bonus_surface, bonus_rect)
         
@@ -251,10 +214,10 @@ class MascotaAnimada:
         self.celebrate_duration = 90
         self.mega_celebrate_duration = 150
         
-        # Efectos visuales - OPTIMIZADO con límite de partículas
-        self.MAX_PARTICLES = 80  # Límite para evitar spikes de rendimiento
-        self.particles = []
-        self.achievements = []  # Lista de popups de logros
+        # Efectos visuales - el límite de partículas es la capacidad del
+        # emisor (CELEBRATION_PARTICLES)
+        self.particles = ParticleEmitter(CELEBRATION_PARTICLES)
+        self.achievements = OrderedList()  # Popups de logros (en orden de aparición)
         self.glow_intensity = 0
         
         # Mensaje
@@ -272,9 +235,9 @@ class MascotaAnimada:
         
         # Fuentes más grandes
         try:
-            self.font = pygame.font.Font(None, 32)
-            self.font_small = pygame.font.Font(None, 24)
-            self.font_streak = pygame.font.Font(None, 28)
+            self.font = get_font(None, 32)
+            self.font_small = get_font(None, 24)
+            self.font_streak = get_font(None, 28)
         except:
             self.font = pygame.font.SysFont('arial', 26)
             self.font_small = pygame.font.SysFont('arial', 18)
@@ -308,29 +271,29 @@ class MascotaAnimada:
             
             # Mega explosión de partículas (OPTIMIZADO - reducido)
             for _ in range(25):  # Reducido de 40
-                self._add_particle(CelebrationParticle(
+                self._add_particle(
                     self.x + self.width // 2,
                     self.y + self.height // 3,
                     intensity=1.5
-                ))
+                )
             
             # Partículas desde el centro de la pantalla (OPTIMIZADO - reducido)
             for _ in range(20):  # Reducido de 30
-                self._add_particle(CelebrationParticle(
+                self._add_particle(
                     SCREEN_WIDTH // 2 + random.randint(-50, 50),
                     SCREEN_HEIGHT // 3,
                     intensity=2.0
-                ))
+                )
         else:
             # Celebración normal (OPTIMIZADO - reducido)
             self.state = self.STATE_CELEBRATE
             self.state_timer = self.celebrate_duration
             
             for _ in range(12):  # Reducido de 20
-                self._add_particle(CelebrationParticle(
+                self._add_particle(
                     self.x + self.width // 2,
                     self.y + self.height // 3
-                ))
+                )
         
         self.celebrate_jump = 0
         self.celebrate_arms = 0
@@ -365,10 +328,9 @@ class MascotaAnimada:
         self.message_timer = 90
         self.error_message = True  # Flag para cambiar color del mensaje
     
-    def _add_particle(self, particle):
-        """Añade una partícula respetando el límite máximo (OPTIMIZACIÓN)"""
-        if len(self.particles) < self.MAX_PARTICLES:
-            self.particles.append(particle)
+    def _add_particle(self, x, y, intensity=1.0):
+        """Añade una partícula respetando el límite máximo (capacidad del emisor)"""
+        spawn_celebration_particle(self.particles, x, y, intensity)
     
     def update(self):
         """Actualiza animaciones"""
@@ -389,13 +351,10 @@ class MascotaAnimada:
             self.message_timer -= 1
         
         # Actualizar partículas
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.is_dead():
-                self.particles.remove(particle)
+        self.particles.update()
         
         # Actualizar logros
-        for achievement in self.achievements[:]:
+        for achievement in self.achievements:
             achievement.update()
             if achievement.is_dead():
                 self.achievements.remove(achievement)
@@ -423,10 +382,10 @@ class MascotaAnimada:
         self.celebrate_arms = 35 * math.sin(progress * math.pi * 4)
         
         if random.random() < 0.25:  # Reducido de 0.35
-            self._add_particle(CelebrationParticle(
+            self._add_particle(
                 self.x + self.width // 2 + random.randint(-30, 30),
                 self.y + self.celebrate_jump + random.randint(-15, 15)
-            ))
+            )
         
         if self.state_timer <= 0:
             self.state = self.STATE_IDLE
@@ -443,11 +402,11 @@ class MascotaAnimada:
         
         # Más partículas (OPTIMIZADO - reducida probabilidad)
         if random.random() < 0.35:  # Reducido de 0.5
-            self._add_particle(CelebrationParticle(
+            self._add_particle(
                 self.x + self.width // 2 + random.randint(-40, 40),
                 self.y + self.celebrate_jump + random.randint(-20, 20),
                 intensity=1.3
-            ))
+            )
         
         if self.state_timer <= 0:
             self.state = self.STATE_IDLE
@@ -475,8 +434,7 @@ class MascotaAnimada:
         draw_y = self.y + self.float_offset + self.celebrate_jump
         
         # Partículas (detrás)
-        for particle in self.particles:
-            particle.draw(screen)
+        self.particles.draw(screen)
         
         # Glow del robot (cuando hay logro)
         if self.glow_intensity > 0.1:
@@ -651,7 +609,7 @@ class MascotaAnimada:
         
         # Texto (solo el número)
         streak_text = f"x{self.streak}"
-        text_surface = self.font_streak.render(streak_text, True, WHITE)
+        text_surface = render_text(self.font_streak, streak_text, True, WHITE)
         text_rect = text_surface.get_rect(center=(center_x + 8, indicator_y + bg_height // 2))
         screen.blit(text_surface, text_rect)
     
@@ -722,7 +680,7 @@ class MascotaAnimada:
             text_color = GOLD
             border_color = GOLD
         
-        text_surface = self.font.render(self.current_message, True, text_color)
+        text_surface = render_text(self.font, self.current_message, True, text_color)
         
         if scale != 1.0:
             new_width = int(text_surface.get_width() * scale)
@@ -749,7 +707,7 @@ class MascotaAnimada:
         ]
         pygame.draw.polygon(screen, (20, 40, 60), triangle_points)
         
-        text_shadow = self.font.render(self.current_message, True, (0, 0, 0))
+        text_shadow = render_text(self.font, self.current_message, True, (0, 0, 0))
         if scale != 1.0 and new_width > 0 and new_height > 0:
             text_shadow = pygame.transform.scale(text_shadow, (new_width, new_height))
         
@@ -794,8 +752,8 @@ class VictoryCelebration:
         self.scale = 0.5
         
         # Partículas de celebración
-        self.particles = []
-        self.confetti = []
+        self.particles = ParticleEmitter(VICTORY_PARTICLES)
+        self.confetti = ParticleEmitter(CONFETTI_PARTICLES)
         self.light_rays = []
         
         # Crear rayos de luz iniciales
@@ -818,8 +776,8 @@ class VictoryCelebration:
         
         # Fuentes
         try:
-            self.font_large = pygame.font.Font(None, 72)
-            self.font_medium = pygame.font.Font(None, 48)
+            self.font_large = get_font(None, 72)
+            self.font_medium = get_font(None, 48)
         except:
             self.font_large = pygame.font.SysFont('arial', 60)
             self.font_medium = pygame.font.SysFont('arial', 36)
@@ -838,19 +796,10 @@ class VictoryCelebration:
             self._update_celebrating()
         
         # Actualizar partículas
-        for particle in self.particles[:]:
-            particle.update()
-            if particle.is_dead():
-                self.particles.remove(particle)
+        self.particles.update()
         
         # Actualizar confetti
-        for conf in self.confetti[:]:
-            conf['y'] += conf['vy']
-            conf['x'] += conf['vx']
-            conf['rotation'] += conf['rot_speed']
-            conf['lifetime'] -= 1
-            if conf['lifetime'] <= 0 or conf['y'] > SCREEN_HEIGHT + 50:
-                self.confetti.remove(conf)
+        self.confetti.update()
         
         # Actualizar rayos de luz
         for ray in self.light_rays:
@@ -870,12 +819,12 @@ class VictoryCelebration:
         
         # Crear partículas mientras entra
         if random.random() < 0.5:
-            particle = CelebrationParticle(
+            spawn_celebration_particle(
+                self.particles,
                 self.x + random.randint(-50, 50),
                 self.y + random.randint(-30, 30),
                 intensity=1.5
             )
-            self.particles.append(particle)
         
         if self.entering_timer <= 0:
             self.state = self.STATE_CELEBRATING
@@ -905,12 +854,12 @@ class VictoryCelebration:
         
         # Partículas de celebración
         if random.random() < 0.3:
-            particle = CelebrationParticle(
+            spawn_celebration_particle(
+                self.particles,
                 self.x + random.randint(-80, 80),
                 self.y + random.randint(-60, 60),
                 intensity=2.0
             )
-            self.particles.append(particle)
         
         if self.celebrate_timer <= 0:
             self.state = self.STATE_FINISHED
@@ -918,34 +867,33 @@ class VictoryCelebration:
     def _spawn_confetti_burst(self, count):
         """Explosión de confetti"""
         for _ in range(count):
-            self.confetti.append({
-                'x': self.x + random.randint(-100, 100),
-                'y': self.y + random.randint(-50, 50),
-                'vx': random.uniform(-5, 5),
-                'vy': random.uniform(-10, 2),
-                'color': random.choice([GOLD, CYAN, PINK, GREEN, YELLOW, WHITE, PURPLE]),
-                'size': random.randint(6, 14),
-                'rotation': random.uniform(0, 360),
-                'rot_speed': random.uniform(-10, 10),
-                'lifetime': random.randint(120, 200),
-                'shape': random.choice(['rect', 'circle', 'star'])
-            })
+            x = self.x + random.randint(-100, 100)
+            y = self.y + random.randint(-50, 50)
+            vx = random.uniform(-5, 5)
+            vy = random.uniform(-10, 2)
+            color = random.choice([GOLD, CYAN, PINK, GREEN, YELLOW, WHITE, PURPLE])
+            size = random.randint(6, 14)
+            rotation = random.uniform(0, 360)
+            rot_speed = random.uniform(-10, 10)
+            lifetime = random.randint(120, 200)
+            shape = random.choice(CONFETTI_SHAPES)
+            self.confetti.emit(x, y, vx, vy, lifetime, size, color,
+                               rotation=rotation, rot_speed=rot_speed, shape=shape)
     
     def _spawn_confetti(self, count):
         """Genera confetti desde arriba"""
         for _ in range(count):
-            self.confetti.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': -20,
-                'vx': random.uniform(-1, 1),
-                'vy': random.uniform(3, 7),
-                'color': random.choice([GOLD, CYAN, PINK, GREEN, YELLOW, WHITE, PURPLE]),
-                'size': random.randint(5, 12),
-                'rotation': random.uniform(0, 360),
-                'rot_speed': random.uniform(-8, 8),
-                'lifetime': random.randint(150, 250),
-                'shape': random.choice(['rect', 'circle', 'star'])
-            })
+            x = random.randint(0, SCREEN_WIDTH)
+            vx = random.uniform(-1, 1)
+            vy = random.uniform(3, 7)
+            color = random.choice([GOLD, CYAN, PINK, GREEN, YELLOW, WHITE, PURPLE])
+            size = random.randint(5, 12)
+            rotation = random.uniform(0, 360)
+            rot_speed = random.uniform(-8, 8)
+            lifetime = random.randint(150, 250)
+            shape = random.choice(CONFETTI_SHAPES)
+            self.confetti.emit(x, -20, vx, vy, lifetime, size, color,
+                               rotation=rotation, rot_speed=rot_speed, shape=shape)
     
     def is_finished(self):
         """Retorna True cuando la animación terminó"""
@@ -965,8 +913,7 @@ class VictoryCelebration:
         self._draw_confetti(screen)
         
         # Partículas
-        for particle in self.particles:
-            particle.draw(screen)
+        self.particles.draw(screen)
         
         # Robot celebrando
         self._draw_robot(screen)
@@ -999,36 +946,7 @@ class VictoryCelebration:
     
     def _draw_confetti(self, screen):
         """Dibuja el confetti"""
-        for conf in self.confetti:
-            alpha = min(255, conf['lifetime'] * 2)
-            size = conf['size']
-            
-            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            color = (*conf['color'][:3], alpha)
-            
-            if conf['shape'] == 'rect':
-                rect_surf = pygame.Surface((size, size // 2), pygame.SRCALPHA)
-                rect_surf.fill(color)
-                rotated = pygame.transform.rotate(rect_surf, conf['rotation'])
-                surf.blit(rotated, rotated.get_rect(center=(size, size)))
-            elif conf['shape'] == 'circle':
-                pygame.draw.circle(surf, color, (size, size), size // 2)
-            else:  # star
-                self._draw_mini_star(surf, size, size, size // 2, conf['rotation'], color)
-            
-            screen.blit(surf, (int(conf['x']) - size, int(conf['y']) - size))
-    
-    def _draw_mini_star(self, surface, x, y, size, rotation, color):
-        """Dibuja una estrella pequeña"""
-        points = []
-        for i in range(10):
-            angle = math.radians(rotation + i * 36)
-            r = size if i % 2 == 0 else size // 2
-            px = x + math.cos(angle) * r
-            py = y + math.sin(angle) * r
-            points.append((px, py))
-        if len(points) >= 3:
-            pygame.draw.polygon(surface, color, points)
+        self.confetti.draw(screen)
     
     def _draw_robot(self, screen):
         """Dibuja el robot celebrando"""
@@ -1150,8 +1068,8 @@ class VictoryCelebration:
         
         # Texto principal
         victory_text = "¡VICTORIA!"
-        text_surf = self.font_large.render(victory_text, True, GOLD)
-        text_shadow = self.font_large.render(victory_text, True, (50, 30, 0))
+        text_surf = render_text(self.font_large, victory_text, True, GOLD)
+        text_shadow = render_text(self.font_large, victory_text, True, (50, 30, 0))
         
         # Aplicar escala
         if self.text_scale != 1.0:
@@ -1176,6 +1094,6 @@ class VictoryCelebration:
         
         # Subtítulo
         sub_text = "¡Nivel Completado!"
-        sub_surf = self.font_medium.render(sub_text, True, WHITE)
+        sub_surf = render_text(self.font_medium, sub_text, True, WHITE)
         sub_rect = sub_surf.get_rect(center=(self.x, text_y + 50))
         screen.blit(sub_surf, sub_rect)
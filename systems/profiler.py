@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""
+Profiler de frames integrado
+
+Mide cada fase del bucle principal (eventos, entrada, simulación, fondo,
+entidades, UI, mascota, presentación) con `time.perf_counter` y guarda los
+últimos frames en un buffer circular de tamaño fijo. Con el overlay activo
+muestra una gráfica del tiempo de frame y las fases más costosas; al salir
+vuelca la línea de tiempo a JSON para comparar máquinas del aula y navegadores.
+
+Se activa con NAVE_PROFILER=1 o en cualquier momento con F3.
+
+Las fases se registran como vueltas de cronómetro: `lap(nombre)` asigna a
+`nombre` el tiempo transcurrido desde la vuelta anterior, así instrumentar una
+fase cuesta una sola línea y no hay que anidar bloques.
+"""
+
+import json
+import platform
+import time
+from collections import deque
+
+import pygame
+
+from utils.fonts import get_font
+from utils.text_cache import render_text
+
+
+def percentile(values, pct):
+    """Percentil con interpolación lineal (values ordenados)"""
+    if not values:
+        return 0.0
+    pos = (len(values) - 1) * pct / 100.0
+    low = int(pos)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (pos - low)
+
+
+class FrameProfiler:
+    """Cronómetro por fases con buffer circular y overlay en pantalla"""
+
+    # Frames guardados (a 60 FPS, ~1 minuto)
+    CAPACITY = 3600
+    # Frames mostrados en la gráfica y usados para el top de fases
+    GRAPH_FRAMES = 120
+    TOP_N = 6
+    # El texto del overlay se refresca cada N frames (evita llenar la caché de texto)
+    TEXT_REFRESH = 15
+    # Escala vertical de la gráfica (ms) y presupuestos de referencia
+    GRAPH_MAX_MS = 50.0
+    BUDGETS_MS = ((1000.0 / 60, (80, 200, 80)), (1000.0 / 25, (220, 160, 60)))
+
+    PANEL_WIDTH = 280
+    # Debajo de los paneles de combo/vidas del HUD
+    PANEL_POS_Y = 56
+    GRAPH_HEIGHT = 70
+    LINE_HEIGHT = 16
+
+    def __init__(self, enabled=False, capacity=None):
+        self.enabled = enabled
+        self.frames = deque(maxlen=capacity or self.CAPACITY)
+        self.total_frames = 0
+        self._clock = time.perf_counter
+        self._start = self._clock()
+        self._frame_start = None
+        self._last = None
+        self._sections = {}
+        self._frame_interval = 0.0
+        self._panel = None
+        self._text_lines = []
+        self._font = None
+
+    def toggle(self):
+        """Activa o desactiva la medición y el overlay"""
+        self.enabled = not self.enabled
+        self._frame_start = None
+        print(f"✓ Profiler {'activado' if self.enabled else 'desactivado'}")
+
+    # ------------------------------------------------------------------
+    # Medición
+    # ------------------------------------------------------------------
+
+    def begin_frame(self):
+        """Marca el inicio de un frame (antes de leer eventos)"""
+        if not self.enabled:
+            return
+        now = self._clock()
+        if self._frame_start is not None:
+            self._frame_interval = now - self._frame_start
+        self._frame_start = now
+        self._last = now
+        self._sections = {}
+
+    def lap(self, name):
+        """Asigna a `name` el tiempo transcurrido desde la vuelta anterior"""
+        if not self.enabled or self._last is None:
+            return
+        now = self._clock()
+        self._sections[name] = self._sections.get(name, 0.0) + (now - self._last)
+        self._last = now
+
+    def skip(self):
+        """Descarta el tiempo transcurrido desde la última vuelta (ej. el overlay)"""
+        if self.enabled and self._last is not None:
+            self._last = self._clock()
+
+    def end_frame(self):
+        """Cierra el frame y lo guarda en el buffer circular"""
+        if not self.enabled or self._frame_start is None:
+            return
+        sections = {name: seconds * 1000.0 for name, seconds in self._sections.items()}
+        self.frames.append((
+            (self._frame_start - self._start) * 1000.0,
+            sum(sections.values()),
+            self._frame_interval * 1000.0,
+            sections,
+        ))
+        self.total_frames += 1
+        self._last = None
+
+    # ------------------------------------------------------------------
+    # Resúmenes
+    # ------------------------------------------------------------------
+
+    def _recent(self, count):
+        """Últimos `count` frames del buffer"""
+        if count >= len(self.frames):
+            return list(self.frames)
+        return [self.frames[i] for i in range(len(self.frames) - count, len(self.frames))]
+
+    def top_sections(self, count=None, frames=None):
+        """Fases ordenadas por tiempo medio (ms) en los últimos frames"""
+        recent = self._recent(frames or self.GRAPH_FRAMES)
+        if not recent:
+            return []
+        totals = {}
+        for _, _, _, sections in recent:
+            for name, ms in sections.items():
+                totals[name] = totals.get(name, 0.0) + ms
+        ranked = sorted(((ms / len(recent), name) for name, ms in totals.items()), reverse=True)
+        return [(name, ms) for ms, name in ranked[:count or self.TOP_N]]
+
+    def summary(self):
+        """p50/p95/p99 del trabajo por frame y por fase sobre todo el buffer"""
+        work = sorted(frame[1] for frame in self.frames)
+        per_section = {}
+        for _, _, _, sections in self.frames:
+            for name, ms in sections.items():
+                per_section.setdefault(name, []).append(ms)
+
+        def stats(values):
+            values = sorted(values)
+            return {
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+                "p99": round(percentile(values, 99), 3),
+                "mean": round(sum(values) / len(values), 3),
+            }
+
+        result = {"frame": stats(work) if work else {}}
+        result["sections"] = {name: stats(values) for name, values in per_section.items()}
+        return result
+
+    def dump(self, path):
+        """Vuelca la línea de tiempo del buffer a JSON; devuelve False si está vacío"""
+        if not self.frames:
+            return False
+        data = {
+            "meta": {
+                "frames_recorded": len(self.frames),
+                "frames_total": self.total_frames,
+                "python": platform.python_version(),
+                "pygame": pygame.version.ver,
+                "platform": platform.platform(),
+                "video_driver": pygame.display.get_driver() if pygame.display.get_init() else None,
+            },
+            "summary": self.summary(),
+            "timeline": [
+                {
+                    "t_ms": round(t, 3),
+                    "work_ms": round(work, 3),
+                    "interval_ms": round(interval, 3),
+                    "sections": {name: round(ms, 3) for name, ms in sections.items()},
+                }
+                for t, work, interval, sections in self.frames
+            ],
+        }
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            print(f"✓ Perfil de frames guardado en {path}")
+            return True
+        except OSError as e:
+            print(f"[!] No se pudo guardar el perfil de frames: {e}")
+            return False
+
+    # ------------------------------------------------------------------
+    # Overlay
+    # ------------------------------------------------------------------
+
+    def _refresh_text(self):
+        """Recalcula las líneas de texto del overlay"""
+        recent = self._recent(self.GRAPH_FRAMES)
+        work = sorted(frame[1] for frame in recent)
+        intervals = [frame[2] for frame in recent if frame[2] > 0]
+        fps = 1000.0 / (sum(intervals) / len(intervals)) if intervals else 0.0
+
+        lines = [
+            f"FPS {fps:5.1f}   trabajo p50 {percentile(work, 50):5.2f} ms",
+            f"p95 {percentile(work, 95):5.2f} ms   p99 {percentile(work, 99):5.2f} ms",
+        ]
+        for name, ms in self.top_sections():
+            lines.append(f"{name:<18}{ms:6.2f} ms")
+        self._text_lines = lines
+
+    def draw_overlay(self, screen):
+        """Dibuja la gráfica y el top de fases (su coste no se contabiliza)"""
+        if not self.enabled or not self.frames:
+            return
+        if self._font is None:
+            self._font = get_font(None, 18)
+        if self.total_frames % self.TEXT_REFRESH == 0 or not self._text_lines:
+            self._refresh_text()
+
+        height = self.GRAPH_HEIGHT + 12 + len(self._text_lines) * self.LINE_HEIGHT
+        if self._panel is None or self._panel.get_height() != height:
+            self._panel = pygame.Surface((self.PANEL_WIDTH, height))
+            self._panel.set_alpha(200)
+        panel = self._panel
+        panel.fill((10, 10, 20))
+
+        # Gráfica del trabajo por frame (barras de 2 px, la más reciente a la derecha)
+        graph_bottom = self.GRAPH_HEIGHT + 4
+        scale = self.GRAPH_HEIGHT / self.GRAPH_MAX_MS
+        recent = self._recent(self.GRAPH_FRAMES)
+        x = self.PANEL_WIDTH - 4 - len(recent) * 2
+        for _, work, _, _ in recent:
+            bar = min(self.GRAPH_HEIGHT, int(work * scale))
+            color = (80, 200, 80)
+            if work > self.BUDGETS_MS[1][0]:
+                color = (230, 70, 70)
+            elif work > self.BUDGETS_MS[0][0]:
+                color = (220, 160, 60)
+            if bar > 0:
+                pygame.draw.line(panel, color, (x, graph_bottom), (x, graph_bottom - bar), 2)
+            x += 2
+        for budget, color in self.BUDGETS_MS:
+            y = graph_bottom - int(budget * scale)
+            pygame.draw.line(panel, color, (4, y), (self.PANEL_WIDTH - 4, y), 1)
+
+        y = graph_bottom + 6
+        for line in self._text_lines:
+            panel.blit(render_text(self._font, line, True, (230, 230, 230)), (6, y))
+            y += self.LINE_HEIGHT
+
+        screen.blit(panel, (screen.get_width() - self.PANEL_WIDTH - 8, self.PANEL_POS_Y))
+        self.skip()
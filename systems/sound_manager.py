@@ -4,8 +4,14 @@ SoundManager - Gestor de sonidos del juego
 """
 
 import pygame
+import hashlib
+import json
 import os
-from utils.resource import resource_path
+import time
+import wave
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from utils.resource import resource_path, writable_path
+from utils.lazy_import import lazy_import, module_available
 
 # Importar librerías opcionales
 try:
@@ -14,18 +20,45 @@ try:
 except ImportError:
     HAS_NUMPY = False
 
-try:
-    from scipy import signal
-    from scipy.io import wavfile
-    HAS_SCIPY = True
-except ImportError:
-    HAS_SCIPY = False
+# scipy.signal tarda ~1 s en importarse: solo se carga al sintetizar el
+# primer sonido que necesita un filtro
+signal = lazy_import("scipy.signal")
+HAS_SCIPY = module_available("scipy")
+
+# === OPTIMIZACIÓN: caché en disco de los sonidos sintetizados ===
+# La síntesis (con filtfilt de scipy sobre ruido blanco) se repetía en cada
+# arranque. El PCM generado se guarda como WAV y los siguientes arranques
+# solo hacen pygame.mixer.Sound(archivo), sin importar scipy.
+SOUND_CACHE_DIR = "cache_sonidos"
+# Subir al cambiar cualquier generador: invalida los WAV ya guardados
+SYNTH_VERSION = 1
+
+# nombre -> (método generador, parámetros); forman la clave de la caché
+SYNTH_SPECS = {
+    'shoot': ('_generate_laser_shot', {'duration': 0.1}),
+    'explosion': ('_generate_explosion', {'duration': 0.5}),
+    'hit': ('_generate_hit', {'duration': 0.15}),
+    'correct': ('_generate_success_chime', {'duration': 0.3}),
+    'wrong': ('_generate_error_buzz', {'duration': 0.25}),
+    'damage': ('_generate_damage_sound', {'duration': 0.2}),
+}
+
+# === OPTIMIZACIÓN: SÍNTESIS EN PARALELO Y BAJO DEMANDA ===
+# Sin caché, los seis generadores corrían en serie dentro de Game() antes de
+# mostrar el menú. Ahora se envían a un pool de hilos (NumPy y SciPy liberan
+# el GIL en sus kernels) en este orden: primero lo que se oye al responder y
+# al final la explosión (filtfilt sobre ruido blanco, la más lenta).
+SYNTH_PRIORITY = ('correct', 'wrong', 'shoot', 'hit', 'damage', 'explosion')
+SYNTH_WORKERS = 4
+# Sonidos que deben estar listos al empezar a jugar (y espera máxima en s)
+GAMEPLAY_SOUNDS = ('correct', 'wrong')
+GAMEPLAY_WAIT_TIMEOUT = 2.0
 
 
 class SoundManager:
     """Gestor de sonidos profesionales del juego usando scipy y numpy"""
     
-    def __init__(self):
+    def __init__(self, create_sounds=True):
         # Detectar si estamos en web para optimizar
         import sys
         import os
@@ -40,7 +73,10 @@ class SoundManager:
         self.music_channel = None
         self.hit_sound_index = 0  # Para alternar entre los dos sonidos de hit
         self.final_sound_channel = None  # Canal para el sonido final (para poder detenerlo)
-        self._create_professional_sounds()
+        # nombre -> Future con el PCM de los sonidos que aún se sintetizan
+        self._pending = {}
+        if create_sounds:
+            self._create_professional_sounds()
         # No iniciar música automáticamente, se iniciará cuando comience el juego
     
     def _apply_envelope(self, sig, attack=0.01, decay=0.1, sustain=0.7, release=0.2):
@@ -109,7 +145,7 @@ class SoundManager:
         sound_array[:, 0] = (sig * max_sample).astype(np.int16)
         sound_array[:, 1] = sound_array[:, 0]
         
-        return pygame.sndarray.make_sound(sound_array)
+        return sound_array
     
     def _generate_explosion(self, duration=0.5):
         """Genera sonido de explosión estilo arcade retro"""
@@ -149,7 +185,7 @@ class SoundManager:
         sound_array[:, 0] = (audio_sig * max_sample).astype(np.int16)
         sound_array[:, 1] = sound_array[:, 0]
         
-        return pygame.sndarray.make_sound(sound_array)
+        return sound_array
     
     def _generate_hit(self, duration=0.15):
         """Genera sonido de impacto explosivo y grave"""
@@ -196,7 +232,7 @@ class SoundManager:
         sound_array[:, 0] = (sig * max_sample).astype(np.int16)
         sound_array[:, 1] = sound_array[:, 0]
         
-        return pygame.sndarray.make_sound(sound_array)
+        return sound_array
     
     def _generate_success_chime(self, duration=0.3):
         """Genera sonido de éxito estilo arcade (melodía ascendente)"""
@@ -244,7 +280,7 @@ class SoundManager:
         sound_array[:, 0] = (sig * max_sample).astype(np.int16)
         sound_array[:, 1] = sound_array[:, 0]
         
-        return pygame.sndarray.make_sound(sound_array)
+        return sound_array
     
     def _generate_error_buzz(self, duration=0.25):
         """Genera sonido de error estilo arcade (buzz descendente)"""
@@ -270,7 +306,7 @@ class SoundManager:
         sound_array[:, 0] = (sig * max_sample).astype(np.int16)
         sound_array[:, 1] = sound_array[:, 0]
         
-        return pygame.sndarray.make_sound(sound_array)
+        return sound_array
     
     def _generate_damage_sound(self, duration=0.2):
         """Genera sonido de daño estilo arcade retro"""
@@ -299,7 +335,7 @@ class SoundManager:
         sound_array[:, 0] = (sig * max_sample).astype(np.int16)
         sound_array[:, 1] = sound_array[:, 0]
         
-        return pygame.sndarray.make_sound(sound_array)
+        return sound_array
     
     def _create_professional_sounds(self):
         """Crea sonidos profesionales usando scipy o carga archivos si existen"""
@@ -336,20 +372,134 @@ class SoundManager:
             else:
                 self.sounds['final'] = None
 
-            if HAS_NUMPY:
-                # Generar sonidos sintetizados si no se cargaron archivos (o para complementar)
-                self.sounds['shoot'] = self._generate_laser_shot()
-                self.sounds['explosion'] = self._generate_explosion()
-                self.sounds['hit'] = self._generate_hit()
-                self.sounds['correct'] = self._generate_success_chime()
-                self.sounds['wrong'] = self._generate_error_buzz()
-                self.sounds['damage'] = self._generate_damage_sound()
-            else:
+            # Sonidos sintetizados: desde la caché en disco o generándolos
+            missing = [name for name in SYNTH_PRIORITY if not self._load_cached_sound(name)]
+            cached = len(SYNTH_PRIORITY) - len(missing)
+            if cached:
+                print(f"✓ {cached}/{len(SYNTH_PRIORITY)} sonidos sintetizados cargados desde caché")
+            if missing and not HAS_NUMPY:
                 print("Numpy no disponible, sonidos generados deshabilitados")
+            elif missing and self.is_web:
+                # En web no hay hilos: síntesis en serie como antes
+                for name in missing:
+                    self.sounds[name] = self._make_sound(self._synthesize_and_cache(name))
+            elif missing:
+                executor = ThreadPoolExecutor(max_workers=min(SYNTH_WORKERS, len(missing)),
+                                              thread_name_prefix="SintesisSonido")
+                for name in missing:
+                    self._pending[name] = executor.submit(self._synthesize_and_cache, name)
+                # Los hilos terminan solos al vaciarse la cola
+                executor.shutdown(wait=False)
+                print(f"✓ Sintetizando {len(missing)} sonidos en segundo plano")
                 
         except Exception as e:
             print(f"Error creando sonidos profesionales: {e}")
     
+    # ------------------------------------------------------------------
+    # Caché de sonidos sintetizados
+    # ------------------------------------------------------------------
+
+    def _sound_cache_key(self, name):
+        """Clave del sonido: versión de la síntesis, sample rate y parámetros"""
+        method, params = SYNTH_SPECS[name]
+        payload = json.dumps([SYNTH_VERSION, self.sample_rate, method, params], sort_keys=True)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+    def _sound_cache_filename(self, name):
+        return f"{name}_{self.sample_rate}_{self._sound_cache_key(name)}.wav"
+
+    def _cached_sound_path(self, name):
+        """WAV en caché del sonido (escribible o empaquetado), o None"""
+        filename = self._sound_cache_filename(name)
+        for directory in (writable_path(SOUND_CACHE_DIR), resource_path(SOUND_CACHE_DIR)):
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def _synthesize(self, name):
+        """PCM int16 estéreo del sonido (o None sin numpy)"""
+        method, params = SYNTH_SPECS[name]
+        return getattr(self, method)(**params)
+
+    def _load_cached_sound(self, name):
+        """Carga el sonido desde la caché en disco; True si lo encontró"""
+        path = self._cached_sound_path(name)
+        if path is None:
+            return False
+        try:
+            self.sounds[name] = pygame.mixer.Sound(path)
+            return True
+        except Exception as e:
+            print(f"[!] Sonido en caché inválido ({path}): {e}")
+            return False
+
+    def _synthesize_and_cache(self, name):
+        """Genera el PCM y lo guarda en caché (seguro en un hilo: no usa el mixer)"""
+        if not HAS_NUMPY:
+            return None
+        pcm = self._synthesize(name)
+        # Sin scipy la explosión y el impacto salen sin filtrar: no se guardan
+        if pcm is not None and HAS_SCIPY:
+            self.save_sound_cache(name, pcm, writable_path(SOUND_CACHE_DIR))
+        return pcm
+
+    @staticmethod
+    def _make_sound(pcm):
+        return pygame.sndarray.make_sound(pcm) if pcm is not None else None
+
+    def _resolve_pending(self, name, timeout=0):
+        """Pasa a `sounds` el sonido si ya se sintetizó (espera hasta `timeout` s)"""
+        future = self._pending.get(name)
+        if future is None:
+            return True
+        if timeout <= 0 and not future.done():
+            return False
+        try:
+            pcm = future.result(timeout=timeout)
+        except FutureTimeout:
+            return False
+        except Exception as e:
+            print(f"[!] Error sintetizando el sonido {name}: {e}")
+            pcm = None
+        del self._pending[name]
+        self.sounds[name] = self._make_sound(pcm)
+        return True
+
+    def wait_for_sounds(self, names=GAMEPLAY_SOUNDS, timeout=GAMEPLAY_WAIT_TIMEOUT):
+        """Espera (como mucho `timeout` s en total) a que `names` estén listos"""
+        if not self._pending:
+            return True
+        deadline = time.perf_counter() + timeout
+        ready = True
+        for name in names:
+            remaining = max(0.0, deadline - time.perf_counter())
+            ready = self._resolve_pending(name, remaining) and ready
+        return ready
+
+    def save_sound_cache(self, name, pcm, directory):
+        """Escribe el PCM como WAV en `directory` y borra versiones antiguas"""
+        filename = self._sound_cache_filename(name)
+        path = os.path.join(directory, filename)
+        tmp_path = path + ".tmp"
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with wave.open(tmp_path, "wb") as wav:
+                wav.setnchannels(pcm.shape[1])
+                wav.setsampwidth(2)
+                wav.setframerate(self.sample_rate)
+                wav.writeframes(np.ascontiguousarray(pcm, dtype="<i2").tobytes())
+            os.replace(tmp_path, path)
+            # Mismo sonido y sample rate con otra clave = caché obsoleta
+            prefix = f"{name}_{self.sample_rate}_"
+            for old in os.listdir(directory):
+                if old.startswith(prefix) and old.endswith(".wav") and old != filename:
+                    os.remove(os.path.join(directory, old))
+        except OSError as e:
+            print(f"[!] No se pudo guardar el sonido {name} en caché: {e}")
+            return None
+        return path
+    
     def _start_background_music(self, level=1, volume=0.5):
         """Inicia música de fondo desde archivo Battleship.ogg"""
         try:
@@ -423,6 +573,9 @@ class SoundManager:
             loops: Número de loops (-1 para loop infinito, 0 para reproducir una vez)
         """
         try:
+            # Un sonido que aún se sintetiza se omite en silencio
+            if sound_name in self._pending:
+                self._resolve_pending(sound_name)
             if sound_name in self.sounds and self.sounds[sound_name] is not None:
                 if sound_name == 'hit':
                     final_volume = min(1.0, volume * game_sound_volume * 1.5)
@@ -449,3 +602,34 @@ class SoundManager:
                 self.final_sound_channel = None
         except Exception as e:
             pass
+
+
+def bake_sound_cache(directory, sample_rates=(44100, 22050)):
+    """Genera los WAV de la caché para cada sample rate (paso de empaquetado)"""
+    written = []
+    for sample_rate in sample_rates:
+        manager = SoundManager(create_sounds=False)
+        manager.sample_rate = sample_rate
+        for name in SYNTH_SPECS:
+            pcm = manager._synthesize(name)
+            if pcm is not None:
+                path = manager.save_sound_cache(name, pcm, directory)
+                if path:
+                    written.append(path)
+    return written
+
+
+if __name__ == "__main__":
+    # Pre-generar la caché junto a los assets (desktop 44100 Hz, web 22050 Hz)
+    import sys
+
+    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    if not (HAS_NUMPY and HAS_SCIPY):
+        print("[!] Se necesitan numpy y scipy para generar la caché de sonidos")
+        sys.exit(1)
+    destino = resource_path(SOUND_CACHE_DIR)
+    archivos = bake_sound_cache(destino)
+    print(f"✓ {len(archivos)} sonidos guardados en {destino}")
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+Tabla precompilada del modelo de tiempo de respuesta
+
+`TiempoAdaptativo.predecir_tiempo` armaba un array 1x4 y llamaba a
+`predict` de scikit-learn para una sola fila (cientos de µs a ms en el hilo
+principal). Las entradas del modelo son dominios discretos y pequeños: 4
+signos, respuestas correctas acumuladas, vidas 0-5 y nivel 1-3. Aquí se
+evalúa el modelo una sola vez sobre toda la rejilla y la predicción pasa a
+ser una consulta O(1) en un array denso.
+
+Las respuestas correctas no tienen tope, pero un modelo de árboles es
+constante a partir de su mayor umbral en esa variable: la rejilla llega hasta
+ese umbral y los índices mayores se recortan al último, sin cambiar la
+salida. `desviacion_maxima` compara la tabla con el modelo vivo (incluido el
+tramo recortado) para comprobarlo.
+
+La tabla se guarda en `tabla_tiempo.npz` junto con la firma SHA-1 del .pkl,
+así las siguientes ejecuciones no necesitan cargar scikit-learn. Para
+generarla al empaquetar:
+    python -m systems.tabla_tiempo
+"""
+
+import hashlib
+import math
+import os
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+TABLA_FILENAME = "tabla_tiempo.npz"
+
+NUM_SIGNOS = 4           # signo_map: '*'=0, '+'=1, '-'=2, '/'=3
+VIDAS_MIN, VIDAS_MAX = 0, 5
+NIVEL_MIN, NIVEL_MAX = 1, 3
+# Tope de respuestas correctas si el modelo no expone sus umbrales
+CORRECTAS_MAX_DEFECTO = 100
+# Índice de la variable "respuestas correctas" en las features del modelo
+FEATURE_CORRECTAS = 1
+
+
+def firma_modelo(path):
+    """SHA-1 del archivo del modelo (invalida la tabla si el .pkl cambia)"""
+    sha = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def _umbral_maximo(modelo, feature):
+    """Mayor umbral de corte sobre `feature` en un modelo de árboles (o None)"""
+    estimadores = getattr(modelo, "estimators_", None)
+    if estimadores is None:
+        arbol = getattr(modelo, "tree_", None)
+        estimadores = [[modelo]] if arbol is not None else None
+    if estimadores is None:
+        return None
+
+    umbral = None
+    for estimador in np.asarray(estimadores, dtype=object).ravel():
+        arbol = getattr(estimador, "tree_", None)
+        if arbol is None:
+            return None
+        usados = arbol.threshold[arbol.feature == feature]
+        if len(usados):
+            maximo = float(usados.max())
+            umbral = maximo if umbral is None else max(umbral, maximo)
+    return umbral
+
+
+def _rejilla(correctas_max):
+    """Todas las combinaciones (signo, correctas, vidas, nivel) en orden C"""
+    ejes = np.indices((NUM_SIGNOS, correctas_max + 1,
+                       VIDAS_MAX - VIDAS_MIN + 1, NIVEL_MAX - NIVEL_MIN + 1))
+    ejes = ejes.reshape(4, -1).T
+    ejes[:, 2] += VIDAS_MIN
+    ejes[:, 3] += NIVEL_MIN
+    return ejes
+
+
+class TablaTiempo:
+    """Predicciones del modelo de tiempo precalculadas sobre la rejilla de entradas"""
+
+    def __init__(self, tabla, firma=None, max_desviacion=None):
+        self.tabla = tabla
+        self.correctas_max = tabla.shape[1] - 1
+        self.firma = firma
+        self.max_desviacion = max_desviacion
+
+    @classmethod
+    def compilar(cls, modelo, firma=None, correctas_max=None):
+        """Evalúa `modelo` sobre toda la rejilla en una sola llamada a predict"""
+        if correctas_max is None:
+            umbral = _umbral_maximo(modelo, FEATURE_CORRECTAS)
+            correctas_max = (max(0, int(math.floor(umbral)) + 1)
+                             if umbral is not None else CORRECTAS_MAX_DEFECTO)
+
+        rejilla = _rejilla(correctas_max)
+        predicciones = np.asarray(modelo.predict(rejilla), dtype=np.float64)
+        tabla = predicciones.reshape(NUM_SIGNOS, correctas_max + 1,
+                                     VIDAS_MAX - VIDAS_MIN + 1, NIVEL_MAX - NIVEL_MIN + 1)
+        return cls(tabla, firma)
+
+    def predecir(self, signo_encoded, respuestas_correctas, vidas, nivel):
+        """Consulta O(1); las entradas fuera de rango se recortan al borde"""
+        correctas = min(max(int(respuestas_correctas), 0), self.correctas_max)
+        vidas = min(max(int(vidas), VIDAS_MIN), VIDAS_MAX) - VIDAS_MIN
+        nivel = min(max(int(nivel), NIVEL_MIN), NIVEL_MAX) - NIVEL_MIN
+        return float(self.tabla[signo_encoded, correctas, vidas, nivel])
+
+    def desviacion_maxima(self, modelo, factor_extra=4):
+        """
+        Máxima diferencia absoluta con el modelo vivo sobre la rejilla y sobre
+        respuestas correctas hasta `factor_extra` veces el tope (zona recortada).
+        """
+        rejilla = _rejilla(max(self.correctas_max * factor_extra, self.correctas_max + 1))
+        vivo = np.asarray(modelo.predict(rejilla), dtype=np.float64)
+        correctas = np.minimum(rejilla[:, 1], self.correctas_max)
+        tabla = self.tabla[rejilla[:, 0], correctas,
+                           rejilla[:, 2] - VIDAS_MIN, rejilla[:, 3] - NIVEL_MIN]
+        self.max_desviacion = float(np.max(np.abs(tabla - vivo)))
+        return self.max_desviacion
+
+    def guardar(self, path):
+        """Guarda la tabla y la firma del modelo en un .npz"""
+        tmp_path = path + ".tmp.npz"
+        np.savez_compressed(tmp_path, tabla=self.tabla, firma=np.array(self.firma or ""),
+                            max_desviacion=np.array(-1.0 if self.max_desviacion is None
+                                                    else self.max_desviacion))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def cargar(cls, path, firma=None):
+        """Carga una tabla guardada; None si no existe o no coincide la firma"""
+        if not HAS_NUMPY or not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as datos:
+                firma_guardada = str(datos["firma"])
+                if firma is not None and firma_guardada != firma:
+                    return None
+                desviacion = float(datos["max_desviacion"])
+                return cls(datos["tabla"], firma_guardada,
+                           None if desviacion < 0 else desviacion)
+        except (OSError, KeyError, ValueError) as e:
+            print(f"[!] Tabla de tiempo inválida ({path}): {e}")
+            return None
+
+
+if __name__ == "__main__":
+    # Compilar la tabla junto al modelo (paso de empaquetado)
+    import sys
+
+    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+
+    import joblib
+    from utils.resource import resource_path
+
+    modelo_path = resource_path("mejor_modelo_tiempo.pkl")
+    modelo = joblib.load(modelo_path)
+    tabla = TablaTiempo.compilar(modelo, firma_modelo(modelo_path))
+    desviacion = tabla.desviacion_maxima(modelo)
+    destino = resource_path(TABLA_FILENAME)
+    tabla.guardar(destino)
+    print(f"✓ Tabla {tabla.tabla.shape} guardada en {destino} "
+          f"(desviación máxima {desviacion:.3g} s)")
@@ -7,10 +7,12 @@ import pygame
 import threading
 import asyncio
 
-try:
-    import websockets
-except ImportError:
-    websockets = None
+from utils.lazy_import import lazy_import, module_available
+
+# websockets se importa en el hilo del controlador, al conectarse
+websockets = lazy_import("websockets")
+HAS_WEBSOCKETS = module_available("websockets")
+if not HAS_WEBSOCKETS:
     print("ADVERTENCIA: websockets no está instalado. Ejecuta: pip install websockets")
 
 
@@ -52,7 +54,7 @@ class WebSocketController:
         
     def start(self):
         """Inicia la conexión WebSocket en un hilo separado"""
-        if websockets is None:
+        if not HAS_WEBSOCKETS:
             print("WebSocket Controller: No se puede iniciar sin la librería websockets")
             return False
             
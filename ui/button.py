@@ -7,6 +7,8 @@ import pygame
 import math
 
 from config import WHITE
+from utils.text_cache import render_text
+from utils.fonts import get_font
 
 
 class Button:
@@ -159,7 +161,7 @@ class Button:
         screen.blit(button_surface, self.rect)
         
         # === CONTENIDO: ICONO + TEXTO ===
-        text_surface = self.font.render(self.text, True, WHITE)
+        text_surface = render_text(self.font, self.text, True, WHITE)
         text_w = text_surface.get_width()
         text_h = text_surface.get_height()
         
@@ -180,7 +182,7 @@ class Button:
         text_y = self.rect.centery - text_h // 2
         
         # Sombra sutil del texto
-        text_shadow = self.font.render(self.text, True, (0, 0, 0))
+        text_shadow = render_text(self.font, self.text, True, (0, 0, 0))
         screen.blit(text_shadow, (text_x + 1, text_y + 1))
         # Texto principal blanco brillante
         screen.blit(text_surface, (text_x, text_y))
@@ -231,8 +233,8 @@ class CircularButton:
             key_rect = pygame.Rect(cx - key_size//2, cy - key_size//2, key_size, key_size)
             pygame.draw.rect(screen, icon_color, key_rect, 2, border_radius=3)
             # Letra "W" en el centro
-            font = pygame.font.Font(None, int(size * 0.7))
-            w_text = font.render("W", True, icon_color)
+            font = get_font(None, int(size * 0.7))
+            w_text = render_text(font, "W", True, icon_color)
             w_rect = w_text.get_rect(center=(cx, cy))
             screen.blit(w_text, w_rect)
             
@@ -295,9 +297,9 @@ class CircularButton:
         
         # Etiqueta de texto siempre visible a la izquierda
         if self.tooltip:
-            label_font = pygame.font.Font(None, 26)
+            label_font = get_font(None, 26)
             label_color = self.color if self.is_hovered else (180, 180, 180)
-            label_surface = label_font.render(self.tooltip, True, label_color)
+            label_surface = render_text(label_font, self.tooltip, True, label_color)
             
             # Posicionar etiqueta a la izquierda del botón
             label_x = self.x - self.radius - label_surface.get_width() - 15
@@ -0,0 +1,259 @@
+"""
+Registro de respuestas en formato JSON Lines (una respuesta por línea).
+
+Antes cada respuesta cargaba `resultados.json` completo, añadía una entrada y
+reescribía el archivo con `indent=2` en el hilo principal: E/S proporcional al
+historial en cada respuesta y un tirón visible justo en el frame de responder.
+
+Ahora el juego solo encola la entrada; un hilo en segundo plano las agrupa y
+las añade al final de `resultados.jsonl`. La cola es acotada y se vacía al
+salir. En la web (Pygbag, sin hilos) se añade la línea directamente, que ya es
+una operación O(1).
+
+El `resultados.json` antiguo se migra una sola vez al nuevo formato y se deja
+intacto (está versionado en el repositorio): una vez existe `resultados.jsonl`
+ya no se vuelve a leer. `iter_answers` / `load_answers` leen cualquiera de
+los dos (notebooks, scripts de análisis); `tail_answers` lee solo el final
+del .jsonl, hacia atrás desde EOF (TiempoAdaptativo, en el hilo principal).
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+
+
+ANSWER_LOG_FILENAME = "resultados.jsonl"
+LEGACY_FILENAME = "resultados.json"
+
+# Marca de cierre para el hilo escritor
+_CLOSE = object()
+
+
+def migrate_legacy_json(legacy_path, jsonl_path):
+    """
+    Convierte un `resultados.json` (lista JSON) a JSON Lines una sola vez.
+
+    Escribe primero a un temporal y lo renombra, así una interrupción nunca
+    deja un .jsonl a medias. El original no se toca: si el .jsonl ya existe
+    la migración está hecha y se omite. Devuelve el número de entradas
+    migradas.
+    """
+    if not os.path.exists(legacy_path) or os.path.exists(jsonl_path):
+        return 0
+
+    try:
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except json.JSONDecodeError:
+        entries = []
+    if not isinstance(entries, list):
+        entries = []
+
+    tmp_path = jsonl_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, jsonl_path)
+    return len(entries)
+
+
+def iter_answers(path):
+    """
+    Itera las respuestas registradas en `path`.
+
+    Acepta JSON Lines (ignora líneas vacías o cortadas por un cierre abrupto)
+    o el formato antiguo de lista JSON. Si `path` es un .jsonl que aún no
+    existe, se lee el `resultados.json` antiguo del mismo directorio.
+    """
+    if not os.path.exists(path) and path.endswith(".jsonl"):
+        legacy = os.path.join(os.path.dirname(path), LEGACY_FILENAME)
+        if os.path.exists(legacy):
+            path = legacy
+        else:
+            return
+
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == "[":
+            try:
+                entries = json.load(f)
+            except json.JSONDecodeError:
+                entries = []
+            for entry in entries:
+                yield entry
+            return
+
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def load_answers(path):
+    """Lista con todas las respuestas registradas en `path`"""
+    return list(iter_answers(path))
+
+
+def tail_answers(path, n, accept=None, block_size=8192):
+    """
+    Las últimas `n` respuestas de un .jsonl que cumplen `accept` (de la más
+    antigua a la más nueva).
+
+    Lee el archivo hacia atrás por bloques desde el final y se detiene al
+    reunir `n`: el coste depende de lo leído, no del tamaño del historial.
+    Las líneas cortadas o inválidas se ignoran. Si el archivo no existe
+    devuelve una lista vacía.
+    """
+    found = []
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return found
+
+    with f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        partial = b""
+        while position > 0 and len(found) < n:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            lines = (f.read(size) + partial).split(b"\n")
+            # La primera línea del bloque puede seguir en el bloque anterior
+            partial = lines.pop(0) if position > 0 else b""
+            for line in reversed(lines):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and (accept is None or accept(entry)):
+                    found.append(entry)
+                    if len(found) >= n:
+                        break
+
+    found.reverse()
+    return found
+
+
+class AnswerLog:
+    """Escritor de respuestas append-only con cola acotada y hilo en segundo plano"""
+
+    def __init__(self, path, legacy_path=None, threaded=True, max_queue=1024,
+                 batch_size=64, flush_interval=1.0):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.threaded = threaded
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._closed = False
+        self._tail_checked = False
+
+        if threaded:
+            # La migración se hace en el hilo, antes de la primera escritura
+            self._thread = threading.Thread(target=self._run, name="AnswerLog", daemon=True)
+            self._thread.start()
+        else:
+            self._migrate()
+        atexit.register(self.close)
+
+    def _migrate(self):
+        if not self.legacy_path:
+            return
+        try:
+            migrated = migrate_legacy_json(self.legacy_path, self.path)
+            if migrated:
+                print(f"✓ {migrated} respuestas migradas de {os.path.basename(self.legacy_path)} "
+                      f"a {os.path.basename(self.path)}")
+        except OSError as e:
+            print(f"[!] No se pudo migrar {self.legacy_path}: {e}")
+
+    def append(self, entry):
+        """Encola una respuesta (no bloquea el bucle del juego)"""
+        if self._closed:
+            return
+        if not self.threaded:
+            self._write([entry])
+            return
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1:
+                print("[!] Cola de resultados llena: se descartan respuestas")
+
+    def _needs_newline(self):
+        """True si el archivo termina en una línea cortada (cierre abrupto previo)"""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                if f.tell() == 0:
+                    return False
+                f.seek(-1, os.SEEK_END)
+                return f.read(1) != b"\n"
+        except OSError:
+            return False
+
+    def _write(self, entries):
+        """Añade las entradas al final del archivo"""
+        try:
+            text = "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+            if not self._tail_checked:
+                # No pegar la primera entrada a una línea incompleta
+                if self._needs_newline():
+                    text = "\n" + text
+                self._tail_checked = True
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(text)
+            self.written += len(entries)
+        except Exception as e:
+            print(f"Error al guardar resultados en {os.path.basename(self.path)}: {e}")
+
+    def _run(self):
+        """Bucle del hilo escritor: agrupa entradas y las escribe por lotes"""
+        self._migrate()
+        closing = False
+        while not closing:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            batch = []
+            while True:
+                if item is _CLOSE:
+                    closing = True
+                else:
+                    batch.append(item)
+                if closing or len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+
+    def close(self, timeout=2.0):
+        """Escribe lo pendiente y detiene el hilo (idempotente)"""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            # put bloqueante: la marca de cierre debe entrar aunque la cola esté llena
+            self._queue.put(_CLOSE)
+            self._thread.join(timeout)
@@ -0,0 +1,297 @@
+"""
+Almacén columnar de respuestas (mapeable en memoria).
+
+`1000registros.json` y los registros de respuestas son listas de dicts: leerlos
+obliga a parsear el archivo completo a objetos Python, y los logs agregados de
+las aulas van camino de millones de filas. Aquí cada campo es un array NumPy
+tipado y contiguo dentro de un único archivo:
+
+    [cabecera de HEADER_SIZE bytes][columna 1][columna 2]...
+
+La cabecera empieza con MAGIC, un uint32 con la longitud del JSON y el JSON
+(filas, capacidad, columnas con dtype y offset, y las categorías). Cada columna
+reserva `capacity` elementos alineados a 64 bytes, así añadir filas escribe en
+su sitio y solo se reescribe el archivo al duplicar la capacidad.
+`signo_operacional` y `tecla_presionada` se guardan como códigos int8 de
+categoría (-1 = valor ausente); los enteros ausentes valen -1 y los float NaN.
+
+Uso típico (notebooks):
+    python -m utils.answer_store resultados.jsonl resultados.col
+    store = AnswerStore("resultados.col")
+    df = store.to_dataframe()
+"""
+
+import json
+import os
+import struct
+import sys
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import pandas as pd
+    HAS_PANDAS = True
+except ImportError:
+    HAS_PANDAS = False
+
+
+MAGIC = b"NAVECOL1"
+HEADER_SIZE = 4096
+ALIGNMENT = 64
+DEFAULT_CAPACITY = 1024
+
+# (campo, dtype, tipo) en el orden de los registros del juego
+SCHEMA = (
+    ("nivel_actual", "int16", "int"),
+    ("vidas_actuales", "int8", "int"),
+    ("puntaje_actual", "int32", "int"),
+    ("respuestas_correctas_acumuladas", "int32", "int"),
+    # Tiempos en float64: float32 no devuelve los segundos tal como se registraron
+    ("tiempo_respuesta_pregunta", "float64", "float"),
+    ("tiempo_total_pregunta", "float64", "float"),
+    ("tecla_presionada", "int8", "category"),
+    ("numero_1", "int32", "int"),
+    ("numero_2", "int32", "int"),
+    ("signo_operacional", "int8", "category"),
+    ("resultado_operacional", "int32", "int"),
+)
+
+# Categorías conocidas (los valores nuevos se añaden al final)
+DEFAULT_CATEGORIES = {
+    "tecla_presionada": ["W", "A", "S", "D", "TIMEOUT", "UNKNOWN"],
+    "signo_operacional": ["+", "-", "*", "/", "TIMEOUT"],
+}
+
+MISSING_INT = -1
+MISSING_CATEGORY = -1
+
+
+def _align(offset):
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _layout(capacity):
+    """Descripción de columnas con sus offsets para una capacidad dada"""
+    columns = []
+    offset = HEADER_SIZE
+    for name, dtype, kind in SCHEMA:
+        columns.append({"name": name, "dtype": dtype, "kind": kind, "offset": offset})
+        offset = _align(offset + np.dtype(dtype).itemsize * capacity)
+    return columns, offset
+
+
+def _encode_header(header):
+    payload = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    data = MAGIC + struct.pack("<I", len(payload)) + payload
+    if len(data) > HEADER_SIZE:
+        raise ValueError("La cabecera del almacén columnar excede %d bytes" % HEADER_SIZE)
+    return data.ljust(HEADER_SIZE, b"\0")
+
+
+def _read_header(f):
+    f.seek(0)
+    magic = f.read(len(MAGIC))
+    if magic != MAGIC:
+        raise ValueError("No es un almacén columnar de respuestas (cabecera inválida)")
+    (length,) = struct.unpack("<I", f.read(4))
+    return json.loads(f.read(length).decode("utf-8"))
+
+
+class AnswerStore:
+    """Registros de respuestas en columnas tipadas dentro de un archivo mapeable"""
+
+    def __init__(self, path, capacity=DEFAULT_CAPACITY):
+        if not HAS_NUMPY:
+            raise RuntimeError("El almacén columnar requiere numpy")
+        self.path = path
+        if not os.path.exists(path):
+            self._create(path, capacity)
+        with open(path, "rb") as f:
+            self.header = _read_header(f)
+
+    # ------------------------------------------------------------------
+    # Estructura del archivo
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _create(path, capacity, rows=0, categories=None, columns_data=None):
+        """Crea el archivo con la capacidad dada (copiando columnas si se pasan)"""
+        capacity = max(1, int(capacity))
+        columns, size = _layout(capacity)
+        header = {
+            "version": 1,
+            "rows": rows,
+            "capacity": capacity,
+            "columns": columns,
+            "categories": categories or {k: list(v) for k, v in DEFAULT_CATEGORIES.items()},
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_encode_header(header))
+            f.truncate(size)
+            if columns_data:
+                for column in columns:
+                    values = columns_data[column["name"]]
+                    f.seek(column["offset"])
+                    f.write(np.ascontiguousarray(values, dtype=column["dtype"]).tobytes())
+        os.replace(tmp_path, path)
+
+    def _write_header(self, f):
+        f.seek(0)
+        f.write(_encode_header(self.header))
+
+    def __len__(self):
+        return self.header["rows"]
+
+    @property
+    def capacity(self):
+        return self.header["capacity"]
+
+    @property
+    def categories(self):
+        return self.header["categories"]
+
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+
+    def _encode_column(self, name, kind, dtype, entries):
+        """Convierte los valores de un campo al array tipado de su columna"""
+        if kind == "category":
+            categories = self.header["categories"].setdefault(name, [])
+            codes = []
+            for entry in entries:
+                value = entry.get(name)
+                if value is None:
+                    codes.append(MISSING_CATEGORY)
+                    continue
+                value = str(value)
+                if value not in categories:
+                    if len(categories) >= np.iinfo(dtype).max:
+                        raise ValueError("Demasiadas categorías en %s" % name)
+                    categories.append(value)
+                codes.append(categories.index(value))
+            return np.array(codes, dtype=dtype)
+
+        missing = np.nan if kind == "float" else MISSING_INT
+        values = [entry.get(name) for entry in entries]
+        return np.array([missing if value is None else value for value in values], dtype=dtype)
+
+    def append(self, entries):
+        """Añade registros (dicts con los campos del juego); devuelve cuántos"""
+        entries = list(entries)
+        if not entries:
+            return 0
+        rows = self.header["rows"]
+        encoded = {column["name"]: self._encode_column(column["name"], column["kind"],
+                                                       column["dtype"], entries)
+                   for column in self.header["columns"]}
+
+        needed = rows + len(entries)
+        if needed > self.capacity:
+            # Duplicar capacidad: reescribir el archivo con las columnas existentes
+            existing = self.columns(mmap=False)
+            merged = {name: np.concatenate([existing[name], encoded[name]]) for name in encoded}
+            self._create(self.path, max(self.capacity * 2, needed), needed,
+                         self.header["categories"], merged)
+            with open(self.path, "rb") as f:
+                self.header = _read_header(f)
+            return len(entries)
+
+        with open(self.path, "r+b") as f:
+            for column in self.header["columns"]:
+                itemsize = np.dtype(column["dtype"]).itemsize
+                f.seek(column["offset"] + rows * itemsize)
+                f.write(encoded[column["name"]].tobytes())
+            # La cabecera se actualiza al final: un corte deja las filas nuevas invisibles
+            self.header["rows"] = needed
+            self._write_header(f)
+        return len(entries)
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def column(self, name, mmap=True):
+        """Array de un campo (mapeado en memoria de solo lectura por defecto)"""
+        for column in self.header["columns"]:
+            if column["name"] == name:
+                break
+        else:
+            raise KeyError(name)
+
+        rows = self.header["rows"]
+        if rows == 0:
+            return np.empty(0, dtype=column["dtype"])
+        if mmap:
+            return np.memmap(self.path, dtype=column["dtype"], mode="r",
+                             offset=column["offset"], shape=(rows,))
+        with open(self.path, "rb") as f:
+            f.seek(column["offset"])
+            return np.fromfile(f, dtype=column["dtype"], count=rows)
+
+    def columns(self, mmap=True):
+        """Diccionario campo -> array con todas las columnas"""
+        return {column["name"]: self.column(column["name"], mmap)
+                for column in self.header["columns"]}
+
+    def decode(self, name, codes):
+        """Traduce códigos de categoría a sus valores (None si falta)"""
+        categories = self.header["categories"].get(name, [])
+        return [categories[code] if code >= 0 else None for code in codes.tolist()]
+
+    def to_dataframe(self):
+        """DataFrame de pandas con las categorías como `pd.Categorical`"""
+        if not HAS_PANDAS:
+            raise RuntimeError("to_dataframe requiere pandas")
+        data = {}
+        for column in self.header["columns"]:
+            values = self.column(column["name"])
+            if column["kind"] == "category":
+                categories = self.header["categories"].get(column["name"], [])
+                data[column["name"]] = pd.Categorical.from_codes(np.asarray(values, dtype=np.int16),
+                                                                 categories=categories)
+            else:
+                data[column["name"]] = np.asarray(values)
+        return pd.DataFrame(data)
+
+    def to_records(self):
+        """Lista de dicts con el mismo formato que el registro JSON"""
+        decoded = {}
+        for column in self.header["columns"]:
+            values = self.column(column["name"])
+            if column["kind"] == "category":
+                decoded[column["name"]] = self.decode(column["name"], values)
+            else:
+                decoded[column["name"]] = values.tolist()
+        names = list(decoded)
+        return [dict(zip(names, row)) for row in zip(*(decoded[name] for name in names))]
+
+
+def convert_answers(src_path, dst_path, chunk_size=65536):
+    """Convierte un registro JSON/JSON Lines a almacén columnar; devuelve filas"""
+    from utils.answer_log import iter_answers
+
+    store = AnswerStore(dst_path)
+    chunk = []
+    total = 0
+    for entry in iter_answers(src_path):
+        chunk.append(entry)
+        if len(chunk) >= chunk_size:
+            total += store.append(chunk)
+            chunk = []
+    if chunk:
+        total += store.append(chunk)
+    return total
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Uso: python -m utils.answer_store <registros.json|.jsonl> <destino.col>")
+        sys.exit(1)
+    rows = convert_answers(sys.argv[1], sys.argv[2])
+    print(f"✓ {rows} registros convertidos a {sys.argv[2]}")
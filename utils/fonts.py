@@ -0,0 +1,68 @@
+"""
+Registro global de fuentes.
+
+Construir un `pygame.font.Font` implica abrir y parsear el archivo TTF, así que
+crear fuentes dentro de `draw()` (por frame y por objeto) es trabajo perdido.
+Este módulo carga cada combinación `(ruta, tamaño)` una sola vez y entrega
+siempre la misma instancia compartida.
+
+`path=None` corresponde a la fuente por defecto de pygame, igual que en
+`pygame.font.Font(None, size)`.
+"""
+
+import threading
+
+import pygame
+
+
+_fonts = {}
+# La creación de fuentes (FT_New_Face) no es segura entre hilos; el lock
+# serializa las cargas del hilo de precarga y del hilo principal
+_lock = threading.Lock()
+
+
+def get_font(path, size):
+    """Devuelve la fuente compartida para `(path, size)`, cargándola si hace falta"""
+    key = (path, max(1, int(size)))
+    font = _fonts.get(key)
+    if font is not None:
+        return font
+
+    with _lock:
+        # Otro hilo pudo haberla cargado mientras esperábamos el lock
+        font = _fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, key[1])
+            _fonts[key] = font
+    return font
+
+
+def preload_fonts(specs, background=False):
+    """
+    Carga por adelantado una lista de `(path, size)`.
+
+    Con `background=True` la carga se hace en un hilo daemon y se devuelve el
+    hilo; las fuentes que se pidan antes de que termine se cargan igualmente
+    bajo demanda en el hilo principal.
+    """
+    specs = list(specs)
+
+    def _load_all():
+        for path, size in specs:
+            try:
+                get_font(path, size)
+            except (OSError, pygame.error) as e:
+                print(f"[!] No se pudo precargar la fuente {path} ({size}): {e}")
+
+    if not background:
+        _load_all()
+        return None
+
+    thread = threading.Thread(target=_load_all, name="font-preload", daemon=True)
+    thread.start()
+    return thread
+
+
+def loaded_fonts():
+    """Número de fuentes cargadas en el registro"""
+    return len(_fonts)
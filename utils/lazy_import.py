@@ -0,0 +1,84 @@
+"""
+Importación diferida de dependencias pesadas.
+
+`import game` cargaba scipy.signal (vía SoundManager), joblib (vía
+TiempoAdaptativo) y websockets antes del primer frame, aunque cada uno solo
+se necesita cuando su función se usa por primera vez. `lazy_import` devuelve
+un proxy que importa el módulo real en el primer acceso a un atributo y anota
+cuánto tardó; `module_available` comprueba si un paquete está instalado sin
+importarlo (para los flags HAS_X).
+
+    signal = lazy_import("scipy.signal")
+    HAS_SCIPY = module_available("scipy")
+    ...
+    b, a = signal.butter(4, 0.2, 'low')   # aquí se importa scipy.signal
+
+Como PyInstaller no ve estas importaciones, los módulos diferidos deben
+figurar en `hiddenimports` del .spec.
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+
+
+# Módulo -> segundos que tardó su importación diferida
+_load_times = {}
+_lock = threading.Lock()
+
+
+def module_available(name):
+    """True si `name` (paquete de primer nivel) se puede importar, sin importarlo"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+class LazyModule:
+    """Proxy de un módulo que se importa en el primer acceso a un atributo"""
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is not None:
+            return module
+        with _lock:
+            module = self.__dict__["_module"]
+            if module is None:
+                name = self.__dict__["_name"]
+                start = time.perf_counter()
+                module = importlib.import_module(name)
+                elapsed = time.perf_counter() - start
+                _load_times[name] = elapsed
+                self.__dict__["_module"] = module
+                print(f"✓ {name} importado bajo demanda ({elapsed * 1000:.0f} ms)")
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "cargado" if self.__dict__["_module"] is not None else "sin cargar"
+        return f"<LazyModule {self.__dict__['_name']} ({state})>"
+
+    @property
+    def loaded(self):
+        return self.__dict__["_module"] is not None
+
+
+def lazy_import(name):
+    """Proxy diferido de `name` (no importa nada hasta que se usa)"""
+    return LazyModule(name)
+
+
+def load_times():
+    """Tiempos de las importaciones diferidas realizadas hasta ahora (s)"""
+    return dict(_load_times)
@@ -0,0 +1,80 @@
+"""
+Pools de objetos reutilizables.
+
+Proyectiles, explosiones y efectos de combo se crean y descartan
+continuamente (la simulación del menú dispara cada 25/40 frames sin parar).
+Un pool guarda las instancias descartadas y las reinicia con `reset(...)`
+en lugar de construir objetos nuevos, lo que evita la basura constante que
+termina en pausas del recolector.
+
+La clase agrupada debe aceptar los mismos argumentos en `__init__` y en
+`reset`.
+"""
+
+
+# Registro de todos los pools creados (para estadísticas)
+_pools = {}
+
+
+class ObjectPool:
+    """Pool de instancias de una clase con marca de máximo uso simultáneo"""
+
+    def __init__(self, cls, name=None, max_free=256):
+        self.cls = cls
+        self.name = name or cls.__name__
+        self.max_free = max_free
+        self._free = []
+        self.created = 0
+        self.reused = 0
+        self.in_use = 0
+        self.high_water = 0
+        _pools[self.name] = self
+
+    def acquire(self, *args, **kwargs):
+        """Devuelve una instancia reiniciada (reutilizada o nueva)"""
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        obj._in_pool = False
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """
+        Devuelve una instancia al pool. Ignora objetos ya liberados o que no
+        salieron de un pool (creados con el constructor directamente).
+        """
+        if getattr(obj, '_in_pool', True):
+            return
+        obj._in_pool = True
+        self.in_use -= 1
+        if len(self._free) < self.max_free:
+            self._free.append(obj)
+
+    def stats(self):
+        """Resumen del uso del pool"""
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'in_use': self.in_use,
+            'free': len(self._free),
+            'high_water': self.high_water,
+        }
+
+
+def release(obj):
+    """Devuelve `obj` al pool de su clase, si la clase tiene uno"""
+    pool = getattr(type(obj), 'pool', None)
+    if pool is not None:
+        pool.release(obj)
+
+
+def pool_stats():
+    """Estadísticas de todos los pools registrados"""
+    return {name: pool.stats() for name, pool in _pools.items()}
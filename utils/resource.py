@@ -28,8 +28,14 @@ def app_dir() -> str:
 
 
 def writable_path(filename: str) -> str:
-    """Ruta donde podemos escribir archivos del juego."""
-    return os.path.join(app_dir(), filename)
+    """
+    Ruta donde podemos escribir archivos del juego.
+
+    `NAVE_DATA_DIR` redirige la escritura a otro directorio (ej. el benchmark
+    headless, para no mezclar sus respuestas simuladas con las de jugadores).
+    """
+    base = os.environ.get("NAVE_DATA_DIR") or app_dir()
+    return os.path.join(base, filename)
 
 
 
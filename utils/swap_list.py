@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+"""
+SwapList / OrderedList - Colecciones para entidades y efectos
+
+Las listas de explosiones, efectos de combo, proyectiles, enemigos y logros
+se recorrían como `for x in lista[:]: ... lista.remove(x)`: una copia de la
+lista por frame y, por cada elemento eliminado, una búsqueda O(n) (dos con
+el `if x in lista` de `Game._remove_pooled`).
+
+Las dos colecciones guardan qué objetos contienen, así que `in` es O(1), y
+su lista interna es copy-on-write: un recorrido usa la lista tal como estaba
+al empezar (no salta, no repite y no visita lo añadido durante él, igual que
+con `[:]`), y solo la primera modificación posterior hace la copia. Los
+frames sin altas ni bajas no copian nada.
+
+- `SwapList`: quitar es O(1) moviendo el último elemento al hueco
+  (swap-remove). El orden NO se conserva; sirve para colecciones grandes que
+  pierden elementos en cualquier posición y cuyo orden no importa
+  (proyectiles). `generation` cambia cada vez que un elemento cambia de
+  posición, así que las posiciones de un recorrido valen mientras no cambie.
+- `OrderedList`: conserva el orden de inserción (quitar usa `list.remove`,
+  que encuentra enseguida a los más viejos). Para efectos que mueren por
+  edad, logros que se apilan al dibujar y enemigos, cuyo orden decide el
+  objetivo de los disparos.
+
+Uso como micro-benchmark frente a las listas:
+    python -m utils.swap_list
+"""
+
+
+class _CopyOnWriteList:
+    """Base común: lista interna copy-on-write y pertenencia por id"""
+
+    def __init__(self, items=()):
+        self._items = []
+        # True si algún recorrido usa _items (la próxima modificación copia)
+        self._shared = False
+        self._reset_index()
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        self._shared = True
+        return iter(self._items)
+
+    def __repr__(self):
+        return "%s(%r)" % (type(self).__name__, self._items)
+
+    def _unshare(self):
+        """Copia la lista interna si un recorrido la está usando"""
+        if self._shared:
+            self._items = self._items[:]
+            self._shared = False
+
+    def remove(self, obj):
+        """Quita `obj` (ValueError si no está, como list.remove)"""
+        if not self.discard(obj):
+            raise ValueError("%s.remove(x): x no está en la colección" % type(self).__name__)
+
+    def clear(self):
+        """Vacía la colección (un recorrido en curso sigue con lo que tenía)"""
+        self._reset_index()
+        self._items = []
+        self._shared = False
+
+
+class SwapList(_CopyOnWriteList):
+    """Colección sin orden con `in`/`remove` O(1) y recorridos estables"""
+
+    def _reset_index(self):
+        # id(objeto) -> posición en _items (cada objeto está una sola vez)
+        self._index = {}
+        self.generation = getattr(self, "generation", -1) + 1
+
+    def __contains__(self, obj):
+        return id(obj) in self._index
+
+    def append(self, obj):
+        """Añade `obj` al final (si ya estaba, no hace nada)"""
+        key = id(obj)
+        if key not in self._index:
+            self._unshare()
+            self._index[key] = len(self._items)
+            self._items.append(obj)
+
+    def discard(self, obj):
+        """Quita `obj` si está; devuelve si estaba"""
+        position = self._index.pop(id(obj), None)
+        if position is None:
+            return False
+        self._unshare()
+        items = self._items
+        last = items.pop()
+        if position < len(items):
+            items[position] = last
+            self._index[id(last)] = position
+            self.generation += 1
+        return True
+
+
+class OrderedList(_CopyOnWriteList):
+    """Colección en orden de inserción con `in` O(1) y recorridos estables"""
+
+    def _reset_index(self):
+        # ids de los objetos contenidos (cada objeto está una sola vez)
+        self._members = set()
+
+    def __contains__(self, obj):
+        return id(obj) in self._members
+
+    def append(self, obj):
+        """Añade `obj` al final (si ya estaba, no hace nada)"""
+        key = id(obj)
+        members = self._members
+        if key not in members:
+            members.add(key)
+            if self._shared:
+                self._unshare()
+            self._items.append(obj)
+
+    def discard(self, obj):
+        """Quita `obj` si está, conservando el orden; devuelve si estaba"""
+        key = id(obj)
+        members = self._members
+        if key not in members:
+            return False
+        members.remove(key)
+        if self._shared:
+            self._unshare()
+        # Los más viejos, que son los que mueren, están al principio
+        self._items.remove(obj)
+        return True
+
+
+# ============================================================================
+# MICRO-BENCHMARK
+# ============================================================================
+
+class _Effect:
+    """Efecto de prueba que muere al agotar su vida"""
+
+    __slots__ = ("lifetime",)
+
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+
+    def update(self):
+        self.lifetime -= 1
+
+    def is_dead(self):
+        return self.lifetime <= 0
+
+
+def _frame_list(items, new_lifetime):
+    """Patrón anterior: copia de la lista, `in` y `remove` (como _remove_pooled)"""
+    for effect in items[:]:
+        effect.update()
+        if effect.is_dead():
+            if effect in items:
+                items.remove(effect)
+            items.append(_Effect(new_lifetime()))
+
+
+def _frame_collection(items, new_lifetime):
+    for effect in items:
+        effect.update()
+        if effect.is_dead():
+            items.discard(effect)
+            items.append(_Effect(new_lifetime()))
+
+
+def benchmark(sizes=(10, 100, 1000), frames=200):
+    """µs por frame actualizando `size` elementos que se renuevan al morir
+
+    - "edad": vida fija, mueren los más viejos primero (explosiones, efectos)
+    - "azar": vida aleatoria, mueren en cualquier posición (impactos)
+    """
+    import random
+    import time
+
+    results = {}
+    for workload in ("edad", "azar"):
+        for size in sizes:
+            row = {}
+            for name, container, frame in (("list", list, _frame_list),
+                                           ("OrderedList", OrderedList, _frame_collection),
+                                           ("SwapList", SwapList, _frame_collection)):
+                rng = random.Random(size)
+                if workload == "edad":
+                    new_lifetime = lambda: 30
+                else:
+                    new_lifetime = lambda: rng.randint(1, 60)
+                items = container(_Effect(rng.randint(1, 30)) for _ in range(size))
+                best = None
+                for _ in range(5):
+                    start = time.perf_counter()
+                    for _ in range(frames):
+                        frame(items, new_lifetime)
+                    elapsed = (time.perf_counter() - start) / frames
+                    best = elapsed if best is None else min(best, elapsed)
+                row[name] = best * 1e6
+            results[(workload, size)] = row
+    return results
+
+
+if __name__ == "__main__":
+    print("Muerte  Elementos  list[:] + in/remove  OrderedList   SwapList   (µs por frame)")
+    for (workload, size), row in benchmark().items():
+        print("%-6s  %9d  %19.1f  %11.1f  %9.1f" % (workload, size, row["list"],
+                                                   row["OrderedList"], row["SwapList"]))
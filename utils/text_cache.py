@@ -0,0 +1,72 @@
+"""
+Caché de superficies de texto renderizadas.
+
+`font.render()` rasteriza el texto completo en cada llamada, y la mayoría de
+los textos del juego (títulos, etiquetas del HUD, botones) se repiten idénticos
+frame tras frame. Este módulo guarda las superficies ya renderizadas en una
+caché LRU acotada, con la misma firma que `pygame.font.Font.render`.
+
+Las superficies devueltas son compartidas: no se deben modificar (set_alpha,
+fill, blit encima). Si se necesita alterarlas, usar `.copy()`.
+"""
+
+from collections import OrderedDict
+
+
+class TextCache:
+    """Caché LRU de superficies de texto con contadores de aciertos/fallos"""
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        """Equivalente a `font.render(...)` pero reutilizando superficies"""
+        # Los colores pueden llegar como listas o pygame.Color; se normalizan
+        # a tupla para que la clave sea hashable y estable
+        color = tuple(color)
+        if background is not None:
+            background = tuple(background)
+        key = (font, text, antialias, color, background)
+
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            # Expulsar la entrada usada hace más tiempo
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Vacía la caché y reinicia los contadores"""
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Devuelve un resumen del estado de la caché"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._surfaces),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / total) if total else 0.0,
+        }
+
+
+# Instancia compartida por todo el juego
+text_cache = TextCache()
+
+
+def render_text(font, text, antialias, color, background=None):
+    """Renderiza texto usando la caché compartida"""
+    return text_cache.render(font, text, antialias, color, background)
@@ -1,2 +1,4 @@
 # visuals package
 from visuals.space_objects import SpaceObject
+from visuals.background import BackgroundCache
+from visuals.parallax import ParallaxStarfield
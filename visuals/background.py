@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+BackgroundCache - Fondos de nivel (gradiente + estrellas) generados bajo demanda
+
+`Game._cache_all_backgrounds` dibujaba en `__init__` los tres niveles con 600
+`pygame.draw.line` y 100 círculos por nivel, aunque el jugador no pasara del
+nivel 1, y solo a 800x600. Aquí cada fondo se construye con NumPy la primera
+vez que se pide (o en un hilo con `prefetch`) y se memoriza por
+(nivel, resolución):
+
+- El gradiente es una sola operación vectorizada sobre las filas.
+- Las estrellas se estampan con las máscaras exactas de `pygame.draw.circle`
+  (capturadas una vez por radio), respetando el orden de dibujo original.
+
+A la resolución base el resultado es idéntico píxel a píxel al dibujo con
+`pygame.draw`; a otras resoluciones las estrellas se reescalan con la pantalla.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from config import IS_WEB, SCREEN_WIDTH, SCREEN_HEIGHT, WHITE
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+def _circle_offsets(radius):
+    """Desplazamientos (dx, dy) de los píxeles que pinta pygame.draw.circle"""
+    side = 2 * radius + 3
+    surface = pygame.Surface((side, side))
+    pygame.draw.circle(surface, WHITE, (radius + 1, radius + 1), radius)
+    xs, ys = np.nonzero(pygame.surfarray.pixels2d(surface))
+    return xs - (radius + 1), ys - (radius + 1)
+
+
+class BackgroundCache:
+    """Fondos por nivel y resolución, construidos una sola vez y memorizados"""
+
+    def __init__(self, level_configs, stars, base_size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        # nivel -> (color inicial, color final, color de estrella)
+        self.level_configs = level_configs
+        # (x, y, tamaño, brillo) en coordenadas de `base_size`
+        self.stars = list(stars)
+        self.base_size = base_size
+        self._surfaces = {}
+        self._futures = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        self._offsets = {}
+        if HAS_NUMPY:
+            # Las máscaras usan pygame.draw: se capturan aquí, en el hilo principal
+            radii = {size for _, _, size, _ in self.stars} | {1}
+            self._offsets = {radius: _circle_offsets(radius) for radius in radii}
+
+    def get(self, level, size):
+        """Superficie del fondo de `level` a `size` (la construye si hace falta)"""
+        key = (level, tuple(size))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            return surface
+        if level not in self.level_configs:
+            return None
+
+        with self._lock:
+            future = self._futures.pop(key, None)
+        if future is not None:
+            pixels = future.result()
+        elif HAS_NUMPY:
+            pixels = self._build_pixels(level, key[1])
+        else:
+            pixels = None
+
+        surface = pygame.Surface(key[1])
+        if pixels is not None:
+            pygame.surfarray.blit_array(surface, pixels)
+        else:
+            self._draw_fallback(surface, level)
+        self._surfaces[key] = surface
+        return surface
+
+    def prefetch(self, level, size):
+        """Construye el fondo en un hilo para que `get` no espere (no en web)"""
+        key = (level, tuple(size))
+        if IS_WEB or not HAS_NUMPY or level not in self.level_configs:
+            return
+        with self._lock:
+            if key in self._surfaces or key in self._futures:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Fondos")
+            self._futures[key] = self._executor.submit(self._build_pixels, level, key[1])
+
+    def clear(self):
+        """Descarta los fondos memorizados y los prefetch pendientes (ej. tras
+        cambiar de resolución); los que ya están en marcha se abandonan"""
+        with self._lock:
+            self._surfaces.clear()
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+
+    # ------------------------------------------------------------------
+    # Construcción (solo NumPy: se puede ejecutar en un hilo)
+    # ------------------------------------------------------------------
+
+    def _build_pixels(self, level, size):
+        """Array (ancho, alto, 3) uint8 con el gradiente y las estrellas"""
+        bg_start, bg_end, star_color = self.level_configs[level]
+        width, height = size
+
+        # Gradiente vertical: misma fórmula y truncado que el dibujo por líneas
+        progress = np.arange(height) / height
+        start = np.array(bg_start, dtype=np.float64)
+        end = np.array(bg_end, dtype=np.float64)
+        rows = (start[None, :] + (end - start)[None, :] * progress[:, None]).astype(np.uint8)
+        pixels = np.empty((width, height, 3), dtype=np.uint8)
+        pixels[:] = rows[None, :, :]
+
+        self._stamp_stars(pixels, star_color)
+        return pixels
+
+    def _stamp_stars(self, pixels, star_color):
+        """Estampa las estrellas en orden: en cada píxel gana el último trazo"""
+        if not self.stars:
+            return
+        width, height = pixels.shape[:2]
+        stars = np.array(self.stars, dtype=np.int64)
+        xs, ys, sizes, brightness = stars.T
+        if (width, height) != tuple(self.base_size):
+            xs = xs * width // self.base_size[0]
+            ys = ys * height // self.base_size[1]
+
+        star_color = np.array(star_color, dtype=np.int64)
+        colors = np.minimum(255, (star_color[None, :] * brightness[:, None] / 255).astype(np.int64))
+
+        # Trazo 2*i: círculo de la estrella i; trazo 2*i+1: su centro blanco
+        stroke_colors = np.empty((2 * len(stars), 3), dtype=np.uint8)
+        stroke_colors[0::2] = colors
+        stroke_colors[1::2] = WHITE
+
+        px, py, strokes = [], [], []
+        for radius, (dx, dy) in self._offsets.items():
+            index = np.nonzero(sizes == radius)[0]
+            if len(index):
+                px.append((xs[index, None] + dx[None, :]).ravel())
+                py.append((ys[index, None] + dy[None, :]).ravel())
+                strokes.append(np.repeat(2 * index, len(dx)))
+        centers = np.nonzero(sizes >= 2)[0]
+        if len(centers):
+            dx, dy = self._offsets[1]
+            px.append((xs[centers, None] + dx[None, :]).ravel())
+            py.append((ys[centers, None] + dy[None, :]).ravel())
+            strokes.append(np.repeat(2 * centers + 1, len(dx)))
+
+        px, py, strokes = np.concatenate(px), np.concatenate(py), np.concatenate(strokes)
+        inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        px, py, strokes = px[inside], py[inside], strokes[inside]
+
+        # Último trazo por píxel (las estrellas solapadas se pisan como antes):
+        # ordenar por (píxel, trazo) y quedarse con el último de cada píxel
+        linear = px * height + py
+        order = np.lexsort((strokes, linear))
+        linear, strokes = linear[order], strokes[order]
+        last = np.append(linear[1:] != linear[:-1], True)
+        pixels[px[order][last], py[order][last]] = stroke_colors[strokes[last]]
+
+    def _draw_fallback(self, surface, level):
+        """Dibujo con pygame.draw cuando no hay NumPy"""
+        bg_start, bg_end, star_color = self.level_configs[level]
+        width, height = surface.get_size()
+        for y in range(height):
+            progress = y / height
+            color = tuple(int(bg_start[i] + (bg_end[i] - bg_start[i]) * progress) for i in range(3))
+            pygame.draw.line(surface, color, (0, y), (width, y))
+        for x, y, size, brightness in self.stars:
+            x = x * width // self.base_size[0]
+            y = y * height // self.base_size[1]
+            color = tuple(min(255, int(star_color[i] * brightness / 255)) for i in range(3))
+            pygame.draw.circle(surface, color, (x, y), size)
+            if size >= 2:
+                pygame.draw.circle(surface, WHITE, (x, y), 1)
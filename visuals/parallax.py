@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+ParallaxStarfield - Capas de estrellas con desplazamiento en paralaje
+
+El fondo de cada nivel es una superficie estática y el único movimiento lo
+daban los `SpaceObject`, desactivados en web por su coste. Aquí cada capa es
+una baldosa del tamaño de la pantalla, pre-renderizada una vez, con sus
+estrellas sobre un colorkey RLE (los tramos transparentes no se recorren al
+copiar). Para desplazarla se copian dos trozos de la baldosa con el corte en
+el offset actual: dos blits por capa, sin importar cuántas estrellas tenga.
+
+Las posiciones de las estrellas son relativas (0-1), así que las baldosas se
+generan a cualquier resolución y por color de nivel, bajo demanda.
+"""
+
+import random
+
+import pygame
+
+from config import WHITE
+
+
+# Color transparente de las baldosas (ninguna estrella llega a ser negra)
+TRANSPARENT = (0, 0, 0)
+
+
+class ParallaxStarfield:
+    """Capas de estrellas que envuelven verticalmente a distinta velocidad"""
+
+    # (estrellas, px por paso de simulación, tamaños posibles, brillo mín-máx)
+    # de la capa más lejana a la más cercana
+    DEFAULT_LAYERS = (
+        (70, 0.15, (1,), (60, 140)),
+        (40, 0.4, (1, 1, 2), (110, 200)),
+        (15, 0.9, (2, 2, 3), (170, 255)),
+    )
+
+    def __init__(self, level_colors, layers=DEFAULT_LAYERS, seed=None):
+        # nivel -> color base de las estrellas
+        self.level_colors = level_colors
+        rng = random.Random(seed)
+        self.layers = []
+        for count, speed, sizes, (low, high) in layers:
+            stars = [(rng.random(), rng.random(), rng.choice(sizes), rng.randint(low, high))
+                     for _ in range(count)]
+            self.layers.append({"stars": stars, "speed": speed, "offset": 0.0})
+        # (nivel, capa, tamaño) -> baldosa pre-renderizada
+        self._tiles = {}
+
+    def update(self, steps=1):
+        """Avanza el desplazamiento de cada capa (un paso de simulación)"""
+        for layer in self.layers:
+            layer["offset"] += layer["speed"] * steps
+
+    def draw(self, surface, level):
+        """Dibuja todas las capas: dos blits por capa"""
+        if level not in self.level_colors:
+            return
+        width, height = surface.get_size()
+        for index, layer in enumerate(self.layers):
+            tile = self._get_tile(level, index, (width, height))
+            split = int(layer["offset"]) % height
+            # Parte superior de la baldosa bajada `split` px y el resto arriba
+            surface.blit(tile, (0, split), (0, 0, width, height - split))
+            if split:
+                surface.blit(tile, (0, 0), (0, height - split, width, split))
+
+    def _get_tile(self, level, index, size):
+        key = (level, index, size)
+        tile = self._tiles.get(key)
+        if tile is None:
+            tile = self._tiles[key] = self._render_tile(level, self.layers[index]["stars"], size)
+        return tile
+
+    def _render_tile(self, level, stars, size):
+        """Baldosa con las estrellas de una capa sobre fondo transparente"""
+        width, height = size
+        star_color = self.level_colors[level]
+        tile = pygame.Surface(size)
+        tile.fill(TRANSPARENT)
+        for fx, fy, radius, brightness in stars:
+            x, y = int(fx * width), int(fy * height)
+            color = (
+                max(1, min(255, int(star_color[0] * brightness / 255))),
+                max(1, min(255, int(star_color[1] * brightness / 255))),
+                max(1, min(255, int(star_color[2] * brightness / 255))),
+            )
+            # Copias desplazadas una altura para que la envoltura no corte estrellas
+            for wrap_y in (y - height, y, y + height):
+                pygame.draw.circle(tile, color, (x, wrap_y), radius)
+                if radius >= 2:
+                    pygame.draw.circle(tile, WHITE, (x, wrap_y), 1)
+        tile.set_colorkey(TRANSPARENT, pygame.RLEACCEL)
+        return tile